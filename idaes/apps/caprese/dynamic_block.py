@@ -17,6 +17,8 @@ by time.
 
 from collections import OrderedDict
 
+import numpy as np
+
 import idaes.logger as idaeslog
 from idaes.apps.caprese.util import initialize_by_element_in_range
 from idaes.apps.caprese.common.config import (
@@ -36,6 +38,8 @@ from idaes.apps.caprese.nmpc_var import (
         InputVar,
         FixedVar,
         MeasuredVar,
+        get_time_data,
+        get_time_major_values,
         )
 from idaes.core.util.model_statistics import degrees_of_freedom
 
@@ -583,19 +587,33 @@ class _DynamicBlockData(_BlockData):
         to their values `t_shift` in the future.
         """
         time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
+        targets, sources = self._get_shifted_time_indices(t_shift, tolerance)
+        variables = list(self.component_objects(ctype))
+        if not targets or not variables:
+            return
+        # Shift the values of all variables at once, as a (time x variable)
+        # array. All values are read before any are set.
+        shifted = get_time_major_values(variables, time)[sources]
+        for j, var in enumerate(variables):
+            data = get_time_data(var, time)
+            for i, val in zip(targets, shifted[:, j].tolist()):
+                data[i].set_value(val)
+
+    def _get_shifted_time_indices(self, t_shift, tolerance=1e-8):
+        """ Get the (zero-based) indices of the time points whose values
+        are set when shifting by `t_shift`, and of the time points their
+        values come from. Points that are shifted to themselves or outside
+        the model's "horizon" are excluded.
+        """
+        time = self.time
+        targets, sources = [], []
+        for i, t in enumerate(time):
+            idx = time.find_nearest_index(t + t_shift, tolerance)
+            if idx is None or idx - 1 == i:
                 continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                var[t].set_value(var[ts].value)
+            targets.append(i)
+            sources.append(idx - 1)
+        return targets, sources
 
     def advance_one_sample(self,
             ctype=(DiffVar, DerivVar, AlgVar, InputVar, FixedVar),
@@ -700,25 +718,26 @@ class _DynamicBlockData(_BlockData):
         """ Set the values of bound multipliers to the corresponding
         values a time `t_shift` in the future.
         """
-        zL = self.ipopt_zL_in
-        zU = self.ipopt_zU_in
         time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
-                continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                if var[t] in zL and var[ts] in zL:
-                    zL[var[t]] = zL[var[ts]]
-                if var[t] in zU and var[ts] in zU:
-                    zU[var[t]] = zU[var[ts]]
+        targets, sources = self._get_shifted_time_indices(t_shift, tolerance)
+        variables = list(self.component_objects(ctype))
+        if not targets or not variables:
+            return
+        time_data = [get_time_data(var, time) for var in variables]
+        for suffix in (self.ipopt_zL_in, self.ipopt_zU_in):
+            # (time x variable) arrays of multipliers, and whether they exist
+            present = np.array(
+                [[data in suffix for data in var_data] for var_data in time_data]
+            ).T
+            values = np.array(
+                [[suffix.get(data, 0.0) for data in var_data]
+                    for var_data in time_data]
+            ).T
+            # A multiplier is shifted if it exists at both time points
+            shift = present[targets] & present[sources]
+            shifted = values[sources]
+            for k, j in zip(*np.nonzero(shift)):
+                suffix[time_data[j][targets[k]]] = shifted[k, j].item()
 
     def advance_ipopt_multipliers_one_sample(self,
             ctype=(
@@ -15,6 +15,8 @@
 by NMPC.
 """
 
+import numpy as np
+
 from pyomo.core.base.var import IndexedVar
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 
@@ -34,6 +36,9 @@ class NmpcVar(IndexedVar):
     >>>     var[:].set_value(var[0])
 
     """
+    # (time set, list of data objects), set by `get_time_data`
+    _time_data = None
+
     def __init__(self, *args, **kwargs):
         if not args:
             raise NotImplementedError(
@@ -48,6 +53,54 @@ class NmpcVar(IndexedVar):
         kwargs.setdefault('ctype', type(self))
         super(NmpcVar, self).__init__(*args, **kwargs)
 
+    def get_time_data(self, time=None):
+        """ List of the data objects at each point in `time` (by default,
+        the index set), in order. The list is cached, as looking up the
+        data objects of a reference one at a time is slow.
+        """
+        if time is None:
+            time = self.index_set()
+        cached = self._time_data
+        if cached is None or cached[0] is not time or len(cached[1]) != len(time):
+            cached = self._time_data = (time, [self[t] for t in time])
+        return cached[1]
+
+    def get_values_array(self, time=None):
+        """ NumPy array of the values at each point in `time` """
+        return np.array([data.value for data in self.get_time_data(time)])
+
+    def set_values_array(self, values, time=None):
+        """ Set the values at each point in `time` from an array """
+        for data, val in zip(self.get_time_data(time), np.asarray(values).tolist()):
+            data.set_value(val)
+
+
+def get_time_data(var, time):
+    """ List of the data objects of a time-indexed variable at each point in
+    `time`. This is the cached list of an `NmpcVar`; the data objects of
+    other variables are looked up.
+    """
+    if isinstance(var, NmpcVar):
+        return var.get_time_data(time)
+    return [var[t] for t in time]
+
+
+def get_time_major_values(variables, time):
+    """ Get the values of time-indexed variables as a 2-D NumPy array,
+    where the entry [i, j] is the value of `variables[j]` at the i-th point
+    in `time`. Values that are None make an array of objects.
+
+    Args:
+        variables: List of time-indexed variables, usually `NmpcVar`
+        time: Time set
+
+    Returns:
+        NumPy array of shape (len(time), len(variables))
+    """
+    values = [[data.value for data in get_time_data(var, time)]
+            for var in variables]
+    return np.array(values).reshape(len(variables), len(time)).T
+
 """
 The following classes serve as custom ctypes for references
 to time-only slices and calls to `component_objects` when
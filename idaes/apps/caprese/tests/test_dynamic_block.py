@@ -928,6 +928,42 @@ class TestDynamicBlock(object):
                 for v in blk.component_objects(ctypes_to_not_shift):
                     assert v[t].value == t
 
+    @pytest.mark.unit
+    def test_advance_ipopt_multipliers(self):
+        blk = self.make_block()
+        blk.add_ipopt_suffixes()
+        time = blk.time
+        t0 = time.first()
+        tl = time.last()
+        zL = blk.ipopt_zL_in
+        zU = blk.ipopt_zU_in
+
+        ctypes = (DiffVar, AlgVar, InputVar)
+        t_missing = time.at(2)
+        for var in blk.component_objects(ctypes):
+            for t in time:
+                if t != t_missing:
+                    zL[var[t]] = t
+                zU[var[t]] = -t
+
+        shift = (tl - t0)/2 # 0.5, one sample
+        blk.advance_ipopt_multipliers(shift)
+        for var in blk.component_objects(ctypes):
+            for t in time:
+                idx = time.find_nearest_index(t + shift, 1e-8)
+                # Points shifted outside the horizon are unchanged
+                ts = t if idx is None else time.at(idx)
+                assert zU[var[t]] == -ts
+                if t == t_missing:
+                    assert var[t] not in zL
+                elif ts == t_missing:
+                    # No multiplier to shift
+                    assert zL[var[t]] == t
+                else:
+                    assert zL[var[t]] == ts
+        for var in blk.component_objects(DerivVar):
+            assert all(var[t] not in zL for t in time)
+
     @pytest.mark.unit
     def test_generate_time_in_sample(self):
         blk = self.make_block()
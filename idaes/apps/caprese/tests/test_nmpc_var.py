@@ -23,7 +23,10 @@ from idaes.apps.caprese.nmpc_var import (
         InputVar,
         FixedVar,
         MeasuredVar,
+        get_time_data,
+        get_time_major_values,
         )
+import numpy as np
 import pytest
 
 
@@ -144,3 +147,33 @@ def test_NmpcVector():
     for var_values, target_val in zip(val_lil, newvals):
         for var_val in var_values:
             assert var_val == target_val
+
+
+@pytest.mark.unit
+def test_values_array():
+    m = pyo.ConcreteModel()
+    m.time = pyo.Set(initialize=[0, 1, 2, 3])
+    m.v1 = NmpcVar(m.time, initialize={t: 2*t for t in m.time})
+    m.v2 = DiffVar(m.time)
+
+    assert m.v1.get_time_data() == [m.v1[t] for t in m.time]
+    assert m.v1.get_time_data(m.time) is m.v1.get_time_data(m.time)
+    assert list(m.v1.get_values_array()) == [0, 2, 4, 6]
+    assert list(m.v2.get_values_array()) == [None]*4
+
+    m.v2.set_values_array(np.array([1., 2., 3., 4.]), time=m.time)
+    assert [m.v2[t].value for t in m.time] == [1., 2., 3., 4.]
+    assert all(type(m.v2[t].value) is float for t in m.time)
+
+    values = get_time_major_values([m.v1, m.v2], m.time)
+    assert values.shape == (4, 2)
+    assert list(values[:, 0]) == [0, 2, 4, 6]
+    assert list(values[3]) == [6, 4.]
+    values = get_time_major_values([], m.time)
+    assert values.shape == (4, 0)
+
+    # Variables that are not NmpcVar are looked up at each point
+    m.v3 = pyo.Var(m.time, initialize={t: -t for t in m.time})
+    assert get_time_data(m.v3, m.time) == [m.v3[t] for t in m.time]
+    values = get_time_major_values([m.v1, m.v3], m.time)
+    assert list(values[:, 1]) == [0, -1, -2, -3]
@@ -29,6 +29,7 @@ from pyomo.core.base.constraint import _ConstraintData
 from pyomo.core.base.block import _BlockData
 
 from idaes.core.util.model_statistics import degrees_of_freedom
+from idaes.core.util.initialization import TimeElementSubproblems
 from idaes.core.util.dyn_utils import (
         get_activity_dict, 
         deactivate_model_at,
@@ -97,12 +98,28 @@ def initialize_by_element_in_range(model, time, t_start, t_end,
     Kwargs:
         solver : Solver option used to solve portions of the square model
         outlvl : idaes.logger output level
+        pipelined : If True, build the subproblem of each finite element once
+                    and solve it instead of the whole model. Variables
+                    linking elements are found from the constraints of each
+                    element, so time_linking_vars is not used.
+        speculative : If True, solve the finite elements in parallel from
+                      the current values of the model, then solve again
+                      those whose initial conditions turn out to be
+                      different. Implies pipelined.
+        mismatch_tol : Tolerance on the relative mismatch of initial
+                       conditions above which an element is solved again
+                       in speculative mode
+        n_workers : Number of processes used in speculative mode
     """
     solver = kwargs.pop('solver', SolverFactory('ipopt'))
     outlvl = kwargs.pop('outlvl', idaeslog.NOTSET)
     init_log = idaeslog.getInitLogger('nmpc', outlvl)
     solver_log = idaeslog.getSolveLogger('nmpc', outlvl)
     solve_initial_conditions = kwargs.pop('solve_initial_conditions', False)
+    speculative = kwargs.pop('speculative', False)
+    pipelined = kwargs.pop('pipelined', False) or speculative
+    mismatch_tol = kwargs.pop('mismatch_tol', 1e-6)
+    n_workers = kwargs.pop('n_workers', None)
 
     #TODO: Move to docstring
     # Variables that will be fixed for time points outside the finite element
@@ -167,6 +184,47 @@ def initialize_by_element_in_range(model, time, t_start, t_end,
                 time.first(),
                 outlvl=idaeslog.ERROR)[time.first()]
 
+    if pipelined:
+        elements = [(time.at((i-1)*ncp+1),
+                     [time.at(k) for k in range((i-1)*ncp+2, i*ncp+2)])
+                    for i in fe_in_range]
+
+        def initial_guess(t_prev, fe):
+            for t in fe:
+                for _slice in dae_vars:
+                    if not _slice[t].fixed:
+                        _slice[t].set_value(_slice[t_prev].value)
+
+        subproblems = TimeElementSubproblems(time, elements, deactivated,
+                was_originally_active,
+                initial_guess=initial_guess,
+                outlvl=outlvl)
+        if speculative:
+            subproblems.solve_speculatively(solver,
+                    mismatch_tol=mismatch_tol,
+                    n_workers=n_workers)
+        else:
+            subproblems.solve_sequentially(solver)
+    else:
+        _solve_elements_in_range(model, time, fe_in_range, ncp,
+                deactivated, was_originally_active, was_originally_fixed,
+                time_linking_vars, dae_vars, max_linking_range,
+                solver, solver_log)
+
+    for t in time:
+        for comp in deactivated[t]:
+            if was_originally_active[id(comp)]:
+                comp.activate()
+
+def _solve_elements_in_range(model, time, fe_in_range, ncp,
+        deactivated, was_originally_active, was_originally_fixed,
+        time_linking_vars, dae_vars, max_linking_range,
+        solver, solver_log):
+    """Solves the whole model once per finite element in fe_in_range,
+    activating each element and fixing its time-linking variables around
+    the solve. This is what initialize_by_element_in_range does when not
+    pipelined.
+    """
     # "Integration" loop
     for i in fe_in_range:
         t_prev = time.at((i-1)*ncp+1)
@@ -260,11 +318,6 @@ def initialize_by_element_in_range(model, time, t_start, t_end,
             if not was_originally_fixed[id(var)]:
                 var.unfix()
 
-    for t in time:
-        for comp in deactivated[t]:
-            if was_originally_active[id(comp)]:
-                comp.activate()
-
 def get_violated_bounds(val, bounds):
     """ This function tests a value against a lower and an upper bound,
     returning which if either is violated, as well as a direction
@@ -10,16 +10,93 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
+import math
 import numpy as np
 from copy import deepcopy
+from itertools import product
 
-from ..util.util import myArrayEq, myPointsEq, ListHasPoint
+from ..util.util import myArrayEq, myPointsEq
 from .parsers.PDB import readPointsAndAtomsFromPDB
 from .parsers.XYZ import readPointsAndAtomsFromXYZ
 from .parsers.CFG import readPointsAndAtomsFromCFG
 from .geometry import RectPrism
 
 
+class PointHash(object):
+    """A spatial hash for finding points within a tolerance.
+
+    Points are stored in buckets, which are the cubes of a regular grid.
+    A point is compared with the points of its own bucket, and with those of
+    the adjacent buckets only if it is within the tolerance of their
+    boundary. Finding a point is therefore O(1), as long as the grid is
+    finer than the distance between most points.
+    """
+
+    DBL_TOL = 1e-5
+    CELL_SIZE = 1e-2
+
+    # === STANDARD CONSTRUCTOR
+    def __init__(self, atol=DBL_TOL, CellSize=CELL_SIZE):
+        assert CellSize > 4 * atol
+        self._atol = atol
+        self._CellSize = CellSize
+        self._Buckets = {}
+        self._Count = 0
+
+    # === MANIPULATION METHODS
+    def add(self, P, i):
+        """Add a point.
+
+        Args:
+            P(numpy.ndarray): Point to add.
+            i(int): Index returned when finding P.
+
+        Returns:
+            None.
+
+        """
+        key = tuple(math.floor(x / self._CellSize) for x in P[:3])
+        self._Buckets.setdefault(key, []).append((P, i))
+        self._Count += 1
+
+    # === PROPERTY EVALUATION METHODS
+    def __len__(self):
+        """Get the number of points added."""
+        return self._Count
+
+    def find(self, P):
+        """Identify a point within the tolerance of P.
+
+        Args:
+            P(numpy.ndarray): Point to find.
+
+        Returns:
+            tuple<numpy.ndarray, int>) The stored point and its index, with
+            the smallest index if there are several, or None if there are
+            no such points.
+
+        """
+        h = self._CellSize
+        # NOTE: Twice the tolerance, to be safe from rounding at boundaries
+        margin = 2 * self._atol
+        Ranges = []
+        for x in P[:3]:
+            k = math.floor(x / h)
+            lo = k - 1 if x - k * h < margin else k
+            hi = k + 1 if (k + 1) * h - x < margin else k
+            Ranges.append(range(lo, hi + 1))
+        result = None
+        for key in product(*Ranges):
+            for Q, i in self._Buckets.get(key, ()):
+                if myArrayEq(P, Q, self._atol) and (result is None or i < result[1]):
+                    result = (Q, i)
+        return result
+
+    def __contains__(self, P):
+        """Identify if point is within the tolerance of a stored point."""
+        return self.find(P) is not None
+
+
 class Canvas(object):
     """A class for combining geometric points and neighbors.
 
@@ -44,6 +121,8 @@ class Canvas(object):
         self._Points = Points
         self._NeighborhoodIndexes = NeighborhoodIndexes
         self.__DefaultNN = DefaultNN
+        self._PointHash = None
+        self._NHashedPoints = 0
         assert self.isConsistentWithDesign()
 
     # === CONSTRUCTOR - From PDB File
@@ -472,6 +551,8 @@ class Canvas(object):
         """
         for P in self._Points:
             TransF.transform(P)
+        # NOTE: Points were moved, so they must be hashed again
+        self._PointHash = None
 
     def getTransformed(self, TransF):
         """Copy and transform this Canvas.
@@ -527,12 +608,7 @@ class Canvas(object):
             bool) True if Points has P.
 
         """
-        for Q in self.Points:
-            # NOTE: There are several ways to test point membership.
-            #       This is optimized for speed.
-            if myArrayEq(P, Q, Canvas.DBL_TOL):
-                return True
-        return False
+        return P in self._getPointHash()
 
     def getPointIndex(self, P):
         """Identify the index of a point in the Canvas.
@@ -544,12 +620,19 @@ class Canvas(object):
             int) Index of P in Points.
 
         """
-        for i, Q in enumerate(self.Points):
-            # NOTE: There are several ways to test point membership.
-            #       This is optimized for speed.
-            if myArrayEq(P, Q, Canvas.DBL_TOL):
-                return i
-        return None
+        Found = self._getPointHash().find(P)
+        return None if Found is None else Found[1]
+
+    def _getPointHash(self):
+        """Get the spatial hash of Points, updated with any new Points."""
+        if self._PointHash is None or self._NHashedPoints > len(self._Points):
+            self._PointHash = PointHash(Canvas.DBL_TOL)
+            self._NHashedPoints = 0
+        for i in range(self._NHashedPoints, len(self._Points)):
+            if self._Points[i] is not None:
+                self._PointHash.add(self._Points[i], i)
+        self._NHashedPoints = len(self._Points)
+        return self._PointHash
 
     def getNeighbors(self, P):
         """Identify set of neighbors to a point in Canvas.
@@ -591,12 +674,12 @@ class Canvas(object):
 
         """
         result = []
+        ResultHash = PointHash(Canvas.DBL_TOL)
         for i, P in enumerate(self.Points):
             Neighs = NeighborsFunc(P)
             for Neigh in Neighs:
-                if not self.hasPoint(Neigh) and not ListHasPoint(
-                    result, Neigh, Canvas.DBL_TOL
-                ):
+                if not self.hasPoint(Neigh) and Neigh not in ResultHash:
+                    ResultHash.add(Neigh, len(result))
                     result.append(Neigh)
         return result
 
@@ -11,7 +11,7 @@
 # license information.
 #################################################################################
 from copy import deepcopy
-from ..util.util import myPointEq
+from .canvas import PointHash
 
 
 def areMotifViaTransF(D1, D2, TransF, blnPreserveIndexing=False, blnIgnoreVoid=True):
@@ -77,35 +77,76 @@ def getEnumConfs(
     if MotifToConfMap is not None:
         # del MotifToConfMap[:]
         MotifToConfMap.clear()
+    TransFs = list(TransFs)
+    # NOTE: Configurations are compared by signature, the set of
+    #       (point, content) pairs where each point is identified by the
+    #       first point seen within DBL_TOL of it. A configuration is
+    #       equivalent to another (see Design.isEquivalentTo) if its
+    #       signature is the same or a subset.
+    PointIDs = PointHash(DBL_TOL, max(PointHash.CELL_SIZE, 10 * DBL_TOL))
+    PointIDsOfCanvas = {}
+    Signatures = set()
+    SignaturesBySize = {}
+
+    def getPointID(P):
+        Found = PointIDs.find(P)
+        if Found is not None:
+            return Found[1]
+        PointIDs.add(P, len(PointIDs))
+        return len(PointIDs) - 1
+
+    def getPointIDs(C, iTransF=None):
+        # NOTE: Motifs usually share a Canvas, so the points of each Canvas
+        #       are only transformed and identified once
+        key = (id(C), iTransF)
+        if key not in PointIDsOfCanvas:
+            if iTransF is None:
+                Points = C.Points
+            else:
+                Points = [TransFs[iTransF].getTransform(P) for P in C.Points]
+            PointIDsOfCanvas[key] = [getPointID(P) for P in Points]
+        return PointIDsOfCanvas[key]
+
+    def addSignature(Sig):
+        Signatures.add(Sig)
+        SignaturesBySize.setdefault(len(Sig), []).append(Sig)
+
+    def isKnown(Sig):
+        if Sig in Signatures:
+            return True
+        return any(
+            Sig < Other
+            for Size, Others in SignaturesBySize.items()
+            if Size > len(Sig)
+            for Other in Others
+        )
+
     result = []
     for iMotif, Motif in enumerate(Motifs):
         if MotifToConfMap is not None:
             MotifToConfMap.append([len(result)])
         result.append(Motif)
-        for TransF in TransFs:
-            Conf = Motif.getTransformed(TransF)
-            blnUniqueConf = True
-            for r in result:
-                if Conf.isEquivalentTo(r):
-                    blnUniqueConf = False
-                    break
-            if blnUniqueConf:
+        IDs = getPointIDs(Motif.Canvas)
+        addSignature(frozenset(zip(IDs, Motif.Contents)))
+        for iTransF, TransF in enumerate(TransFs):
+            ConfIDs = getPointIDs(Motif.Canvas, iTransF)
+            if not isKnown(frozenset(zip(ConfIDs, Motif.Contents))):
                 if MotifToConfMap is not None:
                     MotifToConfMap[iMotif].append(len(result))
                 # NOTE: This section is important if we want to just assume
                 #       that each index is the same location.
                 #       This is important for use in models.
                 if blnPreserveMotifLocs:
-                    ConfCopy = Conf
+                    ConfIndexOfID = {}
+                    for l2, i in enumerate(ConfIDs):
+                        ConfIndexOfID.setdefault(i, l2)
                     Conf = deepcopy(Motif)  # So they have the same points<->indexes
-                    for l in range(len(Motif)):
-                        for l2 in range(len(ConfCopy)):
-                            if myPointEq(
-                                Motif.Canvas.Points[l],
-                                ConfCopy.Canvas.Points[l2],
-                                DBL_TOL,
-                            ):
-                                Conf.setContent(l, ConfCopy.Contents[l2])
-                                break
+                    for l, i in enumerate(IDs):
+                        if i in ConfIndexOfID:
+                            Conf.setContent(l, Motif.Contents[ConfIndexOfID[i]])
+                    addSignature(frozenset(zip(IDs, Conf.Contents)))
+                else:
+                    Conf = Motif.getTransformed(TransF)
+                    addSignature(frozenset(zip(ConfIDs, Conf.Contents)))
                 result.append(Conf)
     return result
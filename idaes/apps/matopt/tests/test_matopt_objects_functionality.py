@@ -19,6 +19,7 @@ from idaes.apps.matopt.materials import (
     LinearTiling,
     PlanarTiling,
     CubicTiling,
+    getEnumConfs,
 )
 from idaes.apps.matopt.materials.geometry import (
     Shape,
@@ -139,3 +140,63 @@ def test_functionality_WurtziteLattice():
     assert areEqual(lattice.getUniqueLayerCount("0001"), 2, 1e-4)
     assert areEqual(lattice.getUniqueLayerCount("1100"), 2, 1e-4)
     assert areEqual(lattice.getUniqueLayerCount("1120"), 1, 1e-4)
+
+
+@pytest.mark.unit
+def test_functionality_Canvas():
+    lattice = test_construct_FCCLattice()
+    canvas = Canvas()
+    canvas.addLocation(np.zeros(3, dtype=float))
+    canvas.addShells(2, lattice.getNeighbors)
+    for i, P in enumerate(canvas.Points):
+        assert canvas.getPointIndex(P) == i
+        # Points within the tolerance, including across bucket boundaries
+        assert canvas.getPointIndex(P + 0.5 * Canvas.DBL_TOL) == i
+        assert canvas.getPointIndex(P - 0.5 * Canvas.DBL_TOL) == i
+        assert not canvas.hasPoint(P + 2 * Canvas.DBL_TOL)
+    assert canvas.NeighborhoodIndexes[0] == [
+        canvas.getPointIndex(P) for P in lattice.getNeighbors(np.zeros(3))
+    ]
+    canvas.transform(ShiftFunc(np.array([0.1, 0.0, 0.0])))
+    assert not canvas.hasPoint(np.zeros(3, dtype=float))
+    assert canvas.getPointIndex(np.array([0.1, 0.0, 0.0])) == 0
+
+
+@pytest.mark.unit
+def test_functionality_getEnumConfs():
+    lattice = test_construct_FCCLattice()
+    canvas = Canvas()
+    canvas.addLocation(np.zeros(3, dtype=float))
+    canvas.addShell(lattice.getNeighbors)
+    motifs = [
+        Design(canvas, [Atom("Cu") if i in (0, l) else Atom("Ag") for i in range(13)])
+        for l in (1, 2)
+    ]
+    transFs = [
+        RotateFunc.fromXYZAngles(0, 0, np.pi * 0.5),
+        ReflectFunc.acrossX(),
+        RotateFunc.fromXYZAngles(np.pi, 0, 0),
+    ]
+    for blnPreserveMotifLocs in (True, False):
+        confMap = []
+        confs = getEnumConfs(
+            motifs, transFs, confMap, blnPreserveMotifLocs=blnPreserveMotifLocs
+        )
+        # Compare with pairwise comparison of configurations
+        expected = []
+        expectedMap = []
+        for motif in motifs:
+            expectedMap.append([len(expected)])
+            expected.append(motif)
+            for transF in transFs:
+                conf = motif.getTransformed(transF)
+                if not any(conf.isEquivalentTo(other) for other in expected):
+                    expectedMap[-1].append(len(expected))
+                    expected.append(conf)
+        assert len(expected) > len(motifs)
+        assert confMap == expectedMap
+        assert len(confs) == len(expected)
+        for conf, other in zip(confs, expected):
+            assert conf.isEquivalentTo(other) and other.isEquivalentTo(conf)
+            if blnPreserveMotifLocs:
+                assert conf.Canvas == motifs[0].Canvas
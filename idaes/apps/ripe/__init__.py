@@ -55,6 +55,7 @@ from .main import ripemodel, ripewrite, print_results  # noqa: F401
 from .shared import rspace, sharedata, debug  # noqa: F401
 from .atermconstruct import (
     makeaterm,
+    evalmech,
     formatinputs,
     checkargs,
     normalizefeatures,
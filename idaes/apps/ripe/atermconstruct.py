@@ -45,31 +45,31 @@ def makeaterm(data, stoich, rxn_mechs, kwargs, ncons, mechlist, fixarray, shared
     nh = len(stoich)
     aterm = np.zeros([ndata, ns, nm, nh])
 
+    # Process data passed to mechanisms, one row per observation
+    if "T" in kwargs.keys():
+        inv = np.hstack((fdata, [[pc["T"][i1][0]] for i1 in range(ndata)]))
+    else:
+        inv = fdata
+
     # This section of code loops thorugh the aterm array
     # Callling s_mech in order to determine numerical values
+    # for all observations and species at once
     # mechanisms can be specified with variable stoichiometry
-    for i1 in range(ndata):
-        # index i1 over observations
-        for i2 in range(ns):
-            # index i2 over species
-            i3 = 0
-            # index i3 over mechanisms
-            for tempi in range(len(rxn_mechs)):
-                mechline = rxn_mechs[tempi]
-                for mspec in mechline[1]:
-                    for h_ind in list(mechline[0]):
-                        # final index over stoichiometries
-                        if mspec == "massact" or mechline[2]:
-                            s_mech = mechs.mechperstoich(mspec, stoich[h_ind])
-                        else:
-                            s_mech = mspec
-                        if "T" in kwargs.keys():
-                            inv = np.hstack((fdata[i1, :], pc["T"][i1][0]))
-                        else:
-                            inv = fdata[i1, :]
-                        atemp = stoich[h_ind][i2] * s_mech(*inv)
-                        aterm[i1, i2, i3, h_ind] = atemp
-                    i3 += 1
+    i3 = 0
+    # index i3 over mechanisms
+    for tempi in range(len(rxn_mechs)):
+        mechline = rxn_mechs[tempi]
+        for mspec in mechline[1]:
+            for h_ind in list(mechline[0]):
+                # final index over stoichiometries
+                if mspec == "massact" or mechline[2]:
+                    s_mech = mechs.mechperstoich(mspec, stoich[h_ind])
+                else:
+                    s_mech = mspec
+                aterm[:, :, i3, h_ind] = np.outer(
+                    evalmech(s_mech, inv), np.asarray(stoich[h_ind][:ns], dtype=float)
+                )
+            i3 += 1
 
     # Scale data if specified
     if sharedata["ascale"]:
@@ -80,6 +80,33 @@ def makeaterm(data, stoich, rxn_mechs, kwargs, ncons, mechlist, fixarray, shared
     return [aterm, fdata, pc, data, scales]
 
 
+def evalmech(s_mech, inv):
+    # This subroutine evaluates a mechanism for all observations
+    # Inputs:
+    # s_mech   - mechanism
+    # inv      - process data, one row per observation
+    # Outputs:
+    # vals     - values of the mechanism for each observation
+
+    # Mechanisms are called with arrays of observations, which works for
+    # mechanisms in mechs and any others written with numpy operations
+    # Otherwise, or if the result is not finite, they are called for each
+    # observation as they would be in pyomo models
+    ndata = np.shape(inv)[0]
+    try:
+        with np.errstate(all="ignore"):
+            vals = np.asarray(s_mech(*np.transpose(inv)), dtype=float)
+        if (
+            np.shape(vals) == (ndata,)
+            and np.all(np.isfinite(vals))
+            and np.isclose(vals[0], s_mech(*inv[0, :]), rtol=1e-10)
+        ):
+            return vals
+    except Exception:
+        pass
+    return np.array([s_mech(*inv[i1, :]) for i1 in range(ndata)], dtype=float)
+
+
 def formatinputs(data, kwargs):
     # This subroutine formats inputs supplied to ripemodel()
     # Inputs:
@@ -11,6 +11,7 @@
 # license information.
 #################################################################################
 
+import numpy as np
 import pyomo.environ as pyo
 
 _all__ = [
@@ -45,6 +46,16 @@ _all__ = [
 # data = [x,T,flow,vol,t] where x is length ns
 # data is not a list of list but a continuous list
 # Additional options can be specified for user-specified mechanisms
+# Each element of data may also be an array of observations, in which case
+# mechanisms return an array of rates (see makeaterm())
+
+
+def _log(x):
+    # Mechanisms are evaluated on Pyomo components in models and
+    # on arrays of observations when constructing the activity matrix
+    if isinstance(x, np.ndarray):
+        return np.log(x)
+    return pyo.log(x)
 
 
 def powerlawp5(*data):
@@ -69,22 +80,22 @@ def powerlaw4(*data):
 
 def avrami2(*data):
     pd = data[0]
-    return 2.0 * (1.0 - pd) * (-1 * pyo.log(1 - pd)) ** (2.0 - (1.0 / 2.0))
+    return 2.0 * (1.0 - pd) * (-1 * _log(1 - pd)) ** (2.0 - (1.0 / 2.0))
 
 
 def avrami3(*data):
     pd = data[0]
-    return 3.0 * (1.0 - pd) * (-1 * pyo.log(1 - pd)) ** (3.0 - (1.0 / 3.0))
+    return 3.0 * (1.0 - pd) * (-1 * _log(1 - pd)) ** (3.0 - (1.0 / 3.0))
 
 
 def avrami4(*data):
     pd = data[0]
-    return 4.0 * (1.0 - pd) * (-1 * pyo.log(1 - pd)) ** (4.0 - (1.0 / 4.0))
+    return 4.0 * (1.0 - pd) * (-1 * _log(1 - pd)) ** (4.0 - (1.0 / 4.0))
 
 
 def avrami5(*data):
     pd = data[0]
-    return 5.0 * (1.0 - pd) * (-1 * pyo.log(1 - pd)) ** (5.0 - (1.0 / 5.0))
+    return 5.0 * (1.0 - pd) * (-1 * _log(1 - pd)) ** (5.0 - (1.0 / 5.0))
 
 
 def randomnuc(*data):
@@ -113,7 +124,7 @@ def antijander(*data):
 
 def valensi(*data):
     pd = data[0]
-    return 1.0 / (-1.0 * pyo.log(1.0 - pd))
+    return 1.0 / (-1.0 * _log(1.0 - pd))
 
 
 def parabolic(*data):
@@ -147,33 +158,29 @@ def grain(*data):
 # EMS requires these models do not take the mechanism as an argument
 
 
-def massactm(data, def_stoich):
-    import numpy as np
-
-    ns = len(def_stoich)
+def _massact(data, stoich):
+    # Product of reactant concentrations to the power of their stoichiometry
+    # For arrays of observations, the product is taken for each observation
     pwr = []
     x = []
-    for i in range(ns):
-        if def_stoich[i] < 0:
-            pwr.append(abs(def_stoich[i]))
+    for i in range(len(stoich)):
+        if stoich[i] < 0:
+            pwr.append(abs(stoich[i]))
             x.append(data[i])
-    return np.product(np.power(x, pwr))
+    x = np.asarray(x)
+    pwr = np.reshape(pwr, (-1,) + (1,) * (x.ndim - 1))
+    return np.prod(np.power(x, pwr), axis=0)
 
 
-def mechperstoich(mech, stoich):
-    import numpy as np
+def massactm(data, def_stoich):
+    return _massact(data, def_stoich)
 
-    ns = len(stoich)
+
+def mechperstoich(mech, stoich):
     # out_mechs = []
 
     def massact(*data):
-        pwr = []
-        x = []
-        for i in range(ns):
-            if stoich[i] < 0:
-                pwr.append(abs(stoich[i]))
-                x.append(data[i])
-        return np.product(np.power(x, pwr))
+        return _massact(data, stoich)
 
     def usr_f(*data):
         #        stoich = stoich
@@ -20,3 +20,34 @@ import pytest
 @pytest.mark.unit
 def test_ripe_import():
     from idaes.apps.ripe import ripemodel
+
+
+@pytest.mark.unit
+def test_makeaterm_mechanisms():
+    import math
+    import numpy as np
+    from idaes.apps.ripe import evalmech, makeaterm, mechs
+
+    rng = np.random.RandomState(0)
+    data = rng.uniform(0.05, 0.95, (20, 2))
+    stoich = [[-1, 1], [-2, 1]]
+
+    def usr(*data):
+        # Only works for scalars
+        return math.exp(-data[0])
+
+    for mech in [mechs.avrami2, mechs.valensi, mechs.jander, usr]:
+        vals = evalmech(mech, data)
+        assert vals == pytest.approx([mech(*row) for row in data], rel=1e-12)
+
+    rxn_mechs = [[range(2), ["massact", mechs.avrami2, usr], False]]
+    aterm = makeaterm(
+        data, stoich, rxn_mechs, {}, 6, [None] * 3, None, {"ascale": False}
+    )[0]
+    assert aterm.shape == (20, 2, 3, 2)
+    for i1 in range(20):
+        for h in range(2):
+            massact = mechs.mechperstoich("massact", stoich[h])
+            for i3, mech in enumerate([massact, mechs.avrami2, usr]):
+                expected = np.multiply(stoich[h], mech(*data[i1, :]))
+                assert aterm[i1, :, i3, h] == pytest.approx(expected, rel=1e-12)
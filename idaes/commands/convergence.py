@@ -78,8 +78,16 @@ def convergence_sample(
     help="Addtional module that registers ConvergenceEvaluation classes")
 @click.option('--single-sample', default=None, type=str,
     help="Run only a single sample with given name")
+@click.option('-n', '--workers', default=None, type=int, required=False,
+    help="Run samples on a process pool with this many workers (0 for one per CPU)")
+@click.option('--results-file', default=None, type=str, required=False,
+    help="JSON lines file to stream sample results to, used to resume a run")
+@click.option('--warm-start', is_flag=True, default=False,
+    help="Run samples in nearest-neighbour order, warm-started from converged"
+    " solutions")
 def convergence_eval(
-    sample_file, dmf, report_file, json_file, convergence_module, single_sample):
+    sample_file, dmf, report_file, json_file, convergence_module, single_sample,
+    workers, results_file, warm_start):
     import idaes.models.convergence
     import idaes.models_extra.convergence
     if convergence_module is not None:
@@ -92,7 +100,10 @@ def convergence_eval(
             return -1
     if single_sample is None:
         (inputs, samples, results) = cnv.run_convergence_evaluation_from_sample_file(
-            sample_file=sample_file
+            sample_file=sample_file,
+            n_workers=workers,
+            results_file=results_file,
+            warm_start=warm_start,
         )
         if results is not None:
             cnv.save_convergence_statistics(
@@ -10,7 +10,10 @@
 # Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
 # license information.
 #################################################################################
-from .model_serializer import to_json, from_json, StoreSpec
+from .model_serializer import (
+    to_json, from_json, to_npz, from_npz, StoreSpec, StateLoader,
+    NpzStateLoader
+)
 from .misc import svg_tag, copy_port_values, TagReference
 from .tags import ModelTag, ModelTagGroup
 
@@ -54,18 +54,34 @@ ConvergenceEvaluationSpecification), to run a convergence evaluation
 (run_convergence_evaluation), and print the results in table form
 (print_convergence_statistics).
 
+By default, samples are distributed over MPI processes if mpi4py is available,
+and run serially otherwise. Alternatively, run_convergence_evaluation can use a
+process pool (n_workers argument), where each worker builds and initializes the
+model once and restores the initialized state (using model_serializer) before
+each sample. With this backend, results can also be streamed to a JSON lines
+file as samples finish (results_file argument), and samples already recorded
+in that file are skipped when the evaluation is restarted. The warm_start
+option orders the samples along a nearest-neighbour path through the sampled
+input space and starts each solve from the closest previously converged
+solution.
+
 However, this package can also be executed using the command-line interface.
 See the documentation in convergence.py for more information.
 """
 # stdlib
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import getpass
 import importlib as il
 import json
 import logging
+import multiprocessing
 import numpy as np
+import os
 import sys
 from io import StringIO
+from queue import Empty
+from scipy.spatial import cKDTree
 
 # pyomo
 from pyomo.common.tempfiles import TempfileManager
@@ -76,6 +92,7 @@ from pyomo.common.log import LoggingIntercept
 
 # idaes
 import idaes.core.util.convergence.mpi_utils as mpiu
+from idaes.core.util.model_serializer import to_json, StateLoader
 from idaes.dmf import resource
 import idaes.logger as idaeslog
 
@@ -410,7 +427,9 @@ def write_sample_file(
         json.dump(jsondict, fd, indent=3)
 
 
-def run_convergence_evaluation_from_sample_file(sample_file):
+def run_convergence_evaluation_from_sample_file(
+    sample_file, n_workers=None, results_file=None, warm_start=False
+):
     # load the sample file
     try:
         with open(sample_file, "r") as fd:
@@ -430,7 +449,13 @@ def run_convergence_evaluation_from_sample_file(sample_file):
             f"Invalid value specified for convergence_evaluation_class_str:"
             "{convergence_evaluation_class_str} in sample file: {sample_file}"
         )
-    return run_convergence_evaluation(jsondict, conv_eval)
+    return run_convergence_evaluation(
+        jsondict,
+        conv_eval,
+        n_workers=n_workers,
+        results_file=results_file,
+        warm_start=warm_start,
+    )
 
 
 def run_single_sample_from_sample_file(sample_file, name):
@@ -465,7 +490,14 @@ def run_single_sample(sample_file_dict, conv_eval, name):
     return _run_ipopt_with_stats(model, solver)
 
 
-def run_convergence_evaluation(sample_file_dict, conv_eval):
+def run_convergence_evaluation(
+    sample_file_dict,
+    conv_eval,
+    n_workers=None,
+    results_file=None,
+    warm_start=False,
+    warm_start_cache_size=10,
+):
     """
     Run convergence evaluation and generate the statistics based on information
     in the sample_file.
@@ -479,6 +511,32 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
     conv_eval : ConvergenceEvaluation
         The ConvergenceEvaluation object that should be used
 
+    n_workers : int or None
+        If None (and results_file is None), distribute samples with mpi4py if
+        available or run them serially. Otherwise, run the samples on a
+        process pool with n_workers processes (os.cpu_count() if 0). Each
+        worker builds and initializes the model once. With n_workers=1 the
+        samples are run in the current process.
+
+    results_file : str or None
+        Path of a JSON lines file to which the results of each sample are
+        appended as soon as they finish. Samples already recorded in this file
+        are not run again, so an interrupted evaluation can be restarted.
+        Implies the process pool backend.
+
+    warm_start : bool
+        If True, run the samples in nearest-neighbour order through the
+        sampled input space (inputs are scaled by their bounds), and start
+        each solve from the closest converged solution kept by the worker, if
+        it is closer to the sample than the center of the input space (the
+        mean, or midpoint of the bounds). With several workers, the ordered
+        samples are split into contiguous segments. Implies the process pool
+        backend.
+
+    warm_start_cache_size : int
+        Maximum number of converged solutions each worker keeps for warm
+        starts.
+
     Returns
     -------
        N/A
@@ -496,6 +554,17 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
         samples_list.append(v)
     n_samples = len(samples_list)
 
+    if n_workers is not None or results_file is not None or warm_start:
+        global_results = _run_samples_in_pool(
+            inputs,
+            samples_list,
+            conv_eval,
+            n_workers,
+            results_file,
+            warm_start_cache_size if warm_start else None,
+        )
+        return inputs, samples, global_results
+
     task_mgr = mpiu.ParallelTaskManager(n_samples)
     local_samples_list = task_mgr.global_to_local_data(samples_list)
 
@@ -509,31 +578,308 @@ def run_convergence_evaluation(sample_file_dict, conv_eval):
                 "Root Process: {}".format(sample_name),
             )
 
-        # capture the output
-        # ToDo: make this an option and turn off for single sample execution
         output_buffer = StringIO()
         with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
-            with capture_output():  # as str_out:
+            with capture_output():
                 model = conv_eval.get_initialized_model()
-                _set_model_parameters_from_sample(model, inputs, ss)
                 solver = conv_eval.get_solver()
-                (status_obj, solved, iters, time) = _run_ipopt_with_stats(model, solver)
-
-        if not solved:
-            _log.error(f"Sample: {sample_name} failed to converge.")
-
-        results_dict = OrderedDict()
-        results_dict["name"] = sample_name
-        results_dict["sample_point"] = ss
-        results_dict["solved"] = solved
-        results_dict["iters"] = iters
-        results_dict["time"] = time
-        results.append(results_dict)
+        results.append(_run_sample(model, solver, inputs, ss))
 
     global_results = task_mgr.gather_global_data(results)
     return inputs, samples, global_results
 
 
+def _run_sample(model, solver, inputs, ss):
+    """
+    Set the sampled inputs on an initialized model, solve it and return the
+    results dictionary for the sample.
+    """
+    sample_name = ss["_name"]
+    # capture the output
+    # ToDo: make this an option and turn off for single sample execution
+    output_buffer = StringIO()
+    with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
+        with capture_output():  # as str_out:
+            _set_model_parameters_from_sample(model, inputs, ss)
+            (status_obj, solved, iters, time) = _run_ipopt_with_stats(model, solver)
+
+    if not solved:
+        _log.error(f"Sample: {sample_name} failed to converge.")
+
+    results_dict = OrderedDict()
+    results_dict["name"] = sample_name
+    results_dict["sample_point"] = ss
+    results_dict["solved"] = solved
+    results_dict["iters"] = iters
+    results_dict["time"] = time
+    return results_dict
+
+
+# State of a process pool worker (or of the current process if samples are
+# run in process), set by _pool_worker_init
+_worker_state = {}
+
+
+def _pool_worker_init(
+    conv_eval, inputs, warm_start_cache_size=None, result_queue=None
+):
+    """
+    Build and initialize the model once for a worker, and store the
+    initialized state so it can be restored before each sample. Results of
+    chains of samples are put on result_queue as each sample finishes.
+    """
+    output_buffer = StringIO()
+    with LoggingIntercept(output_buffer, "idaes", logging.ERROR):
+        with capture_output():
+            model = conv_eval.get_initialized_model()
+    _worker_state["model"] = model
+    _worker_state["solver"] = conv_eval.get_solver()
+    _worker_state["inputs"] = inputs
+    _worker_state["initial_state"] = to_json(model, return_dict=True)
+    _worker_state["loader"] = StateLoader(model)
+    if warm_start_cache_size is not None:
+        _worker_state["warm_start_cache"] = _WarmStartCache(warm_start_cache_size)
+    else:
+        _worker_state["warm_start_cache"] = None
+    _worker_state["result_queue"] = result_queue
+
+
+def _pool_run_sample(ss):
+    """
+    Restore the initialized model state of this worker and run one sample.
+    If warm starts are enabled, load the closest converged solution first.
+    """
+    model = _worker_state["model"]
+    inputs = _worker_state["inputs"]
+    cache = _worker_state["warm_start_cache"]
+    loader = _worker_state["loader"]
+    loader.load(sd=_worker_state["initial_state"])
+    if cache is not None:
+        x = _sample_vector(inputs, ss)
+        state = cache.nearest(x, np.linalg.norm(x - _center_vector(inputs)))
+        if state is not None:
+            loader.load(sd=state)
+    results_dict = _run_sample(model, _worker_state["solver"], inputs, ss)
+    if cache is not None and results_dict["solved"]:
+        cache.add(x, to_json(model, return_dict=True))
+    return results_dict
+
+
+def _pool_run_chain(chain):
+    """
+    Run a list of samples in order on this worker, putting the result of
+    each sample on the result queue as soon as it finishes.
+    """
+    for ss in chain:
+        _worker_state["result_queue"].put(_pool_run_sample(ss))
+
+
+class _WarmStartCache(object):
+    """
+    Bounded store of converged model states, keyed by the scaled sample
+    vector they were solved at. When full, the oldest state is dropped.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._points = []
+        self._states = []
+
+    def add(self, x, state):
+        self._points.append(x)
+        self._states.append(state)
+        if len(self._states) > self.maxsize:
+            del self._points[0]
+            del self._states[0]
+
+    def nearest(self, x, max_dist=np.inf):
+        """
+        Return the state closest to x, or None if no state is closer than
+        max_dist.
+        """
+        if len(self._states) == 0:
+            return None
+        d = np.linalg.norm(np.array(self._points) - x, axis=1)
+        i = int(np.argmin(d))
+        if d[i] >= max_dist:
+            return None
+        return self._states[i]
+
+
+def _input_scale(inputs):
+    lower = np.array([float(v["lower"]) for v in inputs.values()])
+    upper = np.array([float(v["upper"]) for v in inputs.values()])
+    scale = upper - lower
+    scale[scale == 0] = 1.0
+    return lower, scale
+
+
+def _sample_vector(inputs, ss):
+    """
+    Sample point as a vector of inputs scaled by their bounds.
+    """
+    lower, scale = _input_scale(inputs)
+    return (np.array([float(ss[k]) for k in inputs]) - lower) / scale
+
+
+def _center_vector(inputs):
+    """
+    Center of the sampled input space (mean, or the midpoint of the bounds if
+    no mean is given) scaled by the input bounds.
+    """
+    center = {
+        k: v["mean"] if v["mean"] is not None else (v["lower"] + v["upper"]) / 2
+        for k, v in inputs.items()
+    }
+    return _sample_vector(inputs, center)
+
+
+def _nearest_neighbour_order(inputs, samples_list):
+    """
+    Order samples along a greedy nearest-neighbour path through the scaled
+    input space, starting from the sample closest to the center.
+    """
+    n = len(samples_list)
+    if n == 0:
+        return []
+    x = np.array([_sample_vector(inputs, ss) for ss in samples_list])
+    visited = np.zeros(n, dtype=bool)
+    # k-d tree of the samples, rebuilt from the unvisited ones when more than
+    # half of those in it have been visited
+    tree_idx = np.arange(n)
+    tree = cKDTree(x)
+    order = []
+    current = _center_vector(inputs)
+    for n_left in range(n, 0, -1):
+        if n_left < len(tree_idx) // 2:
+            tree_idx = np.flatnonzero(~visited)
+            tree = cKDTree(x[tree_idx])
+        k = 4
+        while True:
+            k = min(k, len(tree_idx))
+            d, j = tree.query(current, k=k)
+            d = np.atleast_1d(d)
+            j = tree_idx[np.atleast_1d(j)]
+            unvisited = ~visited[j]
+            # Stop once the nearest unvisited sample and all samples as close
+            # as it have been found, ties go to the first sample
+            if unvisited.any() and (k == len(tree_idx) or d[-1] > d[unvisited][0]):
+                break
+            k *= 2
+        i = int(j[unvisited][d[unvisited] == d[unvisited][0]].min())
+        order.append(i)
+        visited[i] = True
+        current = x[i]
+    return [samples_list[i] for i in order]
+
+
+def _read_results_file(results_file):
+    """
+    Read the results recorded in a JSON lines results file. A partially
+    written last line (e.g. from a crash) is ignored.
+    """
+    results = OrderedDict()
+    if results_file is None or not os.path.exists(results_file):
+        return results
+    with open(results_file, "r") as f:
+        for line in f:
+            try:
+                r = json.loads(line, object_pairs_hook=OrderedDict)
+            except json.JSONDecodeError:
+                _log.warning(f"Ignoring incomplete result in {results_file}")
+                continue
+            results[r["name"]] = r
+    return results
+
+
+def _run_samples_in_pool(
+    inputs,
+    samples_list,
+    conv_eval,
+    n_workers,
+    results_file,
+    warm_start_cache_size=None,
+):
+    """
+    Run samples on a process pool (or in process if n_workers is 1), streaming
+    results to results_file as they finish. If warm_start_cache_size is not
+    None, samples are run in nearest-neighbour order with warm starts.
+    """
+    if not n_workers:
+        n_workers = os.cpu_count()
+    done = _read_results_file(results_file)
+    todo = [ss for ss in samples_list if ss["_name"] not in done]
+    if len(done) > 0:
+        _log.info(
+            f"Skipping {len(samples_list) - len(todo)} samples already in "
+            f"{results_file}"
+        )
+    warm_start = warm_start_cache_size is not None
+    if warm_start:
+        todo = _nearest_neighbour_order(inputs, todo)
+
+    fp = None
+    if results_file is not None:
+        fp = open(results_file, "a")
+    result_queue = None
+    if warm_start and len(todo) > 0 and n_workers != 1:
+        result_queue = multiprocessing.Queue()
+
+    def _record(r):
+        done[r["name"]] = r
+        if fp is not None:
+            fp.write(json.dumps(r) + "\n")
+            fp.flush()
+        _progress_bar(
+            float(len(done)) / float(len(samples_list)),
+            "Completed: {}".format(r["name"]),
+        )
+
+    try:
+        if len(todo) > 0 and n_workers == 1:
+            _pool_worker_init(conv_eval, inputs, warm_start_cache_size)
+            for ss in todo:
+                _record(_pool_run_sample(ss))
+        elif len(todo) > 0:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_pool_worker_init,
+                initargs=(conv_eval, inputs, warm_start_cache_size, result_queue),
+            ) as executor:
+                if warm_start:
+                    # Split the path into contiguous segments, one chain of
+                    # warm starts each. Chains only fix the order samples are
+                    # run in, results are recorded as each sample finishes.
+                    n_chains = min(len(todo), 4 * n_workers)
+                    bounds = np.linspace(0, len(todo), n_chains + 1).astype(int)
+                    futures = [
+                        executor.submit(_pool_run_chain, todo[a:b])
+                        for a, b in zip(bounds[:-1], bounds[1:])
+                    ]
+                    n_recorded = 0
+                    while n_recorded < len(todo):
+                        try:
+                            r = result_queue.get(timeout=1)
+                        except Empty:
+                            # Raise the error of any chain that failed
+                            for f in futures:
+                                if f.done():
+                                    f.result()
+                            continue
+                        _record(r)
+                        n_recorded += 1
+                else:
+                    futures = [executor.submit(_pool_run_sample, ss) for ss in todo]
+                    for f in as_completed(futures):
+                        _record(f.result())
+    finally:
+        _worker_state.clear()
+        if fp is not None:
+            fp.close()
+
+    return [done[ss["_name"]] for ss in samples_list]
+
+
 def save_convergence_statistics(
     inputs, results, dmf=None, display=True, json_path=None, report_path=None
 ):
@@ -18,6 +18,7 @@ Author: Carl Laird
 import io
 import json
 import pytest
+import numpy as np
 import os
 import os.path
 import pyomo.environ as pe
@@ -261,6 +262,163 @@ def test_convergence_evaluation_fixedvar_mutableparam():
     #     os.remove(results_fname)
 
 
+@pytest.mark.skipif(not ipopt_available, reason="Ipopt solver not available")
+@pytest.mark.component
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_convergence_evaluation_pool(n_workers):
+    ceval_class = cb._class_import(ceval_fixedvar_mutableparam_str)
+    ceval = ceval_class()
+
+    spec = ceval.get_specification()
+    fname = os.path.join(wrtdir, f"ceval_pool_{n_workers}.3.43.json")
+    results_fname = os.path.join(wrtdir, f"ceval_pool_{n_workers}.3.43.jsonl")
+    cb.write_sample_file(
+        spec, fname, ceval_fixedvar_mutableparam_str, n_points=3, seed=43
+    )
+    if os.path.exists(results_fname):
+        os.remove(results_fname)
+
+    inputs, samples, global_results = cb.run_convergence_evaluation_from_sample_file(
+        fname, n_workers=n_workers, results_file=results_fname
+    )
+
+    # results are returned in sample order, whatever order they finished in
+    assert [r["name"] for r in global_results] == [
+        "Sample-1",
+        "Sample-2",
+        "Sample-3",
+    ]
+    for r, iters in zip(global_results, [14, 15, 12]):
+        assert r["solved"]
+        assert r["iters"] == pytest.approx(iters, abs=2)
+
+    # each result was streamed to the results file
+    with open(results_fname) as f:
+        streamed = [json.loads(line) for line in f]
+    assert sorted(r["name"] for r in streamed) == ["Sample-1", "Sample-2", "Sample-3"]
+
+    os.remove(fname)
+    os.remove(results_fname)
+
+
+@pytest.mark.unit
+def test_convergence_evaluation_resume(caplog):
+    ceval_class = cb._class_import(ceval_fixedvar_mutableparam_str)
+    ceval = ceval_class()
+
+    spec = ceval.get_specification()
+    fname = os.path.join(wrtdir, "ceval_resume.3.43.json")
+    results_fname = os.path.join(wrtdir, "ceval_resume.3.43.jsonl")
+    cb.write_sample_file(
+        spec, fname, ceval_fixedvar_mutableparam_str, n_points=3, seed=43
+    )
+
+    # Write results for all samples, with a partially written last line as if
+    # a previous run crashed while writing it
+    with open(fname) as f:
+        samples = json.load(f)["samples"]
+    with open(results_fname, "w") as f:
+        for i, (k, v) in enumerate(reversed(list(samples.items()))):
+            v["_name"] = k
+            r = {"name": k, "sample_point": v, "solved": True, "iters": i, "time": 0}
+            f.write(json.dumps(r) + "\n")
+        f.write('{"name": "Sample-4", "sample_po')
+
+    # No samples need to be run, so this works without a solver
+    inputs, samples, global_results = cb.run_convergence_evaluation_from_sample_file(
+        fname, results_file=results_fname
+    )
+    assert [r["name"] for r in global_results] == [
+        "Sample-1",
+        "Sample-2",
+        "Sample-3",
+    ]
+    assert [r["iters"] for r in global_results] == [2, 1, 0]
+    assert "Ignoring incomplete result" in caplog.text
+
+    os.remove(fname)
+    os.remove(results_fname)
+
+
+@pytest.mark.unit
+def test_nearest_neighbour_order():
+    inputs = {
+        "a": {"lower": 0.0, "upper": 10.0, "mean": None},
+        "b": {"lower": 0.0, "upper": 1.0, "mean": 0.0},
+    }
+    samples = [
+        {"_name": "S1", "a": 10.0, "b": 1.0},
+        {"_name": "S2", "a": 0.0, "b": 0.0},
+        {"_name": "S3", "a": 5.0, "b": 0.5},
+        {"_name": "S4", "a": 5.0, "b": 0.1},
+    ]
+    # center is a = 5, b = 0 (scaled [0.5, 0])
+    ordered = cb._nearest_neighbour_order(inputs, samples)
+    assert [ss["_name"] for ss in ordered] == ["S4", "S3", "S1", "S2"]
+    assert cb._nearest_neighbour_order(inputs, []) == []
+
+    # Same path as a brute force search
+    rng = np.random.default_rng(0)
+    samples = [
+        {"_name": f"S{i}", "a": a, "b": b}
+        for i, (a, b) in enumerate(rng.random((200, 2)) * [10.0, 1.0])
+    ]
+    x = np.array([[ss["a"] / 10.0, ss["b"]] for ss in samples])
+    current = np.array([0.5, 0.0])
+    remaining = list(range(len(samples)))
+    expected = []
+    while remaining:
+        i = min(remaining, key=lambda i: np.linalg.norm(x[i] - current))
+        remaining.remove(i)
+        expected.append(samples[i]["_name"])
+        current = x[i]
+    ordered = cb._nearest_neighbour_order(inputs, samples)
+    assert [ss["_name"] for ss in ordered] == expected
+
+
+@pytest.mark.unit
+def test_warm_start_cache():
+    cache = cb._WarmStartCache(2)
+    assert cache.nearest([0.0]) is None
+    cache.add([0.0], "s0")
+    cache.add([1.0], "s1")
+    assert cache.nearest([0.2]) == "s0"
+    assert cache.nearest([0.2], max_dist=0.1) is None
+    # Oldest state is dropped when full
+    cache.add([2.0], "s2")
+    assert cache.nearest([0.2]) == "s1"
+
+
+@pytest.mark.skipif(not ipopt_available, reason="Ipopt solver not available")
+@pytest.mark.component
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_convergence_evaluation_warm_start(n_workers):
+    ceval_class = cb._class_import(ceval_fixedvar_mutableparam_str)
+    ceval = ceval_class()
+
+    spec = ceval.get_specification()
+    fname = os.path.join(wrtdir, f"ceval_warm_{n_workers}.4.43.json")
+    results_fname = os.path.join(wrtdir, f"ceval_warm_{n_workers}.4.43.jsonl")
+    cb.write_sample_file(
+        spec, fname, ceval_fixedvar_mutableparam_str, n_points=4, seed=43
+    )
+    if os.path.exists(results_fname):
+        os.remove(results_fname)
+    inputs, samples, global_results = cb.run_convergence_evaluation_from_sample_file(
+        fname, n_workers=n_workers, results_file=results_fname, warm_start=True
+    )
+    assert [r["name"] for r in global_results] == list(samples.keys())
+    assert all(r["solved"] for r in global_results)
+
+    # each result was streamed to the results file
+    with open(results_fname) as f:
+        streamed = [json.loads(line) for line in f]
+    assert sorted(r["name"] for r in streamed) == sorted(samples.keys())
+
+    os.remove(fname)
+    os.remove(results_fname)
+
+
 if __name__ == "__main__":
     # test_convergence_evaluation_specification_file_fixedvar_mutableparam()
     # test_convergence_evaluation_specification_file_unfixedvar_mutableparam()
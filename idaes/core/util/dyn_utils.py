@@ -22,7 +22,7 @@ from pyomo.dae.set_utils import (
     is_in_block_indexed_by,
     get_index_set_except,
 )
-from pyomo.common.collections import ComponentSet
+from pyomo.common.collections import ComponentSet, ComponentMap
 
 import idaes.logger as idaeslog
 
@@ -462,6 +462,29 @@ def find_comp_in_block(tgt_block, src_block, src_comp, allow_miss=False):
     return tgt_comp
 
 
+def _time_location(comp, time, time_locs=None):
+    """Location of the time index in the indices of an indexed component,
+    or None if the component is not explicitly indexed by time. Locations
+    are looked up in, and added to, `time_locs` (a ComponentMap) if given.
+    """
+    if time_locs is not None and comp in time_locs:
+        return time_locs[comp]
+    loc = None
+    if is_explicitly_indexed_by(comp, time):
+        loc = get_location_of_coordinate_set(comp.index_set(), time)
+    if time_locs is not None:
+        time_locs[comp] = loc
+    return loc
+
+
+def _replace_time_index(index, time_loc, t0):
+    if type(index) is not tuple:
+        index = (index,)
+    index = list(index)
+    index[time_loc] = t0
+    return tuple(index)
+
+
 def find_comp_in_block_at_time(
     tgt_block, src_block, src_comp, time, t0, allow_miss=False
 ):
@@ -484,6 +507,14 @@ def find_comp_in_block_at_time(
                      searching for non-existant components in the target model
 
     """
+    return _find_comp_in_block_at_time(
+        tgt_block, src_block, src_comp, time, t0, allow_miss=allow_miss
+    )
+
+
+def _find_comp_in_block_at_time(
+    tgt_block, src_block, src_comp, time, t0, allow_miss=False, time_locs=None
+):
     # Could extend this to allow replacing indices of multiple sets
     # (useful for PDEs)
 
@@ -515,19 +546,10 @@ def find_comp_in_block_at_time(
 
         index = r[1]
 
-        # Can abstract the following into a function:
-        # replace_time_index or something
-        if is_explicitly_indexed_by(local_parent, time):
-            index_set = local_parent.index_set()
-            time_loc = get_location_of_coordinate_set(index_set, time)
-
-            if type(index) is not tuple:
-                index = (index,)
-            index = list(index)
-
+        time_loc = _time_location(local_parent, time, time_locs)
+        if time_loc is not None:
             # Replace time index with t0
-            index[time_loc] = t0
-            index = tuple(index)
+            index = _replace_time_index(index, time_loc, t0)
 
         try:
             local_parent = local_parent[index]
@@ -560,17 +582,10 @@ def find_comp_in_block_at_time(
         # If comp has index, attempt to access it in tgt_comp
         index = src_comp.index()
 
-        if is_explicitly_indexed_by(tgt_comp, time):
-            index_set = tgt_comp.index_set()
-            time_loc = get_location_of_coordinate_set(index_set, time)
-
-            if type(index) is not tuple:
-                index = (index,)
-            index = list(index)
-
+        time_loc = _time_location(tgt_comp, time, time_locs)
+        if time_loc is not None:
             # Replace time index with t0
-            index[time_loc] = t0
-            index = tuple(index)
+            index = _replace_time_index(index, time_loc, t0)
 
         try:
             tgt_comp = tgt_comp[index]
@@ -586,6 +601,356 @@ def find_comp_in_block_at_time(
     return tgt_comp
 
 
+class TimeSliceCopier(object):
+    """
+    Copies variable values between time points of (possibly) different
+    flowsheets, as done by :func:`copy_values_at_time` and
+    :func:`copy_non_time_indexed_values`.
+
+    Finding the source variable for each target variable, by name, is much
+    more expensive than copying its value. A copier finds the pairs of
+    variables the first time values are copied between two time points, and
+    later copies between the same time points only go through the list of
+    pairs. This makes repeated copies, e.g. in moving-horizon loops, much
+    faster.
+
+    The pairs are not updated if components are added to or removed from
+    either flowsheet; use a new copier if the flowsheets change.
+
+    Example::
+
+        copier = TimeSliceCopier(m.fs, m.fs)
+        for t in m.fs.time:
+            copier.copy(t, m.fs.time.first(), copy_fixed=False)
+    """
+
+    def __init__(self, fs_tgt, fs_src, outlvl=idaeslog.NOTSET):
+        """
+        Args:
+            fs_tgt : Target flowsheet, whose variables' values will get set
+            fs_src : Source flowsheet, whose variables' values will be used to
+                     set those of the target flowsheet. Could be the target
+                     flowsheet
+            outlvl : IDAES logger output level
+        """
+        self.fs_tgt = fs_tgt
+        self.fs_src = fs_src
+        self.time = fs_tgt.time
+        self.outlvl = outlvl
+        # Time-indexed components and their sources, found on first use
+        self._time_indexed = None
+        # Variable pairs, by (target time, source time)
+        self._slices = {}
+        # Variable pairs for variables not indexed by time
+        self._non_time_indexed = None
+        # Location of time index for indexed components, and found components,
+        # for find_comp_at_time
+        self._time_locs = ComponentMap()
+        self._found = ComponentMap()
+
+    def copy(self, t_target, t_source, copy_fixed=True, cache=True):
+        """
+        Set the values of all (explicitly or implicitly) time-indexed
+        variables in the target flowsheet at `t_target` to the values of the
+        variables with the same names in the source flowsheet at `t_source`.
+
+        Args:
+            t_target : Target time point
+            t_source : Source time point
+            copy_fixed : Bool of whether or not to copy over fixed variables in
+                         target model
+            cache : Bool of whether or not to keep the pairs of variables
+                    found for these time points. Use False for copies that
+                    will not be repeated, so the pairs do not use memory.
+
+        Returns:
+            None
+        """
+        key = (t_target, t_source)
+        pairs = self._slices.get(key, None)
+        if pairs is None:
+            pairs = self._time_slice_pairs(t_target, t_source)
+            if cache:
+                self._slices[key] = pairs
+        self._set_values(*pairs, copy_fixed)
+
+    def copy_non_time_indexed(self, copy_fixed=True):
+        """
+        Set the values of all variables that are not (implicitly or
+        explicitly) indexed by time in the target flowsheet to their
+        values in the source flowsheet.
+
+        Args:
+            copy_fixed : Bool marking whether or not to copy over fixed
+                         variables in the target flowsheet.
+
+        Returns:
+            None
+        """
+        if self._non_time_indexed is None:
+            self._non_time_indexed = self._non_time_indexed_pairs()
+        self._set_values(*self._non_time_indexed, copy_fixed)
+
+    def find_comp_at_time(self, src_comp, t0, allow_miss=False):
+        """
+        Find the component of the target flowsheet with the same local names
+        and indices as a component of the source flowsheet, except for
+        the time index, which is replaced by `t0`.
+        See :func:`find_comp_in_block_at_time`.
+
+        Args:
+            src_comp : Component of the source flowsheet
+            t0 : Time point for the target component
+            allow_miss : If True, return None instead of raising an error
+                         if the component is not found
+
+        Returns:
+            Component of the target flowsheet
+        """
+        found = self._found.get(src_comp, None)
+        if found is None:
+            found = self._found[src_comp] = {}
+        elif t0 in found:
+            return found[t0]
+        tgt_comp = _find_comp_in_block_at_time(
+            self.fs_tgt,
+            self.fs_src,
+            src_comp,
+            self.time,
+            t0,
+            allow_miss=allow_miss,
+            time_locs=self._time_locs,
+        )
+        if tgt_comp is not None:
+            found[t0] = tgt_comp
+        return tgt_comp
+
+    @staticmethod
+    def _set_values(targets, sources, missing, copy_fixed):
+        # Source variables that could not be found are only an error
+        # if their value would be copied
+        for var, err in missing:
+            if copy_fixed or not var.fixed:
+                raise err
+        # Values are copied in order, rather than all read first, since a
+        # target variable may also be a source (within the same flowsheet)
+        if copy_fixed:
+            for var, src in zip(targets, sources):
+                var.set_value(src.value)
+        else:
+            for var, src in zip(targets, sources):
+                if not var.fixed:
+                    var.set_value(src.value)
+
+    def _warn(self, msg):
+        init_log = idaeslog.getInitLogger(__name__, self.outlvl)
+        init_log.warning(msg)
+
+    def _find_time_indexed(self):
+        """Find the time-indexed variables and blocks of the target flowsheet,
+        and the components with the same names in the source flowsheet.
+        """
+        fs_tgt, fs_src, time_target = self.fs_tgt, self.fs_src, self.time
+        variables, blocks = [], []
+        for ctype, found in ((Var, variables), (Block, blocks)):
+            visited = set()
+            for comp_target in fs_tgt.component_objects(ctype):
+                if id(comp_target) in visited:
+                    continue
+                visited.add(id(comp_target))
+
+                if not is_explicitly_indexed_by(comp_target, time_target):
+                    continue
+                n = comp_target.index_set().dimen
+
+                name = comp_target.getname(fully_qualified=True, relative_to=fs_tgt)
+                # Calling find_component here makes the assumption that name
+                # does not contain decimal indices.
+                comp_source = fs_src.find_component(name)
+                if comp_source is None:
+                    self._warn(
+                        "Warning copying values: "
+                        + name
+                        + " does not exist in source block "
+                        + fs_src.name
+                    )
+                    continue
+
+                if n == 1:
+                    found.append((comp_target, comp_source, None))
+                elif n is not None and n >= 2:
+                    index_info = get_index_set_except(comp_target, time_target)
+                    found.append(
+                        (
+                            comp_target,
+                            comp_source,
+                            (
+                                list(index_info["set_except"]),
+                                index_info["index_getter"],
+                            ),
+                        )
+                    )
+        return variables, blocks
+
+    def _time_slice_pairs(self, t_target, t_source):
+        """Find the target and source variables for a pair of time points.
+
+        Returns:
+            Lists of target variables, source variables, and (target variable,
+            exception) for target variables whose source was not found.
+        """
+        if self._time_indexed is None:
+            self._time_indexed = self._find_time_indexed()
+        variables, blocks = self._time_indexed
+        targets, sources, missing = [], [], []
+
+        def indices(non_time):
+            if non_time is None:
+                return [(t_target, t_source)]
+            non_time_index_set, index_getter = non_time
+            return [
+                (index_getter(i, t_target), index_getter(i, t_source))
+                for i in non_time_index_set
+            ]
+
+        def add_pair(var_target, source_of, *args):
+            try:
+                var_source = source_of(*args)
+            except (AttributeError, KeyError) as err:
+                missing.append((var_target, err))
+                return
+            targets.append(var_target)
+            sources.append(var_source)
+
+        for var_target, var_source, non_time in variables:
+            for target_index, source_index in indices(non_time):
+                add_pair(var_target[target_index], var_source.__getitem__, source_index)
+
+        for blk_target, blk_source, non_time in blocks:
+            for target_index, source_index in indices(non_time):
+                blk_data_target = blk_target[target_index]
+                blk_data_source = blk_source[source_index]
+                var_visited = set()
+                for var_target in blk_data_target.component_data_objects(Var):
+                    if id(var_target) in var_visited:
+                        continue
+                    var_visited.add(id(var_target))
+                    add_pair(
+                        var_target,
+                        self._find_var,
+                        var_target,
+                        blk_data_target,
+                        blk_data_source,
+                    )
+
+        return targets, sources, missing
+
+    @staticmethod
+    def _find_var(var_target, blk_target, blk_source):
+        # Here, find_component will not work from BlockData object
+        local_parent = blk_source
+        for r in path_from_block(var_target, blk_target):
+            local_parent = getattr(local_parent, r[0])[r[1]]
+        return getattr(local_parent, var_target.parent_component().local_name)[
+            var_target.index()
+        ]
+
+    def _non_time_indexed_pairs(self):
+        """Find the target and source variables that are not indexed by time.
+
+        Returns:
+            Same as :meth:`_time_slice_pairs`
+        """
+        fs_tgt, fs_src, time_tgt = self.fs_tgt, self.fs_src, self.time
+        targets, sources, missing = [], [], []
+
+        def add_pairs(var_tgt, var_src):
+            for index in var_tgt:
+                try:
+                    var_source = var_src[index]
+                except KeyError as err:
+                    missing.append((var_tgt[index], err))
+                    continue
+                targets.append(var_tgt[index])
+                sources.append(var_source)
+
+        var_visited = set()
+        for var_tgt in fs_tgt.component_objects(Var, descend_into=False):
+            if id(var_tgt) in var_visited:
+                continue
+            var_visited.add(id(var_tgt))
+
+            if is_explicitly_indexed_by(var_tgt, time_tgt):
+                continue
+            var_src = fs_src.find_component(var_tgt.local_name)
+            # ^ this find_component is fine because var_tgt is a Var not VarData
+            # and its local_name is used. Assumes that there are no other decimal
+            # indices in between fs_src and var_src
+
+            if var_src is None:
+                self._warn(
+                    "Warning copying values: "
+                    + var_tgt.local_name
+                    + " does not exist in source block "
+                    + fs_src.name
+                )
+                continue
+            add_pairs(var_tgt, var_src)
+
+        blk_visited = set()
+        for blk_tgt in fs_tgt.component_objects(Block):
+
+            if id(blk_tgt) in blk_visited:
+                continue
+            blk_visited.add(id(blk_tgt))
+
+            if is_in_block_indexed_by(blk_tgt, time_tgt) or is_explicitly_indexed_by(
+                blk_tgt, time_tgt
+            ):
+                continue
+            # block is not even implicitly indexed by time
+            for b_index in blk_tgt:
+
+                var_visited = set()
+                for var_tgt in blk_tgt[b_index].component_objects(
+                    Var, descend_into=False
+                ):
+                    if id(var_tgt) in var_visited:
+                        continue
+                    var_visited.add(id(var_tgt))
+
+                    if is_explicitly_indexed_by(var_tgt, time_tgt):
+                        continue
+
+                    # can't used find_component(local_name) here because I might
+                    # have decimal indices
+                    try:
+                        local_parent = fs_src
+                        for r in path_from_block(var_tgt, fs_tgt):
+                            local_parent = getattr(local_parent, r[0])[r[1]]
+                    except AttributeError:
+                        self._warn(
+                            "Warning copying values: "
+                            + r[0]
+                            + " does not exist in source"
+                            + local_parent.name
+                        )
+                        continue
+                    except KeyError:
+                        self._warn(
+                            "Warning copying values: "
+                            + str(r[1])
+                            + " is not a valid index for"
+                            + getattr(local_parent, r[0]).name
+                        )
+                        continue
+
+                    var_src = getattr(local_parent, var_tgt.local_name)
+                    add_pairs(var_tgt, var_src)
+
+        return targets, sources, missing
+
+
 def copy_non_time_indexed_values(
     fs_tgt,
     fs_src,
@@ -595,6 +960,7 @@ def copy_non_time_indexed_values(
     """
     Function to set the values of all variables that are not (implicitly
     or explicitly) indexed by time to their values in a different flowsheet.
+    To copy values repeatedly, use a :class:`TimeSliceCopier`.
 
     Args:
         fs_tgt : Flowsheet into which values will be copied.
@@ -606,95 +972,9 @@ def copy_non_time_indexed_values(
     Returns:
         None
     """
-    time_tgt = fs_tgt.time
-
-    var_visited = set()
-    for var_tgt in fs_tgt.component_objects(Var, descend_into=False):
-        if id(var_tgt) in var_visited:
-            continue
-        var_visited.add(id(var_tgt))
-
-        if is_explicitly_indexed_by(var_tgt, time_tgt):
-            continue
-        var_src = fs_src.find_component(var_tgt.local_name)
-        # ^ this find_component is fine because var_tgt is a Var not VarData
-        # and its local_name is used. Assumes that there are no other decimal
-        # indices in between fs_src and var_src
-
-        if var_src is None:
-            # Log a warning
-            msg = (
-                "Warning copying values: "
-                + var_src.name
-                + " does not exist in source block "
-                + fs_src.name
-            )
-            init_log = idaeslog.getInitLogger(__name__, outlvl)
-            init_log.warning(msg)
-            continue
-
-        for index in var_tgt:
-            if not copy_fixed and var_tgt[index].fixed:
-                continue
-            var_tgt[index].set_value(var_src.value)
-
-    blk_visited = set()
-    for blk_tgt in fs_tgt.component_objects(Block):
-
-        if id(blk_tgt) in blk_visited:
-            continue
-        blk_visited.add(id(blk_tgt))
-
-        if is_in_block_indexed_by(blk_tgt, time_tgt) or is_explicitly_indexed_by(
-            blk_tgt, time_tgt
-        ):
-            continue
-        # block is not even implicitly indexed by time
-        for b_index in blk_tgt:
-
-            var_visited = set()
-            for var_tgt in blk_tgt[b_index].component_objects(Var, descend_into=False):
-                if id(var_tgt) in var_visited:
-                    continue
-                var_visited.add(id(var_tgt))
-
-                if is_explicitly_indexed_by(var_tgt, time_tgt):
-                    continue
-
-                # can't used find_component(local_name) here because I might
-                # have decimal indices
-                try:
-                    local_parent = fs_src
-                    for r in path_from_block(var_tgt, fs_tgt):
-                        local_parent = getattr(local_parent, r[0])[r[1]]
-                except AttributeError:
-                    # log warning
-                    msg = (
-                        "Warning copying values: "
-                        + r[0]
-                        + " does not exist in source"
-                        + local_parent.name
-                    )
-                    init_log = idaeslog.getInitLogger(__name__, outlvl)
-                    init_log.warning(msg)
-                    continue
-                except KeyError:
-                    msg = (
-                        "Warning copying values: "
-                        + str(r[1])
-                        + " is not a valid index for"
-                        + getattr(local_parent, r[0]).name
-                    )
-                    init_log = idaeslog.getInitLogger(__name__, outlvl)
-                    init_log.warning(msg)
-                    continue
-
-                var_src = getattr(local_parent, var_tgt.local_name)
-
-                for index in var_tgt:
-                    if not copy_fixed and var_tgt[index].fixed:
-                        continue
-                    var_tgt[index].set_value(var_src[index].value)
+    TimeSliceCopier(fs_tgt, fs_src, outlvl=outlvl).copy_non_time_indexed(
+        copy_fixed=copy_fixed
+    )
 
 
 def copy_values_at_time(
@@ -704,6 +984,7 @@ def copy_values_at_time(
     Function to set the values of all (explicitly or implicitly) time-indexed
     variables in a flowsheet to similar values (with the same name) but at
     different points in time and (potentially) in different flowsheets.
+    To copy values repeatedly, use a :class:`TimeSliceCopier`.
 
     Args:
         fs_tgt : Target flowsheet, whose variables' values will get set
@@ -719,117 +1000,6 @@ def copy_values_at_time(
     Returns:
         None
     """
-    time_target = fs_tgt.time
-    var_visited = set()
-    for var_target in fs_tgt.component_objects(Var):
-        if id(var_target) in var_visited:
-            continue
-        var_visited.add(id(var_target))
-
-        if not is_explicitly_indexed_by(var_target, time_target):
-            continue
-        n = var_target.index_set().dimen
-
-        local_parent = fs_src
-
-        varname = var_target.getname(fully_qualified=True, relative_to=fs_tgt)
-        # Calling find_component here makes the assumption that varname does not
-        # contain decimal indices.
-        var_source = fs_src.find_component(varname)
-        if var_source is None:
-            # Log a warning
-            msg = (
-                "Warning copying values: "
-                + varname
-                + " does not exist in source block "
-                + fs_src.name
-            )
-            init_log = idaeslog.getInitLogger(__name__, outlvl)
-            init_log.warning(msg)
-            continue
-
-        if n == 1:
-            if not copy_fixed and var_target[t_target].fixed:
-                continue
-            var_target[t_target].set_value(var_source[t_source].value)
-        elif n >= 2:
-            index_info = get_index_set_except(var_target, time_target)
-            non_time_index_set = index_info["set_except"]
-            index_getter = index_info["index_getter"]
-            for non_time_index in non_time_index_set:
-                source_index = index_getter(non_time_index, t_source)
-                target_index = index_getter(non_time_index, t_target)
-                if not copy_fixed and var_target[target_index].fixed:
-                    continue
-                var_target[target_index].set_value(var_source[source_index].value)
-
-    blk_visited = set()
-    for blk_target in fs_tgt.component_objects(Block):
-        if id(blk_target) in blk_visited:
-            continue
-        blk_visited.add(id(blk_target))
-
-        if not is_explicitly_indexed_by(blk_target, time_target):
-            continue
-        n = blk_target.index_set().dimen
-
-        blkname = blk_target.getname(fully_qualified=True, relative_to=fs_tgt)
-        blk_source = fs_src.find_component(blkname)
-        if blk_source is None:
-            # log warning
-            msg = (
-                "Warning copying values: "
-                + blkname
-                + " does not exist in source"
-                + fs_src.name
-            )
-            init_log = idaeslog.getInitLogger(__name__, outlvl)
-            init_log.warning(msg)
-            continue
-
-        if n == 1:
-            target_index = t_target
-            source_index = t_source
-
-            var_visited = set()
-            for var_target in blk_target[target_index].component_data_objects(Var):
-                if id(var_target) in var_visited:
-                    continue
-                var_visited.add(id(var_target))
-
-                if not copy_fixed and var_target.fixed:
-                    continue
-
-                # Here, find_component will not work from BlockData object
-                local_parent = blk_source[source_index]
-                for r in path_from_block(var_target, blk_target[target_index]):
-                    local_parent = getattr(local_parent, r[0])[r[1]]
-                var_source = getattr(
-                    local_parent, var_target.parent_component().local_name
-                )[var_target.index()]
-                var_target.set_value(var_source.value)
-
-        elif n >= 2:
-            index_info = get_index_set_except(blk_target, time_target)
-            non_time_index_set = index_info["set_except"]
-            index_getter = index_info["index_getter"]
-            for non_time_index in non_time_index_set:
-                source_index = index_getter(non_time_index, t_source)
-                target_index = index_getter(non_time_index, t_target)
-
-                var_visited = set()
-                for var_target in blk_target[target_index].component_data_objects(Var):
-                    if id(var_target) in var_visited:
-                        continue
-                    var_visited.add(id(var_target))
-
-                    if not copy_fixed and var_target.fixed:
-                        continue
-
-                    local_parent = blk_source[source_index]
-                    for r in path_from_block(var_target, blk_target[target_index]):
-                        local_parent = getattr(local_parent, r[0])[r[1]]
-                    var_source = getattr(
-                        local_parent, var_target.parent_component().local_name
-                    )[var_target.index()]
-                    var_target.set_value(var_source.value)
+    TimeSliceCopier(fs_tgt, fs_src, outlvl=outlvl).copy(
+        t_target, t_source, copy_fixed=copy_fixed
+    )
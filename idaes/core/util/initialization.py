@@ -14,6 +14,9 @@
 """
 This module contains utility functions for initialization of IDAES models.
 """
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
 
 from pyomo.environ import (
     Block,
@@ -26,6 +29,8 @@ from pyomo.environ import (
 from pyomo.network import Arc
 from pyomo.dae import ContinuousSet
 from pyomo.core.expr.visitor import identify_variables
+from pyomo.core.base.block import _BlockData
+from pyomo.util.subsystems import create_subsystem_block
 
 from idaes.core import FlowsheetBlock
 from idaes.core.util.exceptions import ConfigurationError
@@ -36,8 +41,8 @@ from idaes.core.util.dyn_utils import (
     deactivate_constraints_unindexed_by,
     fix_vars_unindexed_by,
     get_derivatives_at,
-    copy_values_at_time,
     get_implicit_index_of_set,
+    TimeSliceCopier,
 )
 import idaes.logger as idaeslog
 from idaes.core.solvers import get_solver
@@ -289,6 +294,303 @@ def solve_indexed_blocks(solver, blocks, **kwds):
     return results
 
 
+# Subproblems and solver used by the worker processes of
+# TimeElementSubproblems.solve_speculatively. Workers are forked, so they
+# inherit these (and the model) without pickling.
+_speculative_state = None
+
+
+def _solve_element_speculatively(k):
+    subproblems, solver, check_dof, predictions = _speculative_state
+    if not subproblems._solve_predicted(k, solver, check_dof, predictions[k]):
+        return None
+    return [var.value for var in subproblems.blocks[k].vars.values()]
+
+
+class TimeElementSubproblems(object):
+    """
+    Subproblems for solving a time-discretized model one finite element at a
+    time.
+
+    The subproblem of a finite element is a block referencing the originally
+    active constraints at the non-initial time points of the element and the
+    variables in them. Subproblems are built once and may be solved
+    repeatedly, so the model does not need to be activated and deactivated
+    around each element, and only the element itself is sent to the solver.
+    Variables at or before the initial time point of an element link it to
+    earlier elements. These "boundary" variables are fixed while the element
+    is solved. Variables not indexed by time are boundary variables of every
+    element in which they appear, as they cannot be determined by any one
+    element.
+
+    Building the subproblems activates the components of the model at the
+    non-initial points of the elements; the caller is responsible for
+    restoring the activity of the model afterwards.
+    """
+
+    def __init__(
+        self,
+        time,
+        elements,
+        deactivated,
+        was_originally_active,
+        initial_guess=None,
+        outlvl=idaeslog.NOTSET,
+    ):
+        """
+        Args:
+            time : Set along which the model is discretized
+            elements : List of (t_prev, fe) tuples, where t_prev is the
+                initial time point of a finite element and fe the list of its
+                non-initial time points, in order of time
+            deactivated : Dict mapping time points to the components
+                deactivated at them, as returned by deactivate_model_at
+            was_originally_active : Dict mapping ids of components to whether
+                they were active, as returned by get_activity_dict
+            initial_guess : Function called as initial_guess(t_prev, fe) to
+                set the values of a finite element from its initial time
+                point before the element is first solved. If None, the
+                current values are used.
+            outlvl : IDAES logger outlvl
+
+        Returns:
+            None
+        """
+        self.time = time
+        self.elements = list(elements)
+        self.initial_guess = initial_guess
+        self.init_log = idaeslog.getInitLogger(__name__, level=outlvl)
+        self.solver_log = idaeslog.getSolveLogger(__name__, level=outlvl)
+        self.blocks = []
+        self.boundaries = []
+        for t_prev, fe in self.elements:
+            con_list = []
+            for t in fe:
+                for comp in deactivated[t]:
+                    if not was_originally_active[id(comp)]:
+                        continue
+                    comp.activate()
+                    if isinstance(comp, _BlockData):
+                        con_list.extend(
+                            comp.component_data_objects(Constraint, active=True)
+                        )
+                    else:
+                        con_list.append(comp)
+            unknowns = []
+            boundary = []
+            seen = set()
+            for con in con_list:
+                for var in identify_variables(con.expr, include_fixed=False):
+                    if id(var) in seen:
+                        continue
+                    seen.add(id(var))
+                    t_idx = get_implicit_index_of_set(var, time)
+                    if t_idx is None or t_idx <= t_prev:
+                        boundary.append(var)
+                    else:
+                        unknowns.append(var)
+            self.blocks.append(create_subsystem_block(con_list, unknowns))
+            self.boundaries.append(boundary)
+
+    def __len__(self):
+        return len(self.elements)
+
+    def boundary_values(self, k):
+        """
+        Values of the boundary variables of the k-th element (counting from
+        zero).
+        """
+        return [var.value for var in self.boundaries[k]]
+
+    def boundary_mismatch(self, k, values):
+        """
+        Largest difference between the current values of the boundary
+        variables of the k-th element and the values provided, relative to
+        the latter (or absolute, where they are less than one in magnitude).
+        Returns inf if any value is None.
+        """
+        mismatch = 0.0
+        for var, val in zip(self.boundaries[k], values):
+            if var.value is None or val is None:
+                return float("inf")
+            mismatch = max(mismatch, abs(var.value - val) / max(1.0, abs(val)))
+        return mismatch
+
+    def solve(self, k, solver, check_dof=True):
+        """
+        Solve the subproblem of the k-th element (counting from zero) with its
+        boundary variables fixed at their current values. Boundary variables
+        with value None are not fixed.
+
+        Args:
+            k : Position of the element
+            solver : Pyomo solver object
+            check_dof : Bool. If True, raise a ValueError if the subproblem
+                does not have zero degrees of freedom.
+
+        Returns:
+            A Pyomo solver results object
+        """
+        block = self.blocks[k]
+        fixed_vars = [
+            var
+            for var in self.boundaries[k]
+            if not var.fixed and var.value is not None
+        ]
+        for var in fixed_vars:
+            var.fix()
+        try:
+            if check_dof and degrees_of_freedom(block) != 0:
+                msg = (
+                    f"Model has nonzero degrees of freedom at finite element"
+                    f" {k + 1}. This was unexpected. "
+                    "Use keyword arg igore_dof=True to skip this check."
+                )
+                self.init_log.error(msg)
+                raise ValueError("Nonzero degrees of freedom")
+            with idaeslog.solver_log(self.solver_log, level=idaeslog.DEBUG) as slc:
+                results = solver.solve(block, tee=slc.tee)
+        finally:
+            for var in fixed_vars:
+                var.unfix()
+        return results
+
+    def solve_sequentially(self, solver, check_dof=True):
+        """
+        Solve the elements one after another, in order of time, each from
+        the solution of the element before it.
+
+        Args:
+            solver : Pyomo solver object
+            check_dof : Bool. If True, check that each subproblem is square.
+
+        Returns:
+            None
+        """
+        for k in range(len(self)):
+            self._initialize(k)
+            self._solve_or_raise(k, solver, check_dof)
+
+    def solve_speculatively(
+        self, solver, mismatch_tol=1e-6, n_workers=None, check_dof=True
+    ):
+        """
+        Solve the elements in parallel, then correct the solution in order
+        of time.
+
+        Each element is first solved, in a separate process, with its
+        boundary variables fixed at their current values, which serve as a
+        prediction of the solution of the earlier elements (e.g. the result
+        of a previous initialization or a steady state). Elements are then
+        visited in order of time, and only those whose boundary values have
+        changed, relative to the values they were solved with, by more than
+        mismatch_tol, or whose first solve failed, are solved again. With
+        good predictions, most elements are solved only once.
+
+        Parallel solves need worker processes to be forked; where this is not
+        possible, or with a single worker, the elements are solved
+        sequentially.
+
+        Args:
+            solver : Pyomo solver object
+            mismatch_tol : Largest (relative) boundary mismatch for which an
+                element is not solved again
+            n_workers : Number of worker processes. Defaults to the number
+                of CPUs.
+            check_dof : Bool. If True, check that each subproblem is square.
+
+        Returns:
+            List of the positions of the elements that were solved again
+        """
+        global _speculative_state
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = min(n_workers, len(self))
+        if n_workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            self.init_log.info(
+                "Cannot solve finite elements in parallel. Solving sequentially"
+            )
+            self.solve_sequentially(solver, check_dof=check_dof)
+            return []
+
+        # Boundary values each element is solved with, or None if its
+        # (speculative) solve failed
+        solved_with = [self.boundary_values(k) for k in range(len(self))]
+        self.init_log.info(
+            f"Solving {len(self)} finite elements with {n_workers} processes"
+        )
+        _speculative_state = (self, solver, check_dof, solved_with)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                chunksize = max(1, len(self) // (4 * n_workers))
+                solutions = list(
+                    executor.map(
+                        _solve_element_speculatively,
+                        range(len(self)),
+                        chunksize=chunksize,
+                    )
+                )
+        finally:
+            _speculative_state = None
+
+        for k, values in enumerate(solutions):
+            if values is None:
+                solved_with[k] = None
+                continue
+            for var, val in zip(self.blocks[k].vars.values(), values):
+                var.set_value(val, skip_validation=True)
+
+        resolved = []
+        for k in range(len(self)):
+            if solved_with[k] is None:
+                self._initialize(k)
+            elif self.boundary_mismatch(k, solved_with[k]) <= mismatch_tol:
+                continue
+            # Elements solved from a wrong prediction are warm-started from
+            # their speculative solution
+            self._solve_or_raise(k, solver, check_dof)
+            resolved.append(k)
+        self.init_log.info(
+            f"Solved {len(resolved)} of {len(self)} finite elements again"
+        )
+        return resolved
+
+    def _initialize(self, k):
+        if self.initial_guess is not None:
+            t_prev, fe = self.elements[k]
+            self.initial_guess(t_prev, fe)
+
+    def _solve_or_raise(self, k, solver, check_dof):
+        self.init_log.info(f"Solving finite element {k + 1}")
+        results = self.solve(k, solver, check_dof=check_dof)
+        if check_optimal_termination(results):
+            self.init_log.info(f"Successfully solved finite element {k + 1}")
+        else:
+            self.init_log.error(f"Failed to solve finite element {k + 1}")
+            raise ValueError("Failure in initialization solve")
+
+    def _solve_predicted(self, k, solver, check_dof, prediction):
+        # Speculative solve, in a worker process. Failures are not errors
+        # here, as the element is solved again from the corrected solution.
+        if any(val is None for val in prediction):
+            return False
+        # A worker solves several elements in turn on its own copy of the
+        # model, so the boundary values may have been overwritten by an
+        # earlier (possibly failed) solve and are reset to the prediction.
+        for var, val in zip(self.boundaries[k], prediction):
+            var.set_value(val, skip_validation=True)
+        self._initialize(k)
+        try:
+            results = self.solve(k, solver, check_dof=check_dof)
+        except Exception as err:
+            self.init_log.debug(f"Speculative solve of element {k + 1} failed: {err}")
+            return False
+        return check_optimal_termination(results)
+
+
 def initialize_by_time_element(fs, time, **kwargs):
     """
     Function to initialize Flowsheet fs element-by-element along
@@ -303,6 +605,23 @@ def initialize_by_time_element(fs, time, **kwargs):
         solver : Pyomo solver object initialized with user's desired options
         outlvl : IDAES logger outlvl
         ignore_dof : Bool. If True, checks for square problems will be skipped.
+        fix_diff_only : Bool. If True (default), only derivative and
+            differential variables at the initial time point of a finite
+            element are fixed when it is solved. Otherwise, all variables at
+            or before this point in the constraints of the element are fixed.
+        pipelined : Bool. If True, build the subproblem of each finite element
+            once (see TimeElementSubproblems) and solve it instead of the
+            whole flowsheet. Boundary variables are found as with
+            fix_diff_only=False.
+        speculative : Bool. If True, solve the finite elements in parallel
+            from the current values of the model, then solve again those
+            whose initial conditions turn out to be different (see
+            TimeElementSubproblems.solve_speculatively). Implies pipelined.
+        mismatch_tol : Tolerance on the (relative) mismatch of initial
+            conditions above which an element is solved again in speculative
+            mode. Default 1e-6.
+        n_workers : Number of processes used in speculative mode. Defaults
+            to the number of CPUs.
 
     Returns:
         None
@@ -348,6 +667,10 @@ def initialize_by_time_element(fs, time, **kwargs):
 
     ignore_dof = kwargs.pop("ignore_dof", False)
     solver = kwargs.pop("solver", get_solver())
+    speculative = kwargs.pop("speculative", False)
+    pipelined = kwargs.pop("pipelined", False) or speculative
+    mismatch_tol = kwargs.pop("mismatch_tol", 1e-6)
+    n_workers = kwargs.pop("n_workers", None)
     fix_diff_only = kwargs.pop("fix_diff_only", True)
     # This option makes the assumption that the only variables that
     # link constraints to previous points in time (which must be fixed)
@@ -416,6 +739,94 @@ def initialize_by_time_element(fs, time, **kwargs):
     # 3. Solve the (now) square system
     # 4. Revert the model to its prior state
 
+    # Finds the time-indexed components once, for all the copies below
+    copier = TimeSliceCopier(fs, fs, outlvl=idaeslog.ERROR)
+
+    # Perform a solve for 1 -> nfe; i is the index of the finite element
+    init_log.info(
+        "Flowsheet has been deactivated. Beginning element-wise initialization"
+    )
+    if pipelined:
+        elements = [
+            (
+                time.at((i - 1) * ncp + 1),
+                [time.at(k) for k in range((i - 1) * ncp + 2, i * ncp + 2)],
+            )
+            for i in range(1, nfe + 1)
+        ]
+
+        def initial_guess(t_prev, fe):
+            for t in fe:
+                copier.copy(t, t_prev, copy_fixed=False, cache=False)
+
+        subproblems = TimeElementSubproblems(
+            time,
+            elements,
+            deactivated,
+            was_originally_active,
+            initial_guess=initial_guess,
+            outlvl=outlvl,
+        )
+        if speculative:
+            subproblems.solve_speculatively(
+                solver,
+                mismatch_tol=mismatch_tol,
+                n_workers=n_workers,
+                check_dof=not ignore_dof,
+            )
+        else:
+            subproblems.solve_sequentially(solver, check_dof=not ignore_dof)
+    else:
+        _solve_by_time_element(
+            fs,
+            time,
+            nfe,
+            ncp,
+            deactivated,
+            was_originally_active,
+            copier,
+            solver,
+            fix_diff_only=fix_diff_only,
+            ignore_dof=ignore_dof,
+            outlvl=outlvl,
+        )
+
+    # Reactivate components of the model that were originally active
+    for t in time:
+        for comp in deactivated[t]:
+            if was_originally_active[id(comp)]:
+                comp.activate()
+
+    for con in con_unindexed_by_time:
+        con.activate()
+    for var in var_unindexed_by_time:
+        var.unfix()
+
+    # Logger message that initialization is finished
+    init_log.info("Initialization completed. Model has been reactivated")
+
+
+def _solve_by_time_element(
+    fs,
+    time,
+    nfe,
+    ncp,
+    deactivated,
+    was_originally_active,
+    copier,
+    solver,
+    fix_diff_only=True,
+    ignore_dof=False,
+    outlvl=idaeslog.NOTSET,
+):
+    """
+    Solve the whole flowsheet once per finite element, activating the
+    components of each element and fixing its initial conditions around the
+    solve. This is what initialize_by_time_element does when not pipelined.
+    """
+    init_log = idaeslog.getInitLogger(__name__, level=outlvl)
+    solver_log = idaeslog.getSolveLogger(__name__, level=outlvl)
+
     # This will make use of the following dictionaries mapping
     # time points -> time derivatives and time-differential variables
     derivs_at_time = get_derivatives_at(fs, time, [t for t in time])
@@ -424,10 +835,6 @@ def initialize_by_time_element(fs, time, **kwargs):
         for t in time
     }
 
-    # Perform a solve for 1 -> nfe; i is the index of the finite element
-    init_log.info(
-        "Flowsheet has been deactivated. Beginning element-wise initialization"
-    )
     for i in range(1, nfe + 1):
         t_prev = time[(i - 1) * ncp + 1]
         # Non-initial time points in the finite element:
@@ -476,9 +883,7 @@ def initialize_by_time_element(fs, time, **kwargs):
 
         # Initialize finite element from its initial conditions
         for t in fe:
-            copy_values_at_time(
-                fs, fs, t, t_prev, copy_fixed=False, outlvl=idaeslog.ERROR
-            )
+            copier.copy(t, t_prev, copy_fixed=False, cache=False)
 
         # Log that we are solving finite element {i}
         init_log.info(f"Solving finite element {i}")
@@ -512,17 +917,3 @@ def initialize_by_time_element(fs, time, **kwargs):
 
         # Log that initialization step {i} has been finished
         init_log.info(f"Initialization step {i} complete")
-
-    # Reactivate components of the model that were originally active
-    for t in time:
-        for comp in deactivated[t]:
-            if was_originally_active[id(comp)]:
-                comp.activate()
-
-    for con in con_unindexed_by_time:
-        con.activate()
-    for var in var_unindexed_by_time:
-        var.unfix()
-
-    # Logger message that initialization is finished
-    init_log.info("Initialization completed. Model has been reactivated")
@@ -17,12 +17,22 @@ modeling in Pyomo.
 
 __author__ = "Alexander Dowling"
 
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
 import pyomo.environ as pyo
 from pyomo.core.expr.visitor import identify_variables
 from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
 import numpy as np
-from scipy.sparse.linalg import svds
-from scipy.sparse import issparse, find
+from scipy.sparse.linalg import svds, splu, eigsh, norm, LinearOperator
+from scipy.sparse import issparse, find, csr_matrix, bmat, identity
+from scipy.sparse.csgraph import (
+    breadth_first_order,
+    connected_components,
+    maximum_bipartite_matching,
+)
 
 from idaes.core.util.model_statistics import (
     large_residuals_set,
@@ -34,6 +44,176 @@ import matplotlib.pyplot as plt
 from operator import itemgetter
 
 
+#: Part of an equality constraint Jacobian isolated by
+#: :meth:`DegeneracyHunter.decompose`.
+#:
+#: kind is "overconstrained" (rows of the Dulmage-Mendelsohn
+#: overdetermined part, which are structurally dependent),
+#: "underconstrained" (rows of the underdetermined part) or "square" (an
+#: irreducible diagonal block of the block triangular form of the
+#: well-determined part). rows and cols are the indices of its equations and
+#: variables, and s_min is its smallest singular value (0 for the
+#: overconstrained part). Any degenerate set containing one of its rows lies
+#: within region_rows, and only involves the variables region_cols.
+JacobianBlock = namedtuple(
+    "JacobianBlock", ["kind", "rows", "cols", "region_rows", "region_cols", "s_min"]
+)
+
+
+def _dulmage_mendelsohn(jac):
+    """Dulmage-Mendelsohn decomposition of the sparsity pattern of a matrix,
+    with the well-determined part split into irreducible blocks.
+
+    Arguments:
+        jac: sparse matrix
+
+    Returns:
+        over: (rows, cols) of the overdetermined part
+        under: (rows, cols) of the underdetermined part
+        blocks: list of (rows, cols) of the diagonal blocks of the
+            well-determined part, in which each row is matched to the column
+            in the same position
+    """
+    A = jac.tocsr()
+    At = jac.tocsc()
+    n_eq, n_var = A.shape
+    row_match = maximum_bipartite_matching(A, perm_type="column")
+    col_match = np.full(n_var, -1)
+    col_match[row_match[row_match >= 0]] = np.nonzero(row_match >= 0)[0]
+
+    # The overdetermined part is reachable from unmatched rows, and the
+    # underdetermined part from unmatched columns, along alternating paths
+    over_rows = np.zeros(n_eq, dtype=bool)
+    over_cols = np.zeros(n_var, dtype=bool)
+    stack = list(np.nonzero(row_match < 0)[0])
+    over_rows[stack] = True
+    while stack:
+        r = stack.pop()
+        for c in A.indices[A.indptr[r] : A.indptr[r + 1]]:
+            if not over_cols[c]:
+                over_cols[c] = True
+                r2 = col_match[c]
+                if not over_rows[r2]:
+                    over_rows[r2] = True
+                    stack.append(r2)
+
+    under_rows = np.zeros(n_eq, dtype=bool)
+    under_cols = np.zeros(n_var, dtype=bool)
+    stack = list(np.nonzero(col_match < 0)[0])
+    under_cols[stack] = True
+    while stack:
+        c = stack.pop()
+        for r in At.indices[At.indptr[c] : At.indptr[c + 1]]:
+            if not under_rows[r]:
+                under_rows[r] = True
+                c2 = row_match[r]
+                if not under_cols[c2]:
+                    under_cols[c2] = True
+                    stack.append(c2)
+
+    # Strongly connected components of the well-determined part, where row
+    # r depends on row r2 if it contains the column matched to r2
+    sq_rows = np.nonzero(~(over_rows | under_rows))[0]
+    local = np.full(n_eq, -1)
+    local[sq_rows] = np.arange(len(sq_rows))
+    coo = A[sq_rows].tocoo()
+    dep = local[col_match[coo.col]]
+    keep = dep >= 0
+    graph = csr_matrix(
+        (np.ones(keep.sum()), (coo.row[keep], dep[keep])),
+        shape=(len(sq_rows), len(sq_rows)),
+    )
+    n_blocks, labels = connected_components(graph, directed=True, connection="strong")
+    blocks = []
+    for b in range(n_blocks):
+        rows = sq_rows[labels == b]
+        blocks.append((rows, row_match[rows]))
+
+    return (
+        (np.nonzero(over_rows)[0], np.nonzero(over_cols)[0]),
+        (np.nonzero(under_rows)[0], np.nonzero(under_cols)[0]),
+        blocks,
+    )
+
+
+def _smallest_singular_values(A, k=1, dense_limit=100):
+    """Compute the k smallest singular values of a sparse matrix, in
+    ascending order.
+
+    Small matrices are decomposed densely. For larger ones, the extreme
+    eigenvalues of the inverse of A^T A (or of an augmented matrix containing
+    A and A^T, for nonsquare matrices) are computed with a sparse LU
+    factorization, i.e. shift-invert around zero, which converges much faster
+    than searching for the smallest values of A. A matrix that cannot be
+    factorized is exactly singular.
+    """
+    m, n = A.shape
+    k = min(k, m, n)
+    if max(m, n) <= dense_limit or k >= min(m, n) - 1:
+        s = np.linalg.svd(A.toarray(), compute_uv=False)
+        return np.sort(s)[:k]
+    if m < n:
+        A = A.T
+        m, n = n, m
+    A = A.tocsc()
+    if m == n:
+        try:
+            lu = splu(A)
+        except RuntimeError:
+            # Factor is exactly singular
+            return np.zeros(k)
+        inv = LinearOperator(
+            A.shape,
+            matvec=lu.solve,
+            rmatvec=lambda x: lu.solve(x, trans="T"),
+            dtype=float,
+        )
+        s_inv = svds(inv, k=k, which="LM", return_singular_vectors=False)
+        return 1 / np.sort(s_inv)[::-1]
+    # The augmented matrix [[g*I, A], [A^T, 0]] has an eigenvalue
+    # (g - sqrt(g^2 + 4*s^2))/2 < 0 for each singular value s of A, the
+    # others are g > 0. The smallest singular values give the most negative
+    # eigenvalues of its inverse, which are best conditioned with g close to
+    # them, so start from g >= s_max and refine.
+    g = np.sqrt(norm(A, 1) * norm(A, np.inf))
+    for i in range(10):
+        aug = bmat([[g * identity(m), A], [A.T, None]], format="csc")
+        try:
+            lu = splu(aug)
+        except RuntimeError:
+            # Factor is exactly singular
+            return np.zeros(k)
+        inv = LinearOperator(aug.shape, matvec=lu.solve, dtype=float)
+        mu = 1 / eigsh(inv, k=k, which="SA", return_eigenvectors=False)
+        s = np.sort(np.sqrt(mu * (mu - g)))
+        if g <= 4 * s[-1]:
+            break
+        g = s[-1]
+    return s
+
+
+# State of DegeneracyHunter.find_irreducible_degenerate_sets, inherited by
+# forked worker processes: (Degeneracy Hunter, tee), and the MILPs built by
+# the process, by block
+_ids_state = None
+_ids_milps = {}
+
+
+def _solve_ids_milp(task):
+    """Solve the IDS MILP of candidate equation c of suspect block b"""
+    b, c = task
+    dh, tee = _ids_state
+    block = dh.suspect_blocks[b]
+    if b not in _ids_milps:
+        jac = dh.jac_eq.tocsr()[block.region_rows][:, block.region_cols]
+        _ids_milps[b] = dh._prepare_ids_milp(jac, dh.max_nu)
+    c_local = int(np.searchsorted(block.region_rows, c))
+    ids_ = dh._check_candidate_ids(_ids_milps[b], dh.solver, c_local, None, tee)
+    if ids_ is None:
+        return None
+    return {int(block.region_rows[i]): nu for i, nu in ids_.items()}
+
+
 class DegeneracyHunter:
     def __init__(self, block_or_jac, solver=None):
         """Initialize Degeneracy Hunter Object
@@ -108,6 +288,10 @@ class DegeneracyHunter:
         # Create spot to store singular values
         self.s = None
 
+        # Create spot to store results of decompose
+        self.jacobian_blocks = None
+        self.suspect_blocks = None
+
         # Set constants for MILPs
         self.max_nu = 1e5
         self.min_nonzero_nu = 1e-5
@@ -200,12 +384,14 @@ class DegeneracyHunter:
 
         return vnbs
 
-    def check_rank_equality_constraints(self, tol=1e-6):
+    def check_rank_equality_constraints(self, tol=1e-6, decompose=False):
         """
         Method to check the rank of the Jacobian of the equality constraints
 
         Args:
             tol: Tolerance for smallest singular value (default=1E-6)
+            decompose: Boolean, analyze the blocks of the decomposed Jacobian
+                (see svd_analysis) (default = False)
 
         Returns:
             Number of singular values less than tolerance (-1 means error)
@@ -225,7 +411,7 @@ class DegeneracyHunter:
         counter = 0
         if self.n_eq > 1:
             if self.s is None:
-                self.svd_analysis()
+                self.svd_analysis(decompose=decompose)
 
             n = len(self.s)
 
@@ -505,12 +691,112 @@ class DegeneracyHunter:
         else:
             return None, None
 
-    def svd_analysis(self, n_smallest_sv=10):
+    def decompose(self, tol=1e-6, verbose=True):
+        """
+        Isolate the parts of the Jacobian of the equality constraints that
+        may contain degenerate sets
+
+        The Jacobian is split, using its sparsity pattern, into the
+        overdetermined and underdetermined parts of its Dulmage-Mendelsohn
+        decomposition and the irreducible diagonal blocks of the block
+        triangular form of its well-determined part. The overdetermined part
+        is structurally singular. The smallest singular value of each of the
+        other parts is computed (see svd_analysis), and those below tol are
+        poorly conditioned.
+
+        Args:
+            tol: Tolerance for smallest singular value (default=1E-6)
+            verbose: Print information to the screen (default=True)
+
+        Returns:
+            suspect_blocks: list of JacobianBlock that are structurally
+            singular or poorly conditioned
+
+        Actions:
+            Stores all parts in jacobian_blocks and the suspect ones in
+            suspect_blocks
+
+        """
+        A = self.jac_eq.tocsr()
+        over, under, blocks = _dulmage_mendelsohn(A)
+        parts = [("square", rows, cols) for rows, cols in blocks]
+        if len(over[0]) > 0:
+            parts.append(("overconstrained",) + over)
+        if len(under[0]) > 0:
+            parts.append(("underconstrained",) + under)
+
+        # Part p depends on part q if rows of p contain variables of q. Any
+        # degenerate set containing rows of p is within the parts that p
+        # (recursively) depends on.
+        part_of_row = np.empty(self.n_eq, dtype=int)
+        part_of_col = np.empty(self.n_var, dtype=int)
+        for p, (kind, rows, cols) in enumerate(parts):
+            part_of_row[rows] = p
+            part_of_col[cols] = p
+        coo = A.tocoo()
+        p_row = part_of_row[coo.row]
+        p_col = part_of_col[coo.col]
+        other = p_row != p_col
+        graph = csr_matrix(
+            (np.ones(other.sum()), (p_row[other], p_col[other])),
+            shape=(len(parts), len(parts)),
+        )
+
+        # Smallest singular values, directly for the (many) 1x1 blocks
+        s_min = np.zeros(len(parts))
+        scalar = [p for p, (kind, rows, cols) in enumerate(parts) if len(rows) == 1]
+        if scalar:
+            r = [parts[p][1][0] for p in scalar]
+            c = [parts[p][2][0] for p in scalar]
+            s_min[scalar] = np.abs(np.asarray(A[r, c]).ravel())
+
+        self.jacobian_blocks = []
+        for p, (kind, rows, cols) in enumerate(parts):
+            region = breadth_first_order(
+                graph, p, directed=True, return_predecessors=False
+            )
+            region_rows = np.sort(np.concatenate([parts[q][1] for q in region]))
+            region_cols = np.sort(np.concatenate([parts[q][2] for q in region]))
+            if kind == "square" and len(rows) > 1:
+                s_min[p] = _smallest_singular_values(A[rows][:, cols])[0]
+            elif kind == "underconstrained":
+                s_min[p] = _smallest_singular_values(A[rows][:, region_cols])[0]
+            self.jacobian_blocks.append(
+                JacobianBlock(kind, rows, cols, region_rows, region_cols, s_min[p])
+            )
+
+        self.suspect_blocks = [b for b in self.jacobian_blocks if b.s_min < tol]
+
+        if verbose:
+            print(
+                "Jacobian decomposed into",
+                len(blocks),
+                "diagonal block(s) of size at most",
+                max((len(rows) for rows, cols in blocks), default=0),
+            )
+            print("Overconstrained part:", len(over[0]), "equation(s)")
+            print("Underconstrained part:", len(under[0]), "equation(s)")
+            if self.suspect_blocks:
+                print("Structurally singular or poorly conditioned block(s):")
+                print("kind\tequations\tsmallest singular value")
+                for b in self.suspect_blocks:
+                    print(b.kind, "\t", len(b.rows), "\t", "%.3E" % b.s_min)
+            else:
+                print("No structurally singular or poorly conditioned blocks.")
+
+        return self.suspect_blocks
+
+    def svd_analysis(self, n_smallest_sv=10, decompose=False):
         """
         Perform SVD analysis of the constraint Jacobian
 
         Args:
             n_smallest_sv: number of smallest singular values to compute
+            decompose: Boolean, compute the singular values of the blocks of
+                the decomposed Jacobian (see decompose) instead of the whole
+                Jacobian (default = False). The overdetermined part
+                contributes one zero per excess equation. Singular vectors
+                are not computed.
 
         Returns:
             Nothing
@@ -525,6 +811,33 @@ class DegeneracyHunter:
             # Determine the number of singular values to compute
             # The "-1" is needed to avoid an error with svds
             n_sv = min(n_smallest_sv, min(self.n_eq, self.n_var) - 1)
+
+            if decompose:
+                if self.jacobian_blocks is None:
+                    self.decompose(verbose=False)
+                print(
+                    "Computing the",
+                    n_sv,
+                    "smallest singular value(s) of the Jacobian blocks",
+                )
+                A = self.jac_eq.tocsr()
+                s = []
+                for b in self.jacobian_blocks:
+                    if b.kind == "overconstrained":
+                        s.extend([0.0] * (len(b.rows) - len(b.cols)))
+                    elif len(b.rows) == 1:
+                        s.append(b.s_min)
+                    elif b.kind == "square":
+                        s.extend(_smallest_singular_values(A[b.rows][:, b.cols], n_sv))
+                    else:
+                        s.extend(
+                            _smallest_singular_values(A[b.rows][:, b.region_cols], n_sv)
+                        )
+                self.u = None
+                self.s = np.sort(s)[:n_sv]
+                self.v = None
+                return
+
             print("Computing the", n_sv, "smallest singular value(s)")
 
             # Perform SVD
@@ -576,18 +889,32 @@ class DegeneracyHunter:
 
         return ds
 
-    def find_irreducible_degenerate_sets(self, verbose=True, tee=False):
+    def find_irreducible_degenerate_sets(
+        self, verbose=True, tee=False, decompose=False, n_workers=None
+    ):
         """
         Compute irreducible degenerate sets
 
         Args:
             verbose: Print information to the screen (default=True)
             tee: Print solver output to screen (default=True)
+            decompose: Boolean, only consider the structurally singular or
+                poorly conditioned blocks of the Jacobian (see decompose),
+                instead of finding candidate equations with a MILP. Each
+                equation of these blocks is a candidate, and its MILP is
+                built over the region of the Jacobian its block depends on.
+                (default = False)
+            n_workers: Number of processes solving the MILPs in parallel
+                when decompose is True. Defaults to the number of CPUs.
 
         Returns:
             irreducible_degenerate_sets: list of irreducible degenerate sets
 
         """
+        if decompose:
+            return self._find_irreducible_degenerate_sets_by_block(
+                verbose, tee, n_workers
+            )
 
         # If there are no candidate equations, find them!
         if not self.candidate_eqns:
@@ -618,16 +945,83 @@ class DegeneracyHunter:
                     irreducible_degenerate_sets.append(ids_)
 
             if verbose:
-                for i, s in enumerate(irreducible_degenerate_sets):
-                    print("\nIrreducible Degenerate Set", i)
-                    print("nu\tConstraint Name")
-                    for k, v in s.items():
-                        print(v, "\t", k)
+                self._print_irreducible_degenerate_sets(irreducible_degenerate_sets)
         else:
             print("No candidate equations. The Jacobian is likely full rank.")
 
         return irreducible_degenerate_sets
 
+    def _find_irreducible_degenerate_sets_by_block(self, verbose, tee, n_workers):
+        global _ids_state
+
+        if self.suspect_blocks is None:
+            self.decompose(verbose=verbose)
+
+        tasks = [
+            (b, int(c)) for b, block in enumerate(self.suspect_blocks) for c in block.rows
+        ]
+        self.candidate_eqns = [c for b, c in tasks]
+        if not tasks:
+            print("No candidate equations. The Jacobian is likely full rank.")
+            return []
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        n_workers = min(n_workers, len(tasks))
+        if verbose:
+            print("*** Searching for Irreducible Degenerate Sets ***")
+            print(
+                "Solving",
+                len(tasks),
+                "MILPs for",
+                len(self.suspect_blocks),
+                "block(s) with",
+                n_workers,
+                "process(es)...",
+            )
+
+        _ids_state = (self, tee)
+        try:
+            if n_workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+                with ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    mp_context=multiprocessing.get_context("fork"),
+                ) as executor:
+                    # Tasks are ordered by block, so chunks of them mostly
+                    # reuse the MILP of the block
+                    results = list(
+                        executor.map(
+                            _solve_ids_milp,
+                            tasks,
+                            chunksize=max(1, len(tasks) // (4 * n_workers)),
+                        )
+                    )
+            else:
+                results = [_solve_ids_milp(task) for task in tasks]
+        finally:
+            _ids_state = None
+            _ids_milps.clear()
+
+        irreducible_degenerate_sets = []
+        for ids_ in results:
+            if ids_ is not None:
+                if self.eq_con_list is not None:
+                    ids_ = {self.eq_con_list[i]: nu for i, nu in ids_.items()}
+                irreducible_degenerate_sets.append(ids_)
+
+        if verbose:
+            self._print_irreducible_degenerate_sets(irreducible_degenerate_sets)
+
+        return irreducible_degenerate_sets
+
+    @staticmethod
+    def _print_irreducible_degenerate_sets(irreducible_degenerate_sets):
+        for i, s in enumerate(irreducible_degenerate_sets):
+            print("\nIrreducible Degenerate Set", i)
+            print("nu\tConstraint Name")
+            for k, v in s.items():
+                print(v, "\t", k)
+
     ### Helper Functions
 
     # Note: This makes sense as a static method
@@ -11,7 +11,8 @@
 # license information.
 #################################################################################
 """
-Functions for saving and loading Pyomo objects to json
+Functions for saving and loading Pyomo objects to json, or to a binary
+columnar format (NumPy .npz)
 """
 
 from pyomo.environ import *
@@ -23,6 +24,7 @@ import datetime
 import time
 import gzip
 import logging
+import numpy as np
 
 _log = logging.getLogger(__name__)
 
@@ -919,6 +921,44 @@ def _read_suffixes(lookup, suffixes):
             s[kc] = d[key]
 
 
+def _load_state_dict(sd=None, fname=None, s=None, gz=None):
+    """
+    Get a model state dict from a dict, json file, or json string. See
+    from_json for the arguments.
+    """
+    if gz is None:
+        if isinstance(fname, str):
+            gz = fname.endswith(".gz")
+        else:
+            gz = False
+    if sd is not None:  # Existing Python dict (for in-memory stuff).
+        return sd
+    elif fname is not None:  # Read in from a json file
+        if gz:
+            with gzip.open(fname, "r") as f:
+                fr = f.read()
+                return json.loads(fr)
+        else:
+            with open(fname, "r") as f:
+                return json.load(f)  # json file
+    elif s is not None:  # Use a json string (not really sure if useful)
+        return json.loads(s)  # json string
+    else:  # Didn't specify at least one source
+        raise Exception("Need to specify a data source to load from")
+
+
+def _state_root_name(sd):
+    """
+    Get the name of the top-level component in a model state dict.
+    """
+    for k in sd:
+        if k.startswith("__") and k.endswith("__"):
+            # This is metadata or maybe some similar future addition.
+            continue
+        else:
+            return k  # should be one root, use it's name
+
+
 def from_json(o, sd=None, fname=None, s=None, wts=None, gz=None, root_name=None):
     """
     Load the state of a Pyomo component state from a dictionary, json file, or
@@ -943,30 +983,11 @@ def from_json(o, sd=None, fname=None, s=None, wts=None, gz=None, root_name=None)
         "etime_read_dict", how long in seconds it took to read models state
         "etime_read_suffixes", how long in seconds it took to read suffixes
     """
-    if gz is None:
-        if isinstance(fname, str):
-            gz = fname.endswith(".gz")
-        else:
-            gz = False
-
     # keeping track of elapsed time.  want to make sure I don't do anything
     # that's too slow.
     start_time = time.time()
     # Get the model state dict from one of three sources
-    if sd is not None:  # Existing Python dict (for in-memory stuff).
-        pass
-    elif fname is not None:  # Read in from a json file
-        if gz:
-            with gzip.open(fname, "r") as f:
-                fr = f.read()
-                sd = json.loads(fr)
-        else:
-            with open(fname, "r") as f:
-                sd = json.load(f)  # json file
-    elif s is not None:  # Use a json string (not really sure if useful)
-        sd = json.loads(s)  # json string
-    else:  # Didn't specify at least one source
-        raise Exception("Need to specify a data source to load from")
+    sd = _load_state_dict(sd=sd, fname=fname, s=s, gz=gz)
     dict_time = time.time()  # To calculate how long it took to read file
     if wts is None:  # if no StoreSpec object given use the default, which should
         wts = StoreSpec()  # be the typlical save everything important
@@ -974,13 +995,7 @@ def from_json(o, sd=None, fname=None, s=None, wts=None, gz=None, root_name=None)
     suffixes = {}  # A list of suffixes delayed to end so lookup is complete
     # Read toplevel componet (is recursive)
     if root_name is None:
-        for k in sd:
-            if k.startswith("__") and k.endswith("__"):
-                # This is metadata or maybe some similar future addition.
-                continue
-            else:
-                root_name = k
-                break  # should be one root, use it's name
+        root_name = _state_root_name(sd)
     _read_component(sd, o, wts, lookup=lookup, suffixes=suffixes, root_name=root_name)
     read_time = time.time()  # to calc time to read model state minus suffixes
     # Now read in the suffixes
@@ -991,3 +1006,571 @@ def from_json(o, sd=None, fname=None, s=None, wts=None, gz=None, root_name=None)
     pdict["etime_read_dict"] = read_time - dict_time
     pdict["etime_read_suffixes"] = suffix_time - read_time
     return pdict
+
+
+class StateLoader(object):
+    """
+    Reusable loader for model states written by to_json. When states are
+    loaded into the same model many times (e.g. rolling horizon or multi-start
+    workflows), from_json walks the model and the state dictionary every time.
+    A StateLoader resolves the serialized component paths to the Pyomo
+    components and component data once, then later loads only read the stored
+    attributes. The mapping is rebuilt if the model structure changes (a
+    component is added, removed, or changes size) or if a state with a
+    different structure is loaded.
+
+    Args:
+        o: Pyomo component to for which to load states
+        wts: StoreSpec object specifying what to load, default is StoreSpec()
+        root_name: Name of the top-level component in the stored states, by
+            default use the first non-metadata key of each state.
+    """
+
+    def __init__(self, o, wts=None, root_name=None):
+        self.o = o
+        if wts is None:
+            wts = StoreSpec()
+        self.wts = wts
+        self.root_name = root_name
+        self._records = None  # (component, path, attribute list, filter)
+        self._suffixes = None  # (suffix, path to suffix data)
+        self._lookup = None  # Stored id to component for suffixes
+        self._key = None  # Model and state structure the mapping is for
+
+    def _state_key(self, sd, root_name):
+        try:
+            n = sd["__metadata__"]["__performance__"]["n_components"]
+        except KeyError:
+            n = None
+        return (root_name, n, _model_fingerprint(self.o))
+
+    def _record_component(self, sd, o, path, root_name=None):
+        """
+        Record the state dict paths of a component, see _read_component.
+        """
+        wts = self.wts
+        alist, ff = wts.get_class_attr_list(o)
+        if alist is None:
+            return
+        if root_name is None:
+            oname = o.getname(fully_qualified=False)
+        else:
+            oname = root_name
+        try:
+            odict = sd[oname]
+        except KeyError as e:
+            if wts.ignore_missing:
+                return
+            else:
+                raise (e)
+        path = path + (oname,)
+        if Suffix in wts.classes:
+            self._lookup[odict["__id__"]] = o
+        self._records.append((o, path, alist, ff))
+        if isinstance(o, Suffix):
+            if wts.suffix_filter is None or oname in wts.suffix_filter:
+                self._suffixes.append((o, path + ("data",)))
+        else:
+            self._record_component_data(odict["data"], o, path + ("data",))
+
+    def _record_component_data(self, sd, o, path):
+        """
+        Record the state dict paths of component data, see
+        _read_component_data.
+        """
+        wts = self.wts
+        try:
+            item_keys = o.keys()
+        except AttributeError:
+            item_keys = [None]
+        frst = True
+        for key in item_keys:
+            if key is None and isinstance(o, ComponentData):
+                el = o
+            else:
+                el = o[key]
+            if frst:  # assume all items are same type, use first to get alist
+                alist, ff = wts.get_data_class_attr_list(el)
+                if alist is None:
+                    return
+            frst = False
+            try:
+                edict = sd[repr(key)]
+            except KeyError as e:
+                if wts.ignore_missing:
+                    return
+                else:
+                    raise (e)
+            epath = path + (repr(key),)
+            if Suffix in wts.classes:
+                self._lookup[edict["__id__"]] = el
+            self._records.append((el, epath, alist, ff))
+            if _may_have_subcomponents(el) and "__pyomo_components__" in edict:
+                for o2 in el.component_objects(descend_into=False):
+                    self._record_component(
+                        edict["__pyomo_components__"],
+                        o2,
+                        epath + ("__pyomo_components__",),
+                    )
+
+    def build(self, sd, root_name=None):
+        """
+        Resolve the component paths in a state dict to model components. This
+        is called by load() when needed, so it does not usually need to be
+        called directly.
+
+        Args:
+            sd: State dictionary written by to_json
+            root_name: Name of the top-level component in sd
+
+        Returns:
+            None
+        """
+        if root_name is None:
+            root_name = _state_root_name(sd)
+        self._records = []
+        self._suffixes = []
+        self._lookup = {}
+        self._record_component(sd, self.o, (), root_name=root_name)
+        self._key = self._state_key(sd, root_name)
+
+    def load(self, sd=None, fname=None, s=None, gz=None):
+        """
+        Load a model state from a dictionary, json file, or json string, see
+        from_json.
+
+        Args:
+            sd: State dictionary to load, if None, check fname and s
+            fname: JSON file to load, only used if sd is None
+            s: JSON string to load only used if both sd and fname are None
+            gz: If True assume the file specified by fname is gzipped. The
+                default is True if fname ends with '.gz' otherwise False.
+
+        Returns:
+            Dictionary with some perfomance information, with the same keys as
+            from_json, and "etime_build", how long in seconds it took to
+            resolve the component paths (0 if the cached mapping was used).
+        """
+        start_time = time.time()
+        sd = _load_state_dict(sd=sd, fname=fname, s=s, gz=gz)
+        dict_time = time.time()
+        root_name = self.root_name
+        if root_name is None:
+            root_name = _state_root_name(sd)
+        if self._records is None or self._key != self._state_key(sd, root_name):
+            self.build(sd, root_name=root_name)
+        build_time = time.time()
+        try:
+            items = [
+                (o, _dict_at_path(sd, path), alist, ff)
+                for o, path, alist, ff in self._records
+            ]
+        except KeyError:
+            # The state doesn't have the structure the mapping was built for
+            self.build(sd, root_name=root_name)
+            items = [
+                (o, _dict_at_path(sd, path), alist, ff)
+                for o, path, alist, ff in self._records
+            ]
+        wts = self.wts
+        for o, odict, alist, ff in items:
+            if ff is not None:
+                alist = ff(o, odict)
+            for a in alist:
+                try:
+                    if a in wts.read_cbs:
+                        if wts.read_cbs[a] is not None:
+                            wts.read_cbs[a](o, odict[a])
+                    else:
+                        setattr(o, a, odict[a])
+                except KeyError as e:
+                    if wts.ignore_missing:
+                        break
+                    else:
+                        raise (e)
+        read_time = time.time()
+        lookup = self._lookup
+        for suf, path in self._suffixes:
+            d = _dict_at_path(sd, path)
+            for key in d:
+                try:
+                    kc = lookup[int(key)]
+                except KeyError:
+                    continue
+                suf[kc] = d[key]
+        suffix_time = time.time()
+        return {
+            "etime_load_file": dict_time - start_time,
+            "etime_build": build_time - dict_time,
+            "etime_read_dict": read_time - build_time,
+            "etime_read_suffixes": suffix_time - read_time,
+        }
+
+
+def _model_fingerprint(o):
+    """
+    Cheap description of the model structure, component ids and sizes
+    """
+    comps = [o]
+    if _may_have_subcomponents(o):
+        comps.extend(o.component_objects(descend_into=True))
+    elif isinstance(o, Block):
+        for bd in o.values():
+            comps.extend(bd.component_objects(descend_into=True))
+    return tuple((id(c), len(c) if c.is_indexed() else 1) for c in comps)
+
+
+def _dict_at_path(sd, path):
+    for k in path:
+        sd = sd[k]
+    return sd
+
+
+def _npz_components(o):
+    """
+    Collect the component data saved by to_npz, with names relative to o.
+
+    Args:
+        o: Pyomo block (usually a model)
+
+    Returns:
+        Dictionary with keys "var", "param", "constraint", and "block", with
+        values that are tuples of a list of component data and a list of names.
+    """
+    name_buffer = {}
+
+    def _collect(ctype, **kwargs):
+        objs = list(o.component_data_objects(ctype, descend_into=True, **kwargs))
+        names = [
+            c.getname(fully_qualified=True, relative_to=o, name_buffer=name_buffer)
+            for c in objs
+        ]
+        return objs, names
+
+    # Params may only store data for indexes not using the default value, so
+    # index the components to get all the mutable param data
+    params = [
+        pc[k]
+        for pc in o.component_objects(Param, descend_into=True)
+        if pc._mutable
+        for k in pc
+    ]
+    pnames = [
+        p.getname(fully_qualified=True, relative_to=o, name_buffer=name_buffer)
+        for p in params
+    ]
+    return {
+        "var": _collect(Var),
+        "param": (params, pnames),
+        "constraint": _collect(Constraint),
+        "block": _collect(Block),
+    }
+
+
+def _none_to_nan(x):
+    return np.nan if x is None else x
+
+
+_NUMBER_TYPES = (int, float, np.integer, np.floating, np.bool_)
+
+
+def _suffix_value_array(values):
+    """
+    Array of suffix values, keeping bool (e.g. binary flags) or int values
+    as such if all the values are of that type.
+    """
+    if all(isinstance(v, (bool, np.bool_)) for v in values):
+        dtype = bool
+    elif all(isinstance(v, (int, np.integer)) for v in values):
+        dtype = int
+    else:
+        dtype = float
+    return np.array(values, dtype=dtype)
+
+
+def to_npz(o, fname=None, metadata=None, compress=False):
+    """
+    Save the state of a model in a binary columnar format. Variable values,
+    fixed flags and bounds, mutable parameter values, constraint and block
+    active flags, and the numeric values of suffixes on variables and
+    constraints are stored as NumPy arrays, with the component names stored
+    once. As with to_json, a model with the same structure must exist to load
+    the state, but loading into a model with the same structure only requires
+    bulk array assignments.
+
+    Args:
+        o: The Pyomo block to save, usually a model.
+        fname: File name or file object to save the state to as a NumPy .npz
+            archive. If None, only return the array dictionary.
+        metadata: A dictionary of additional metadata to add, must be json
+            serializable.
+        compress: If True, write a compressed .npz archive.
+
+    Returns:
+        Dictionary of NumPy arrays holding the model state.
+    """
+    if metadata is None:
+        metadata = {}
+    now = datetime.datetime.now()
+    comps = _npz_components(o)
+    var, var_names = comps["var"]
+    param, param_names = comps["param"]
+    con, con_names = comps["constraint"]
+    blk, blk_names = comps["block"]
+    n = len(var)
+    sd = {
+        "__metadata__": np.array(
+            json.dumps(
+                {
+                    "format_version": __format_version__,
+                    "date": datetime.date.isoformat(now.date()),
+                    "time": datetime.time.isoformat(now.time()),
+                    "other": metadata,
+                }
+            )
+        ),
+        "var_names": np.array(var_names, dtype=str),
+        "var_value": np.fromiter(
+            (_none_to_nan(v.value) for v in var), dtype=float, count=n
+        ),
+        "var_fixed": np.fromiter((v.fixed for v in var), dtype=bool, count=n),
+        "var_lb": np.fromiter((_none_to_nan(v.lb) for v in var), dtype=float, count=n),
+        "var_ub": np.fromiter((_none_to_nan(v.ub) for v in var), dtype=float, count=n),
+        "param_names": np.array(param_names, dtype=str),
+        "param_value": np.fromiter(
+            (_none_to_nan(value(p, exception=False)) for p in param),
+            dtype=float,
+            count=len(param),
+        ),
+        "constraint_names": np.array(con_names, dtype=str),
+        "constraint_active": np.fromiter(
+            (c.active for c in con), dtype=bool, count=len(con)
+        ),
+        "block_names": np.array(blk_names, dtype=str),
+        "block_active": np.fromiter(
+            (b.active for b in blk), dtype=bool, count=len(blk)
+        ),
+    }
+    # Suffix values are stored as an index into the variable or constraint
+    # names and a value array
+    var_index = {id(v): i for i, v in enumerate(var)}
+    con_index = {id(c): i for i, c in enumerate(con)}
+    suffix_names = []
+    for suf in o.component_data_objects(Suffix, descend_into=True):
+        j = len(suffix_names)
+        suffix_names.append(suf.getname(fully_qualified=True, relative_to=o))
+        for kind, index in (("var", var_index), ("constraint", con_index)):
+            items = [
+                (index[id(k)], val)
+                for k, val in suf.items()
+                if id(k) in index and isinstance(val, _NUMBER_TYPES)
+            ]
+            sd[f"suffix{j}_{kind}_index"] = np.array(
+                [i for i, val in items], dtype=int
+            )
+            sd[f"suffix{j}_{kind}_value"] = _suffix_value_array(
+                [val for i, val in items]
+            )
+    sd["suffix_names"] = np.array(suffix_names, dtype=str)
+    if fname is not None:
+        if compress:
+            np.savez_compressed(fname, **sd)
+        else:
+            np.savez(fname, **sd)
+    return sd
+
+
+def _npz_positions(names, stored_names):
+    """
+    Map component names in the model to positions in the stored arrays.
+
+    Returns:
+        None if the names match exactly (same structure), otherwise a tuple of
+        an array of model positions and an array of stored positions for the
+        names in both.
+    """
+    if len(names) == len(stored_names) and np.array_equal(
+        np.array(names, dtype=str), stored_names
+    ):
+        return None
+    stored = {str(k): i for i, k in enumerate(stored_names)}
+    pairs = [(i, stored[k]) for i, k in enumerate(names) if k in stored]
+    return (
+        np.array([i for i, j in pairs], dtype=int),
+        np.array([j for i, j in pairs], dtype=int),
+    )
+
+
+def _npz_select(objs, positions):
+    """
+    Return the component data and the stored array index (for NumPy indexing)
+    for positions returned by _npz_positions.
+    """
+    if positions is None:
+        return objs, slice(None)
+    return [objs[i] for i in positions[0]], positions[1]
+
+
+def _nan_to_none(a):
+    """
+    Convert a float array to a list with None in place of NaN.
+    """
+    a = a.astype(object)
+    a[np.isnan(a.astype(float))] = None
+    return a.tolist()
+
+
+_NPZ_KINDS = ("var", "param", "constraint", "block")
+
+
+class NpzStateLoader(object):
+    """
+    Reusable loader for model states written by to_npz. Collecting the
+    component data of the model and their names is most of the work of
+    from_npz. Like a StateLoader, an NpzStateLoader matches the model
+    components to the stored names once, then later loads only assign the
+    stored arrays. The lookup is rebuilt if the model structure changes (a
+    component is added, removed, or changes size) or if a state with
+    different component names is loaded.
+
+    Args:
+        o: Pyomo block to load states into
+    """
+
+    def __init__(self, o):
+        self.o = o
+        self._select = None  # kind: (model component data, stored index)
+        self._by_position = None  # kind: component data by stored position
+        self._names = None  # kind: stored names the lookup is for
+        self._suffixes = None  # stored suffix name: suffix or None
+        self._fingerprint = None  # model structure the lookup is for
+
+    def _is_current(self, sd):
+        if self._select is None:
+            return False
+        for kind in _NPZ_KINDS:
+            if not np.array_equal(self._names[kind], sd[f"{kind}_names"]):
+                return False
+        return self._fingerprint == _model_fingerprint(self.o)
+
+    def build(self, sd):
+        """
+        Match the model components to the names in a stored state. This is
+        called by load() when needed, so it does not usually need to be
+        called directly.
+
+        Args:
+            sd: Dictionary of arrays returned by to_npz
+
+        Returns:
+            None
+        """
+        comps = _npz_components(self.o)
+        self._select = {}
+        self._by_position = {}
+        self._names = {}
+        for kind in _NPZ_KINDS:
+            objs, names = comps[kind]
+            stored_names = sd[f"{kind}_names"]
+            pos = _npz_positions(names, stored_names)
+            objs, idx = _npz_select(objs, pos)
+            self._select[kind] = (objs, idx)
+            if pos is None:
+                self._by_position[kind] = objs
+            else:
+                by_position = [None] * len(stored_names)
+                for c, j in zip(objs, idx.tolist()):
+                    by_position[j] = c
+                self._by_position[kind] = by_position
+            self._names[kind] = stored_names
+        self._suffixes = {}
+        self._fingerprint = _model_fingerprint(self.o)
+
+    def load(self, fname=None, sd=None):
+        """
+        Load a model state saved by to_npz, see from_npz.
+
+        Args:
+            fname: .npz file name or file object to load, only used if sd is
+                None
+            sd: Dictionary of arrays returned by to_npz
+
+        Returns:
+            Dictionary with some perfomance information, with the same keys as
+            from_npz, and "etime_build", how long in seconds it took to match
+            the component names (0 if the cached lookup was used).
+        """
+        start_time = time.time()
+        if sd is None:
+            if fname is None:
+                raise Exception("Need to specify a data source to load from")
+            with np.load(fname) as f:
+                sd = {k: f[k] for k in f.files}
+        file_time = time.time()
+        if not self._is_current(sd):
+            self.build(sd)
+        build_time = time.time()
+
+        objs, idx = self._select["var"]
+        for v, lb, ub, fixed, val in zip(
+            objs,
+            _nan_to_none(sd["var_lb"][idx]),
+            _nan_to_none(sd["var_ub"][idx]),
+            sd["var_fixed"][idx].tolist(),
+            _nan_to_none(sd["var_value"][idx]),
+        ):
+            v.setlb(lb)
+            v.setub(ub)
+            v.fixed = fixed
+            v.set_value(val, skip_validation=True)
+        objs, idx = self._select["param"]
+        for p, val in zip(objs, _nan_to_none(sd["param_value"][idx])):
+            p.value = val
+        for kind in ("constraint", "block"):
+            objs, idx = self._select[kind]
+            for c, active in zip(objs, sd[f"{kind}_active"][idx].tolist()):
+                _set_active(c, active)
+
+        for j, sname in enumerate(sd["suffix_names"].tolist()):
+            if sname not in self._suffixes:
+                self._suffixes[sname] = self.o.find_component(sname)
+            suf = self._suffixes[sname]
+            if suf is None:
+                continue
+            for kind in ("var", "constraint"):
+                by_position = self._by_position[kind]
+                # tolist() gives Python values of the stored type
+                for i, val in zip(
+                    sd[f"suffix{j}_{kind}_index"].tolist(),
+                    sd[f"suffix{j}_{kind}_value"].tolist(),
+                ):
+                    if by_position[i] is not None:
+                        suf[by_position[i]] = val
+        read_time = time.time()
+        return {
+            "etime_load_file": file_time - start_time,
+            "etime_build": build_time - file_time,
+            "etime_read_arrays": read_time - build_time,
+        }
+
+
+def from_npz(o, fname=None, sd=None):
+    """
+    Load a model state saved by to_npz. Components in the model that are not
+    in the saved state are left unchanged, and extra items in the saved state
+    are ignored. To load states into the same model repeatedly, use an
+    NpzStateLoader, which only looks up the model components once.
+
+    Args:
+        o: Pyomo block to load the state into
+        fname: .npz file name or file object to load, only used if sd is None
+        sd: Dictionary of arrays returned by to_npz
+
+    Returns:
+        Dictionary with some perfomance information. The keys are
+        "etime_load_file", how long in seconds it took to load the file,
+        "etime_build", how long in seconds it took to look up the model
+        components, and "etime_read_arrays", how long in seconds it took to
+        read the state
+    """
+    return NpzStateLoader(o).load(fname=fname, sd=sd)
@@ -20,10 +20,13 @@ __author__ = "Andrew Lee"
 
 import sys
 
+import numpy as np
+
 from pyomo.environ import Block, Constraint, Expression, Objective, Var, value
 from pyomo.dae import DerivativeVar
 from pyomo.core.expr.current import identify_variables
-from pyomo.common.collections import ComponentSet
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.common.modeling import unique_component_name
 
 
 # -------------------------------------------------------------------------
@@ -1284,9 +1287,14 @@ def degrees_of_freedom(block):
     Returns:
         Number of degrees of freedom in block.
     """
-    return number_unfixed_variables_in_activated_equalities(
-        block
-    ) - number_activated_equalities(block)
+    # Count equalities and collect their unfixed variables in a single pass
+    n_eq = 0
+    var_set = ComponentSet()
+    for c in activated_equalities_generator(block):
+        n_eq += 1
+        for v in identify_variables(c.body, include_fixed=False):
+            var_set.add(v)
+    return len(var_set) - n_eq
 
 
 def large_residuals_set(block, tol=1e-5, return_residual_values=False):
@@ -1307,45 +1315,13 @@ def large_residuals_set(block, tol=1e-5, return_residual_values=False):
         constraint as key and residual (float) as value (if
         return_residual_values is true)
     """
-    large_residuals_set = ComponentSet()
-    if return_residual_values:
-        residual_values = dict()
-    for c in block.component_data_objects(
-        ctype=Constraint, active=True, descend_into=True
-    ):
-
-        r = 0.0  # residual
-
-        # skip if no lower bound set
-        if c.lower is None:
-            r_temp = 0
-        else:
-            r_temp = value(c.lower - c.body())
-        # update the residual
-        if r_temp > r:
-            r = r_temp
-
-        # skip if no upper bound set
-        if c.upper is None:
-            r_temp = 0
-        else:
-            r_temp = value(c.body() - c.upper)
-
-        # update the residual
-        if r_temp > r:
-            r = r_temp
-
-        # save residual if it is above threshold
-        if r > tol:
-            large_residuals_set.add(c)
-
-            if return_residual_values:
-                residual_values[c] = r
-
+    residual_values = ResidualEvaluator(block, use_nlp=False).large_residuals(
+        tol=tol
+    )
     if return_residual_values:
-        return residual_values
+        return dict(residual_values.items())
     else:
-        return large_residuals_set
+        return ComponentSet(residual_values.keys())
 
 
 def number_large_residuals(block, tol=1e-5):
@@ -1361,15 +1337,191 @@ def number_large_residuals(block, tol=1e-5):
         Number of Constraint components with a residual greater than tol which
         appear in block
     """
-    lr = 0
-    for c in block.component_data_objects(
-        ctype=Constraint, active=True, descend_into=True
-    ):
-        if c.active and value(c.lower - c.body()) > tol:
-            lr += 1
-        elif c.active and value(c.body() - c.upper) > tol:
-            lr += 1
-    return lr
+    residuals = ResidualEvaluator(block, use_nlp=False).evaluate()
+    return int(np.count_nonzero(residuals > tol))
+
+
+class ResidualEvaluator(object):
+    """
+    Class for repeatedly evaluating the residuals of all active Constraints in
+    a model as a single NumPy vector.
+
+    The active Constraints and their bounds are collected once on
+    construction. If the PyNumero ASL interface is available, the Constraint
+    bodies are also compiled once into a PyomoNLP, so each evaluation only
+    requires loading the current Var values and a single call into the
+    compiled evaluator. Otherwise, each Constraint body is evaluated once per
+    call in Python.
+
+    Bounds (and, when compiled, bodies) use the values of mutable Params at
+    the time they were collected; call ``refresh`` after changing them.
+
+    The residual of a Constraint is the amount by which its body violates
+    its lower or upper bound (zero if both bounds are satisfied).
+
+    Args:
+        block : model to be studied
+        use_nlp : if True, compile Constraint bodies with PyNumero (raising an
+            exception if this is not possible), if False always evaluate in
+            Python. If None (default), use PyNumero if the ASL interface is
+            available and the model has at most one active Objective.
+    """
+
+    def __init__(self, block, use_nlp=None):
+        self.block = block
+        self.constraints = list(
+            block.component_data_objects(
+                ctype=Constraint, active=True, descend_into=True
+            )
+        )
+        self._read_bounds()
+
+        self.nlp = None
+        if use_nlp is None:
+            from pyomo.contrib.pynumero.asl import AmplInterface
+
+            use_nlp = (
+                len(self.constraints) > 0
+                and AmplInterface.available()
+                and number_activated_objectives(block) <= 1
+            )
+        if use_nlp:
+            self._build_nlp()
+
+    def refresh(self):
+        """
+        Read the bounds of the Constraints again, and compile their bodies
+        again if PyNumero is used, e.g. after changing the values of mutable
+        Params. The Constraints themselves are not collected again.
+
+        Returns:
+            None
+        """
+        self._read_bounds()
+        if self.nlp is not None:
+            self._build_nlp()
+
+    def _read_bounds(self):
+        nc = len(self.constraints)
+        self._lower = np.fromiter(
+            (
+                -np.inf if c.lower is None else value(c.lower)
+                for c in self.constraints
+            ),
+            float,
+            nc,
+        )
+        self._upper = np.fromiter(
+            (
+                np.inf if c.upper is None else value(c.upper)
+                for c in self.constraints
+            ),
+            float,
+            nc,
+        )
+
+    def _build_nlp(self):
+        from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
+
+        # PyNumero requires exactly one active objective, so add a dummy
+        # objective if there isn't one
+        dummy_objective_name = None
+        if number_activated_objectives(self.block) == 0:
+            dummy_objective_name = unique_component_name(self.block, "objective")
+            self.block.add_component(dummy_objective_name, Objective(expr=0))
+        try:
+            self.nlp = PyomoNLP(self.block)
+        finally:
+            if dummy_objective_name is not None:
+                self.block.del_component(dummy_objective_name)
+
+        self._nlp_vars = self.nlp.get_pyomo_variables()
+        con_index = ComponentMap((c, i) for i, c in enumerate(self.constraints))
+        self._nlp_con_index = np.array(
+            [con_index[c] for c in self.nlp.get_pyomo_constraints()], dtype=int
+        )
+        # Constants in the bodies are moved into the bounds in the compiled
+        # problem, so use the bounds reported by the NLP
+        self._nlp_lower = self.nlp.constraints_lb()
+        self._nlp_upper = self.nlp.constraints_ub()
+        # Any Constraints not included in the compiled problem are evaluated
+        # in Python
+        in_nlp = np.zeros(len(self.constraints), dtype=bool)
+        in_nlp[self._nlp_con_index] = True
+        self._python_con_index = np.flatnonzero(~in_nlp)
+
+    def _python_residuals(self, index):
+        body = np.fromiter(
+            (value(self.constraints[i].body) for i in index), float, len(index)
+        )
+        return np.maximum(
+            np.maximum(self._lower[index] - body, body - self._upper[index]), 0.0
+        )
+
+    def evaluate(self):
+        """
+        Evaluate the residuals of all active Constraints at the current Var
+        values.
+
+        Returns:
+            NumPy array of residuals, ordered as in the constraints attribute
+        """
+        if self.nlp is None:
+            return self._python_residuals(np.arange(len(self.constraints)))
+
+        self.nlp.set_primals(
+            np.fromiter(
+                (np.nan if v.value is None else v.value for v in self._nlp_vars),
+                float,
+                len(self._nlp_vars),
+            )
+        )
+        body = self.nlp.evaluate_constraints()
+        residuals = np.empty(len(self.constraints), dtype=float)
+        residuals[self._nlp_con_index] = np.maximum(
+            np.maximum(self._nlp_lower - body, body - self._nlp_upper), 0.0
+        )
+        if len(self._python_con_index) > 0:
+            residuals[self._python_con_index] = self._python_residuals(
+                self._python_con_index
+            )
+        return residuals
+
+    def large_residuals(self, tol=1e-5):
+        """
+        Get all active Constraints with a residual greater than a given
+        threshold.
+
+        Args:
+            tol : residual threshold for inclusion
+
+        Returns:
+            ComponentMap with Constraints as keys and residuals as values
+        """
+        residuals = self.evaluate()
+        return ComponentMap(
+            (self.constraints[i], float(residuals[i]))
+            for i in np.flatnonzero(residuals > tol)
+        )
+
+    def top_residuals(self, k=10, tol=0):
+        """
+        Get the active Constraints with the largest residuals.
+
+        Args:
+            k : maximum number of Constraints to return
+            tol : only include Constraints with a residual greater than tol
+
+        Returns:
+            list of (Constraint, residual) tuples in descending order of
+            residual
+        """
+        residuals = self.evaluate()
+        index = np.flatnonzero(residuals > tol)
+        if k < len(index):
+            index = index[np.argpartition(-residuals[index], k - 1)[:k]]
+        index = index[np.argsort(-residuals[index], kind="stable")]
+        return [(self.constraints[i], float(residuals[i])) for i in index]
 
 
 def active_variables_in_deactivated_blocks_set(block):
@@ -1420,73 +1572,767 @@ def report_statistics(block, ostream=None):
     Returns:
         Printed output of the model statistics
     """
-    if ostream is None:
-        ostream = sys.stdout
+    # Collect all statistics in a single pass over the model
+    ModelStatisticsSnapshot(block).report_statistics(ostream=ostream)
 
-    tab = " " * 4
-    header = "=" * 72
 
-    if block.name == "unknown":
-        name_str = ""
-    else:
-        name_str = f"-  {block.name}"
-
-    ostream.write("\n")
-    ostream.write(header + "\n")
-    ostream.write(f"Model Statistics  {name_str} \n")
-    ostream.write("\n")
-    ostream.write(f"Degrees of Freedom: " f"{degrees_of_freedom(block)} \n")
-    ostream.write("\n")
-    ostream.write(f"Total No. Variables: " f"{number_variables(block)} \n")
-    ostream.write(
-        f"{tab}No. Fixed Variables: " f"{number_fixed_variables(block)}" f"\n"
-    )
-    ostream.write(
-        f"{tab}No. Unused Variables: "
-        f"{number_unused_variables(block)} (Fixed):"
-        f"{number_fixed_unused_variables(block)})"
-        f"\n"
-    )
-    nv_alias = number_variables_only_in_inequalities
-    nfv_alias = number_fixed_variables_only_in_inequalities
-    ostream.write(
-        f"{tab}No. Variables only in Inequalities:"
-        f" {nv_alias(block)}"
-        f" (Fixed: {nfv_alias(block)}) \n"
-    )
-    ostream.write("\n")
-    ostream.write(f"Total No. Constraints: " f"{number_total_constraints(block)} \n")
-    ostream.write(
-        f"{tab}No. Equality Constraints: "
-        f"{number_total_equalities(block)}"
-        f" (Deactivated: "
-        f"{number_deactivated_equalities(block)})"
-        f"\n"
-    )
-    ostream.write(
-        f"{tab}No. Inequality Constraints: "
-        f"{number_total_inequalities(block)}"
-        f" (Deactivated: "
-        f"{number_deactivated_inequalities(block)})"
-        f"\n"
-    )
-    ostream.write("\n")
-    ostream.write(
-        f"No. Objectives: "
-        f"{number_total_objectives(block)}"
-        f" (Deactivated: "
-        f"{number_deactivated_objectives(block)})"
-        f"\n"
-    )
-    ostream.write("\n")
-    ostream.write(
-        f"No. Blocks: {number_total_blocks(block)}"
-        f" (Deactivated: "
-        f"{number_deactivated_blocks(block)}) \n"
-    )
-    ostream.write(f"No. Expressions: " f"{number_expressions(block)} \n")
-    ostream.write(header + "\n")
-    ostream.write("\n")
+# -------------------------------------------------------------------------
+# Snapshot of model statistics
+class ModelStatisticsSnapshot(object):
+    """
+    Class which collects the structure of a model in a single pass and answers
+    the queries provided by the functions in this module from NumPy arrays.
+
+    On construction, the block tree is walked once to index all Blocks,
+    Vars, Constraints, Objectives and Expressions, and the variable incidence
+    of every Constraint body is recorded. The fixed, active and bound state of
+    these components is then stored in arrays, so that each query reduces to
+    a few array operations instead of a new walk of the model.
+
+    If only the state of the model has changed (fixing or unfixing Vars,
+    changing bounds or values, or activating and deactivating Blocks,
+    Constraints and Objectives), call ``refresh`` to update the state arrays
+    without rebuilding the incidence. If the structure of the model has
+    changed (new components or modified Constraint expressions), call
+    ``build`` instead.
+
+    Args:
+        block : model to be studied
+    """
+
+    def __init__(self, block):
+        self.block = block
+        self.build()
+
+    def build(self):
+        """
+        Walk the model to index all components and Constraint incidence, then
+        collect the current state of the model.
+
+        Returns:
+            None
+        """
+        block_map = ComponentMap()
+        block_map[self.block] = 0
+        self._blocks = [self.block]
+        block_parent = [-1]
+
+        var_map = ComponentMap()
+        self._vars = []
+        var_apps = []
+        self._constraints = []
+        con_block = []
+        self._objectives = []
+        obj_block = []
+        self._expressions = []
+        expr_block = []
+        self._derivative_vars = []
+        dvar_block = []
+        seen = ComponentSet()
+
+        # Breadth-first walk over all Blocks, recording the Block each
+        # component was found in so that activity can be resolved later
+        i = 0
+        while i < len(self._blocks):
+            b = self._blocks[i]
+            for sb in b.component_data_objects(
+                ctype=Block, active=None, descend_into=False
+            ):
+                if sb not in block_map:
+                    block_map[sb] = len(self._blocks)
+                    self._blocks.append(sb)
+                    block_parent.append(i)
+            for v in b.component_data_objects(
+                ctype=Var, active=None, descend_into=False
+            ):
+                if v not in var_map:
+                    var_map[v] = len(self._vars)
+                    self._vars.append(v)
+                var_apps.append((var_map[v], i))
+            for c in b.component_data_objects(
+                ctype=Constraint, active=None, descend_into=False
+            ):
+                if c not in seen:
+                    seen.add(c)
+                    self._constraints.append(c)
+                    con_block.append(i)
+            for o in b.component_data_objects(
+                ctype=Objective, active=None, descend_into=False
+            ):
+                if o not in seen:
+                    seen.add(o)
+                    self._objectives.append(o)
+                    obj_block.append(i)
+            for e in b.component_data_objects(
+                ctype=Expression, active=None, descend_into=False
+            ):
+                if e not in seen:
+                    seen.add(e)
+                    self._expressions.append(e)
+                    expr_block.append(i)
+            for v in b.component_data_objects(
+                ctype=DerivativeVar, active=None, descend_into=False
+            ):
+                if v not in seen:
+                    seen.add(v)
+                    self._derivative_vars.append(v)
+                    dvar_block.append(i)
+            i += 1
+
+        # Record incidence of all Constraints, including deactivated ones, so
+        # that refresh can handle changes in Constraint activity. Vars which
+        # are not part of the model are indexed, but never counted as part of
+        # it.
+        inc_len = []
+        inc_vars = []
+        for c in self._constraints:
+            n = 0
+            for v in identify_variables(c.body):
+                if v not in var_map:
+                    var_map[v] = len(self._vars)
+                    self._vars.append(v)
+                inc_vars.append(var_map[v])
+                n += 1
+            inc_len.append(n)
+
+        self._block_parent = np.array(block_parent, dtype=int)
+        self._var_app_var = np.array([a[0] for a in var_apps], dtype=int)
+        self._var_app_block = np.array([a[1] for a in var_apps], dtype=int)
+        self._var_parent = np.array(
+            [block_map.get(v.parent_block(), -1) for v in self._vars], dtype=int
+        )
+        self._con_block = np.array(con_block, dtype=int)
+        self._inc_len = np.array(inc_len, dtype=int)
+        self._inc_vars = np.array(inc_vars, dtype=int)
+        self._obj_block = np.array(obj_block, dtype=int)
+        self._expr_block = np.array(expr_block, dtype=int)
+        self._dvar_block = np.array(dvar_block, dtype=int)
+
+        self.refresh()
+
+    def refresh(self):
+        """
+        Update the fixed, active, bound and value state of all indexed
+        components without walking the model or Constraint expressions again.
+
+        Returns:
+            None
+        """
+        nv = len(self._vars)
+        self._var_fixed = np.fromiter((v.fixed for v in self._vars), bool, nv)
+        self._var_lb = np.fromiter(
+            (np.nan if v.lb is None else v.lb for v in self._vars), float, nv
+        )
+        self._var_ub = np.fromiter(
+            (np.nan if v.ub is None else v.ub for v in self._vars), float, nv
+        )
+        self._var_value = np.fromiter(
+            (np.nan if v.value is None else v.value for v in self._vars),
+            float,
+            nv,
+        )
+
+        nc = len(self._constraints)
+        self._con_active = np.fromiter(
+            (c.active for c in self._constraints), bool, nc
+        )
+        self._con_has_lb = np.fromiter(
+            (c.lower is not None for c in self._constraints), bool, nc
+        )
+        self._con_has_ub = np.fromiter(
+            (c.upper is not None for c in self._constraints), bool, nc
+        )
+        self._con_equality = np.fromiter(
+            (
+                c.upper is not None
+                and c.lower is not None
+                and value(c.upper) == value(c.lower)
+                for c in self._constraints
+            ),
+            bool,
+            nc,
+        )
+        self._obj_active = np.fromiter(
+            (o.active for o in self._objectives), bool, len(self._objectives)
+        )
+
+        # A Block is part of the active model if it and all of its parents are
+        # active. Parents are always indexed before their children.
+        nb = len(self._blocks)
+        block_active = np.fromiter((b.active for b in self._blocks), bool, nb)
+        tree_active = block_active.copy()
+        for i in range(1, nb):
+            tree_active[i] &= tree_active[self._block_parent[i]]
+        self._block_tree_active = tree_active
+        # activated_block_component_generator always includes the local
+        # components of the top level block
+        self._block_gen = tree_active.copy()
+        self._block_gen[0] = True
+
+        var_in_model = np.zeros(nv, dtype=bool)
+        var_in_model[self._var_app_var[tree_active[self._var_app_block]]] = True
+        self._var_in_model = var_in_model
+
+    # -------------------------------------------------------------------------
+    # Internal helpers
+    @staticmethod
+    def _component_set(components, mask):
+        return ComponentSet(components[i] for i in np.flatnonzero(mask))
+
+    def _vars_in_constraints(self, con_mask):
+        mask = np.zeros(len(self._vars), dtype=bool)
+        mask[self._inc_vars[np.repeat(con_mask, self._inc_len)]] = True
+        return mask
+
+    def _total_con_mask(self):
+        return self._block_gen[self._con_block]
+
+    def _activated_con_mask(self):
+        # Matches component_data_objects(Constraint, active=True)
+        return self._con_active & self._block_tree_active[self._con_block]
+
+    def _equality_mask(self):
+        return self._con_equality
+
+    def _inequality_mask(self):
+        return ~(self._con_has_lb & self._con_has_ub)
+
+    def _variables_near_bounds_mask(
+        self, tol=1e-4, relative=True, skip_lb=False, skip_ub=False
+    ):
+        lb = self._var_lb
+        ub = self._var_ub
+        val = self._var_value
+        has_lb = ~np.isnan(lb)
+        has_ub = ~np.isnan(ub)
+        candidates = self._var_in_model & ~np.isnan(val)
+
+        with np.errstate(invalid="ignore"):
+            if relative:
+                atol = np.where(
+                    has_lb & has_ub,
+                    (ub - lb) * tol,
+                    np.where(has_ub, np.abs(ub * tol), np.abs(lb * tol)),
+                )
+                candidates &= has_lb | has_ub
+            else:
+                atol = np.full(len(self._vars), tol, dtype=float)
+
+            # Mirrors the checks in variables_near_bounds_generator
+            near_ub = has_ub & (ub - val <= atol)
+            near_lb = has_lb & (val - lb <= atol)
+        if skip_lb:
+            near_ub[:] = False
+        if skip_ub:
+            near_lb[:] = False
+        return candidates & (near_ub | near_lb)
+
+    # -------------------------------------------------------------------------
+    # Block methods
+    def total_blocks_set(self):
+        """Snapshot version of :func:`total_blocks_set`"""
+        return ComponentSet(self._blocks)
+
+    def number_total_blocks(self):
+        """Snapshot version of :func:`number_total_blocks`"""
+        return len(self._blocks)
+
+    def activated_blocks_set(self):
+        """Snapshot version of :func:`activated_blocks_set`"""
+        return self._component_set(self._blocks, self._block_tree_active)
+
+    def number_activated_blocks(self):
+        """Snapshot version of :func:`number_activated_blocks`"""
+        return int(np.count_nonzero(self._block_tree_active))
+
+    def deactivated_blocks_set(self):
+        """Snapshot version of :func:`deactivated_blocks_set`"""
+        return self._component_set(self._blocks, ~self._block_tree_active)
+
+    def number_deactivated_blocks(self):
+        """Snapshot version of :func:`number_deactivated_blocks`"""
+        return int(np.count_nonzero(~self._block_tree_active))
+
+    # -------------------------------------------------------------------------
+    # Basic Constraint methods
+    def total_constraints_set(self):
+        """Snapshot version of :func:`total_constraints_set`"""
+        return self._component_set(self._constraints, self._total_con_mask())
+
+    def number_total_constraints(self):
+        """Snapshot version of :func:`number_total_constraints`"""
+        return int(np.count_nonzero(self._total_con_mask()))
+
+    def activated_constraints_set(self):
+        """Snapshot version of :func:`activated_constraints_set`"""
+        return self._component_set(
+            self._constraints, self._total_con_mask() & self._con_active
+        )
+
+    def number_activated_constraints(self):
+        """Snapshot version of :func:`number_activated_constraints`"""
+        return int(np.count_nonzero(self._total_con_mask() & self._con_active))
+
+    def deactivated_constraints_set(self):
+        """Snapshot version of :func:`deactivated_constraints_set`"""
+        return self._component_set(
+            self._constraints, self._total_con_mask() & ~self._con_active
+        )
+
+    def number_deactivated_constraints(self):
+        """Snapshot version of :func:`number_deactivated_constraints`"""
+        return int(np.count_nonzero(self._total_con_mask() & ~self._con_active))
+
+    # -------------------------------------------------------------------------
+    # Equality Constraints
+    def total_equalities_set(self):
+        """Snapshot version of :func:`total_equalities_set`"""
+        return self._component_set(
+            self._constraints, self._total_con_mask() & self._equality_mask()
+        )
+
+    def number_total_equalities(self):
+        """Snapshot version of :func:`number_total_equalities`"""
+        return int(
+            np.count_nonzero(self._total_con_mask() & self._equality_mask())
+        )
+
+    def activated_equalities_set(self):
+        """Snapshot version of :func:`activated_equalities_set`"""
+        return self._component_set(
+            self._constraints, self._activated_con_mask() & self._equality_mask()
+        )
+
+    def number_activated_equalities(self):
+        """Snapshot version of :func:`number_activated_equalities`"""
+        return int(
+            np.count_nonzero(self._activated_con_mask() & self._equality_mask())
+        )
+
+    def deactivated_equalities_set(self):
+        """Snapshot version of :func:`deactivated_equalities_set`"""
+        return self._component_set(
+            self._constraints,
+            self._total_con_mask() & self._equality_mask() & ~self._con_active,
+        )
+
+    def number_deactivated_equalities(self):
+        """Snapshot version of :func:`number_deactivated_equalities`"""
+        return int(
+            np.count_nonzero(
+                self._total_con_mask() & self._equality_mask() & ~self._con_active
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    # Inequality Constraints
+    def total_inequalities_set(self):
+        """Snapshot version of :func:`total_inequalities_set`"""
+        return self._component_set(
+            self._constraints, self._total_con_mask() & self._inequality_mask()
+        )
+
+    def number_total_inequalities(self):
+        """Snapshot version of :func:`number_total_inequalities`"""
+        return int(
+            np.count_nonzero(self._total_con_mask() & self._inequality_mask())
+        )
+
+    def activated_inequalities_set(self):
+        """Snapshot version of :func:`activated_inequalities_set`"""
+        return self._component_set(
+            self._constraints,
+            self._activated_con_mask() & self._inequality_mask(),
+        )
+
+    def number_activated_inequalities(self):
+        """Snapshot version of :func:`number_activated_inequalities`"""
+        return int(
+            np.count_nonzero(self._activated_con_mask() & self._inequality_mask())
+        )
+
+    def deactivated_inequalities_set(self):
+        """Snapshot version of :func:`deactivated_inequalities_set`"""
+        return self._component_set(
+            self._constraints,
+            self._total_con_mask() & self._inequality_mask() & ~self._con_active,
+        )
+
+    def number_deactivated_inequalities(self):
+        """Snapshot version of :func:`number_deactivated_inequalities`"""
+        return int(
+            np.count_nonzero(
+                self._total_con_mask()
+                & self._inequality_mask()
+                & ~self._con_active
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    # Basic Variable Methods
+    def variables_set(self):
+        """Snapshot version of :func:`variables_set`"""
+        return self._component_set(self._vars, self._var_in_model)
+
+    def number_variables(self):
+        """Snapshot version of :func:`number_variables`"""
+        return int(np.count_nonzero(self._var_in_model))
+
+    def fixed_variables_set(self):
+        """Snapshot version of :func:`fixed_variables_set`"""
+        return self._component_set(
+            self._vars, self._var_in_model & self._var_fixed
+        )
+
+    def number_fixed_variables(self):
+        """Snapshot version of :func:`number_fixed_variables`"""
+        return int(np.count_nonzero(self._var_in_model & self._var_fixed))
+
+    def unfixed_variables_set(self):
+        """Snapshot version of :func:`unfixed_variables_set`"""
+        return self._component_set(
+            self._vars, self._var_in_model & ~self._var_fixed
+        )
+
+    def number_unfixed_variables(self):
+        """Snapshot version of :func:`number_unfixed_variables`"""
+        return int(np.count_nonzero(self._var_in_model & ~self._var_fixed))
+
+    def variables_near_bounds_set(
+        self, tol=1e-4, relative=True, skip_lb=False, skip_ub=False
+    ):
+        """Snapshot version of :func:`variables_near_bounds_set`"""
+        return self._component_set(
+            self._vars,
+            self._variables_near_bounds_mask(tol, relative, skip_lb, skip_ub),
+        )
+
+    def number_variables_near_bounds(self, tol=1e-4):
+        """Snapshot version of :func:`number_variables_near_bounds`"""
+        return int(np.count_nonzero(self._variables_near_bounds_mask(tol)))
+
+    # -------------------------------------------------------------------------
+    # Variables in Constraints
+    def variables_in_activated_constraints_set(self):
+        """Snapshot version of :func:`variables_in_activated_constraints_set`"""
+        return self._component_set(
+            self._vars, self._vars_in_constraints(self._activated_con_mask())
+        )
+
+    def number_variables_in_activated_constraints(self):
+        """
+        Snapshot version of :func:`number_variables_in_activated_constraints`
+        """
+        return int(
+            np.count_nonzero(
+                self._vars_in_constraints(self._activated_con_mask())
+            )
+        )
+
+    def _vars_in_activated_equalities(self):
+        return self._vars_in_constraints(
+            self._activated_con_mask() & self._equality_mask()
+        )
+
+    def _vars_in_activated_inequalities(self):
+        return self._vars_in_constraints(
+            self._activated_con_mask() & self._inequality_mask()
+        )
+
+    def _vars_only_in_inequalities(self):
+        return (
+            self._vars_in_activated_inequalities()
+            & ~self._vars_in_activated_equalities()
+        )
+
+    def variables_in_activated_equalities_set(self):
+        """Snapshot version of :func:`variables_in_activated_equalities_set`"""
+        return self._component_set(
+            self._vars, self._vars_in_activated_equalities()
+        )
+
+    def number_variables_in_activated_equalities(self):
+        """
+        Snapshot version of :func:`number_variables_in_activated_equalities`
+        """
+        return int(np.count_nonzero(self._vars_in_activated_equalities()))
+
+    def variables_in_activated_inequalities_set(self):
+        """
+        Snapshot version of :func:`variables_in_activated_inequalities_set`
+        """
+        return self._component_set(
+            self._vars, self._vars_in_activated_inequalities()
+        )
+
+    def number_variables_in_activated_inequalities(self):
+        """
+        Snapshot version of :func:`number_variables_in_activated_inequalities`
+        """
+        return int(np.count_nonzero(self._vars_in_activated_inequalities()))
+
+    def variables_only_in_inequalities(self):
+        """Snapshot version of :func:`variables_only_in_inequalities`"""
+        return self._component_set(self._vars, self._vars_only_in_inequalities())
+
+    def number_variables_only_in_inequalities(self):
+        """Snapshot version of :func:`number_variables_only_in_inequalities`"""
+        return int(np.count_nonzero(self._vars_only_in_inequalities()))
+
+    # -------------------------------------------------------------------------
+    # Fixed Variables in Constraints
+    def fixed_variables_in_activated_equalities_set(self):
+        """
+        Snapshot version of :func:`fixed_variables_in_activated_equalities_set`
+        """
+        return self._component_set(
+            self._vars, self._vars_in_activated_equalities() & self._var_fixed
+        )
+
+    def number_fixed_variables_in_activated_equalities(self):
+        """
+        Snapshot version of
+        :func:`number_fixed_variables_in_activated_equalities`
+        """
+        return int(
+            np.count_nonzero(
+                self._vars_in_activated_equalities() & self._var_fixed
+            )
+        )
+
+    def unfixed_variables_in_activated_equalities_set(self):
+        """
+        Snapshot version of
+        :func:`unfixed_variables_in_activated_equalities_set`
+        """
+        return self._component_set(
+            self._vars, self._vars_in_activated_equalities() & ~self._var_fixed
+        )
+
+    def number_unfixed_variables_in_activated_equalities(self):
+        """
+        Snapshot version of
+        :func:`number_unfixed_variables_in_activated_equalities`
+        """
+        return int(
+            np.count_nonzero(
+                self._vars_in_activated_equalities() & ~self._var_fixed
+            )
+        )
+
+    def fixed_variables_only_in_inequalities(self):
+        """Snapshot version of :func:`fixed_variables_only_in_inequalities`"""
+        return self._component_set(
+            self._vars, self._vars_only_in_inequalities() & self._var_fixed
+        )
+
+    def number_fixed_variables_only_in_inequalities(self):
+        """
+        Snapshot version of :func:`number_fixed_variables_only_in_inequalities`
+        """
+        return int(
+            np.count_nonzero(self._vars_only_in_inequalities() & self._var_fixed)
+        )
+
+    # -------------------------------------------------------------------------
+    # Unused and un-Transformed Variables
+    def _unused_variables(self):
+        return self._var_in_model & ~self._vars_in_constraints(
+            self._activated_con_mask()
+        )
+
+    def unused_variables_set(self):
+        """Snapshot version of :func:`unused_variables_set`"""
+        return self._component_set(self._vars, self._unused_variables())
+
+    def number_unused_variables(self):
+        """Snapshot version of :func:`number_unused_variables`"""
+        return int(np.count_nonzero(self._unused_variables()))
+
+    def fixed_unused_variables_set(self):
+        """Snapshot version of :func:`fixed_unused_variables_set`"""
+        return self._component_set(
+            self._vars, self._unused_variables() & self._var_fixed
+        )
+
+    def number_fixed_unused_variables(self):
+        """Snapshot version of :func:`number_fixed_unused_variables`"""
+        return int(np.count_nonzero(self._unused_variables() & self._var_fixed))
+
+    def derivative_variables_set(self):
+        """Snapshot version of :func:`derivative_variables_set`"""
+        return self._component_set(
+            self._derivative_vars, self._block_tree_active[self._dvar_block]
+        )
+
+    def number_derivative_variables(self):
+        """Snapshot version of :func:`number_derivative_variables`"""
+        return int(np.count_nonzero(self._block_tree_active[self._dvar_block]))
+
+    # -------------------------------------------------------------------------
+    # Objective methods
+    def total_objectives_set(self):
+        """Snapshot version of :func:`total_objectives_set`"""
+        return self._component_set(
+            self._objectives, self._block_gen[self._obj_block]
+        )
+
+    def number_total_objectives(self):
+        """Snapshot version of :func:`number_total_objectives`"""
+        return int(np.count_nonzero(self._block_gen[self._obj_block]))
+
+    def activated_objectives_set(self):
+        """Snapshot version of :func:`activated_objectives_set`"""
+        return self._component_set(
+            self._objectives, self._block_gen[self._obj_block] & self._obj_active
+        )
+
+    def number_activated_objectives(self):
+        """Snapshot version of :func:`number_activated_objectives`"""
+        return int(
+            np.count_nonzero(self._block_gen[self._obj_block] & self._obj_active)
+        )
+
+    def deactivated_objectives_set(self):
+        """Snapshot version of :func:`deactivated_objectives_set`"""
+        return self._component_set(
+            self._objectives, self._block_gen[self._obj_block] & ~self._obj_active
+        )
+
+    def number_deactivated_objectives(self):
+        """Snapshot version of :func:`number_deactivated_objectives`"""
+        return int(
+            np.count_nonzero(self._block_gen[self._obj_block] & ~self._obj_active)
+        )
+
+    # -------------------------------------------------------------------------
+    # Expression methods
+    def expressions_set(self):
+        """Snapshot version of :func:`expressions_set`"""
+        return self._component_set(
+            self._expressions, self._block_tree_active[self._expr_block]
+        )
+
+    def number_expressions(self):
+        """Snapshot version of :func:`number_expressions`"""
+        return int(np.count_nonzero(self._block_tree_active[self._expr_block]))
+
+    # -------------------------------------------------------------------------
+    # Other model statistics
+    def degrees_of_freedom(self):
+        """Snapshot version of :func:`degrees_of_freedom`"""
+        return (
+            self.number_unfixed_variables_in_activated_equalities()
+            - self.number_activated_equalities()
+        )
+
+    def _active_variables_in_deactivated_blocks(self):
+        parent = self._var_parent
+        in_active_block = np.zeros(len(self._vars), dtype=bool)
+        known = parent >= 0
+        in_active_block[known] = self._block_tree_active[parent[known]]
+        return (
+            self._vars_in_constraints(self._activated_con_mask())
+            & ~in_active_block
+        )
+
+    def active_variables_in_deactivated_blocks_set(self):
+        """
+        Snapshot version of :func:`active_variables_in_deactivated_blocks_set`
+        """
+        return self._component_set(
+            self._vars, self._active_variables_in_deactivated_blocks()
+        )
+
+    def number_active_variables_in_deactivated_blocks(self):
+        """
+        Snapshot version of
+        :func:`number_active_variables_in_deactivated_blocks`
+        """
+        return int(np.count_nonzero(self._active_variables_in_deactivated_blocks()))
+
+    # -------------------------------------------------------------------------
+    # Reporting methods
+    def report_statistics(self, ostream=None):
+        """
+        Method to print a report of the model statistics for the Pyomo Block
+        in this snapshot.
+
+        Args:
+            ostream : output stream for printing (defaults to sys.stdout)
+
+        Returns:
+            Printed output of the model statistics
+        """
+        if ostream is None:
+            ostream = sys.stdout
+
+        tab = " " * 4
+        header = "=" * 72
+
+        if self.block.name == "unknown":
+            name_str = ""
+        else:
+            name_str = f"-  {self.block.name}"
+
+        ostream.write("\n")
+        ostream.write(header + "\n")
+        ostream.write(f"Model Statistics  {name_str} \n")
+        ostream.write("\n")
+        ostream.write(f"Degrees of Freedom: " f"{self.degrees_of_freedom()} \n")
+        ostream.write("\n")
+        ostream.write(f"Total No. Variables: " f"{self.number_variables()} \n")
+        ostream.write(
+            f"{tab}No. Fixed Variables: " f"{self.number_fixed_variables()}" f"\n"
+        )
+        ostream.write(
+            f"{tab}No. Unused Variables: "
+            f"{self.number_unused_variables()} (Fixed):"
+            f"{self.number_fixed_unused_variables()})"
+            f"\n"
+        )
+        nv_alias = self.number_variables_only_in_inequalities
+        nfv_alias = self.number_fixed_variables_only_in_inequalities
+        ostream.write(
+            f"{tab}No. Variables only in Inequalities:"
+            f" {nv_alias()}"
+            f" (Fixed: {nfv_alias()}) \n"
+        )
+        ostream.write("\n")
+        ostream.write(
+            f"Total No. Constraints: " f"{self.number_total_constraints()} \n"
+        )
+        ostream.write(
+            f"{tab}No. Equality Constraints: "
+            f"{self.number_total_equalities()}"
+            f" (Deactivated: "
+            f"{self.number_deactivated_equalities()})"
+            f"\n"
+        )
+        ostream.write(
+            f"{tab}No. Inequality Constraints: "
+            f"{self.number_total_inequalities()}"
+            f" (Deactivated: "
+            f"{self.number_deactivated_inequalities()})"
+            f"\n"
+        )
+        ostream.write("\n")
+        ostream.write(
+            f"No. Objectives: "
+            f"{self.number_total_objectives()}"
+            f" (Deactivated: "
+            f"{self.number_deactivated_objectives()})"
+            f"\n"
+        )
+        ostream.write("\n")
+        ostream.write(
+            f"No. Blocks: {self.number_total_blocks()}"
+            f" (Deactivated: "
+            f"{self.number_deactivated_blocks()}) \n"
+        )
+        ostream.write(f"No. Expressions: " f"{self.number_expressions()} \n")
+        ostream.write(header + "\n")
+        ostream.write("\n")
 
 
 # -------------------------------------------------------------------------
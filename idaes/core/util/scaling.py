@@ -28,6 +28,8 @@ variables to calculate additional scaling factors.
 __author__ = "John Eslick, Tim Bartholomew, Robert Parker"
 
 from math import log10
+import numpy as np
+from scipy import sparse
 import scipy.sparse.linalg as spla
 import scipy.linalg as la
 
@@ -533,32 +535,35 @@ def constraint_autoscale_large_jac(
     nlp.clist = clist = nlp.get_pyomo_constraints()
     nlp.vlist = vlist = nlp.get_pyomo_variables()
     # Create a scaled Jacobian to account for variable scaling, for now ignore
-    # constraint scaling
-    jac_scaled = jac.copy()
-    for i, c in enumerate(clist):
-        for j in jac_scaled[i].indices:
-            v = vlist[j]
-            if ignore_variable_scaling:
-                sv = 1
-            else:
-                sv = get_scaling_factor(v, default=1)
-            jac_scaled[i, j] = jac_scaled[i, j] / sv
+    # constraint scaling. Scaling factors are collected once per variable and
+    # applied as a column scaling on the CSR data array.
+    if ignore_variable_scaling:
+        sv = np.ones(len(vlist))
+    else:
+        sv = np.fromiter(
+            (get_scaling_factor(v, default=1) for v in vlist), float, len(vlist)
+        )
+    jac_scaled = jac.astype(float)
+    jac_scaled.data /= sv[jac_scaled.indices]
     # calculate constraint scale factors
+    sc = np.empty(len(clist))
+    auto = np.zeros(len(clist), dtype=bool)
     for i, c in enumerate(clist):
-        sc = get_scaling_factor(c, default=1)
-        if not no_scale:
-            if ignore_constraint_scaling or get_scaling_factor(c) is None:
-                sc = 1
-                row = jac_scaled[i]
-                for d in row.indices:
-                    row[0, d] = abs(row[0, d])
-                mg = row.max()
-                if mg > max_grad:
-                    sc = max(min_scale, max_grad / mg)
-                set_scaling_factor(c, sc)
-        for j in jac_scaled[i].indices:
-            # update the scaled jacobian
-            jac_scaled[i, j] = jac_scaled[i, j] * sc
+        sf = get_scaling_factor(c)
+        if sf is None or (ignore_constraint_scaling and not no_scale):
+            sc[i] = 1
+            auto[i] = not no_scale
+        else:
+            sc[i] = sf
+    if not no_scale:
+        # Largest absolute value in each row (0 for empty rows)
+        mg = abs(jac_scaled).max(axis=1).toarray().ravel()
+        large = auto & (mg > max_grad)
+        sc[large] = np.maximum(min_scale, max_grad / mg[large])
+        for i in np.flatnonzero(auto):
+            set_scaling_factor(clist[i], float(sc[i]))
+    # update the scaled jacobian with a row scaling
+    jac_scaled.data *= np.repeat(sc, np.diff(jac_scaled.indptr))
     # delete dummy objective
     if n_obj == 0:
         delattr(m, dummy_objective_name)
@@ -602,17 +607,15 @@ def extreme_jacobian_entries(
     """
     if jac is None or nlp is None:
         jac, nlp = get_jacobian(m, scaled)
-    el = []
-    for i, c in enumerate(nlp.clist):
-        for j in jac[i].indices:
-            v = nlp.vlist[j]
-            e = abs(jac[i, j])
-            if (e <= small and e > zero) or e >= large:
-                el.append((e, c, v))
-    return el
+    jac = jac.tocoo()
+    e = abs(jac.data)
+    idx = np.flatnonzero(((e <= small) & (e > zero)) | (e >= large))
+    return [(e[k], nlp.clist[jac.row[k]], nlp.vlist[jac.col[k]]) for k in idx]
 
 
-def jacobian_cond(m=None, scaled=True, ord=None, pinv=False, jac=None):
+def jacobian_cond(
+    m=None, scaled=True, ord=None, pinv=False, jac=None, estimate=False
+):
     """
     Get the condition number of the scaled or unscaled Jacobian matrix of a model.
 
@@ -622,6 +625,10 @@ def jacobian_cond(m=None, scaled=True, ord=None, pinv=False, jac=None):
         ord: norm order, None = Frobenius, see scipy.sparse.linalg.norm for more
         pinv: Use pseudoinverse, works for non-square matrixes
         jac: (optional) perviously calculated jacobian
+        estimate: if True, estimate the condition number without forming an
+            inverse. For square Jacobians this uses a sparse LU factorization
+            and a 1-norm estimator, for non-square Jacobians the ratio of the
+            extreme singular values (2-norm). ord and pinv are ignored.
 
     Returns:
         (float) Condition number
@@ -629,6 +636,31 @@ def jacobian_cond(m=None, scaled=True, ord=None, pinv=False, jac=None):
     if jac is None:
         jac, nlp = get_jacobian(m, scaled)
     jac = jac.tocsc()
+    if estimate:
+        if jac.shape[0] == jac.shape[1]:
+            try:
+                lu = spla.splu(jac)
+            except RuntimeError:
+                # Factor is exactly singular
+                return float("inf")
+            jac_inv = spla.LinearOperator(
+                jac.shape,
+                matvec=lu.solve,
+                rmatvec=lambda x: lu.solve(x, trans="T"),
+                dtype=float,
+            )
+            return spla.norm(jac, 1) * spla.onenormest(jac_inv)
+        else:
+            if min(jac.shape) <= 2:
+                sv_max = la.svdvals(jac.toarray())[0]
+            else:
+                sv_max = spla.svds(
+                    jac, k=1, which="LM", return_singular_vectors=False
+                )[0]
+            sv_min, u, v = _smallest_singular_triplet(jac)
+            if sv_min == 0:
+                return float("inf")
+            return sv_max / sv_min
     if jac.shape[0] != jac.shape[1] and not pinv:
         _log.warning("Nonsquare Jacobian using pseudo inverse")
         pinv = True
@@ -640,6 +672,138 @@ def jacobian_cond(m=None, scaled=True, ord=None, pinv=False, jac=None):
         return spla.norm(jac, ord) * la.norm(jac_inv, ord)
 
 
+def _smallest_singular_triplet(jac):
+    """
+    Get the smallest singular value of a sparse matrix and the corresponding
+    left and right singular vectors. This uses shift-invert with the LU
+    factors of a square matrix, or of an augmented matrix containing J and
+    J^T for a nonsquare one, so J^T J is never formed.
+
+    Args:
+        jac: sparse matrix
+
+    Returns:
+        (smallest singular value, left singular vector, right singular vector)
+    """
+    jac = jac.tocsc()
+    nr, nc = jac.shape
+    if min(nr, nc) <= 2:
+        # Too small for ARPACK, just use a dense SVD
+        u, sv, vt = la.svd(jac.toarray(), full_matrices=False)
+        return sv[-1], u[:, -1], vt[-1, :]
+    if nr < nc:
+        sv, v, u = _smallest_singular_triplet(jac.T)
+        return sv, u, v
+    if nr == nc:
+        try:
+            lu = spla.splu(jac)
+        except RuntimeError:
+            # Factor is exactly singular
+            return _null_singular_triplet(jac)
+        # (J^T J)^-1 x = J^-1 J^-T x
+        op = spla.LinearOperator(
+            (nc, nc), matvec=lambda x: lu.solve(lu.solve(x, trans="T"))
+        )
+        w, x = spla.eigsh(op, k=1, which="LM")
+        sv = 1 / np.sqrt(abs(w[0]))
+        v = x[:, 0]
+        return sv, jac @ v / sv, v
+    # The augmented matrix [[g*I, J], [J^T, 0]] has an eigenvalue
+    # (g - sqrt(g^2 + 4*s^2))/2 < 0 for each singular value s of J, while the
+    # nr - nc eigenvalues that [[0, J], [J^T, 0]] has at zero are moved to
+    # g > 0. The eigenvalue for the smallest singular value is only well
+    # conditioned when g is close to it, so start from g >= s_max and refine.
+    g = np.sqrt(spla.norm(jac, 1) * spla.norm(jac, np.inf))
+    eye = sparse.identity(nr, format="csc")
+    for i in range(10):
+        aug = sparse.bmat([[g * eye, jac], [jac.T, None]], format="csc")
+        try:
+            lu = spla.splu(aug)
+        except RuntimeError:
+            # Factor is exactly singular, so J does not have full column rank
+            return _null_singular_triplet(jac)
+        op = spla.LinearOperator(aug.shape, matvec=lu.solve)
+        w, x = spla.eigsh(op, k=1, which="LM")
+        mu = 1 / w[0]
+        if mu > 0:
+            # Found g itself, the smallest singular value is larger than g
+            g *= 4
+            continue
+        sv = np.sqrt(mu * (mu - g))
+        if g <= 4 * sv:
+            break
+        g = sv
+    # The eigenvector is (u, -v) up to scaling
+    v = -x[nr:, 0] / np.linalg.norm(x[nr:, 0])
+    return sv, jac @ v / sv, v
+
+
+def _null_singular_triplet(jac):
+    """
+    Get left and right null vectors of a singular sparse matrix by inverse
+    iteration with the LU factors of the quasi-definite matrix
+    [[d*I, J], [J^T, -d*I]]. Its eigenvalues are +/-sqrt(d^2 + s^2) for the
+    singular values s of J, so for small d it is nonsingular and the null
+    vectors dominate.
+
+    Args:
+        jac: sparse matrix with a zero singular value
+
+    Returns:
+        (0, left null vector, right null vector)
+    """
+    nr, nc = jac.shape
+    d = 1e-8 * max(abs(jac).max(), 1)
+    aug = sparse.bmat(
+        [
+            [d * sparse.identity(nr), jac],
+            [jac.T, -d * sparse.identity(nc)],
+        ],
+        format="csc",
+    )
+    lu = spla.splu(aug)
+    # Fixed random start, which is unlikely to be orthogonal to a null vector
+    x = np.random.default_rng(0).standard_normal(nr + nc)
+    for i in range(3):
+        x = lu.solve(x)
+        x /= np.linalg.norm(x)
+    u = x[:nr] / np.linalg.norm(x[:nr])
+    v = x[nr:] / np.linalg.norm(x[nr:])
+    return 0.0, u, v
+
+
+def worst_conditioned_jacobian_components(
+    m=None, scaled=True, n=10, jac=None, nlp=None
+):
+    """
+    Find the constraints and variables which contribute most to the smallest
+    singular value of the Jacobian, i.e. those with the largest components in
+    the corresponding left (constraints) and right (variables) singular
+    vectors. No inverse of the Jacobian is formed.
+
+    Args:
+        m: model
+        scaled: if True use scaled Jacobian, else use unscaled
+        n: maximum number of constraints and variables to return
+        jac: (optional) perviously calculated jacobian
+        nlp: (optional) Pynumero NLP for the perviously calculated jacobian
+
+    Returns:
+        smallest singular value, (list of tuples) weight and Constraint,
+        (list of tuples) weight and Variable
+    """
+    if jac is None or nlp is None:
+        jac, nlp = get_jacobian(m, scaled)
+    sv, u, v = _smallest_singular_triplet(jac)
+
+    def _largest(vec, components):
+        vec = np.abs(vec)
+        idx = np.argsort(-vec, kind="stable")[:n]
+        return [(vec[i], components[i]) for i in idx]
+
+    return sv, _largest(u, nlp.clist), _largest(v, nlp.vlist)
+
+
 class CacheVars(object):
     """
     A class for saving the values of variables then reloading them,
@@ -236,6 +236,80 @@ def test_copy_non_time_indexed_values():
     assert m1.b3[3].v5.value != m2.b3[3].v5.value
 
 
+@pytest.mark.unit
+def test_time_slice_copier():
+    m1 = ConcreteModel()
+    m1.time = Set(initialize=[1, 2, 3])
+    m1.v = Var(m1.time, initialize=1)
+    m1.v2 = Var(m1.time, ["a", "b"], initialize=1)
+    m1.u = Var(initialize=1)
+
+    @m1.Block(m1.time)
+    def b(b, t):
+        b.v = Var(["a", "b"], initialize=1)
+
+        @b.Block(["x"])
+        def b2(b2, i):
+            b2.v = Var(initialize=1)
+
+    m2 = ConcreteModel()
+    m2.time = Set(initialize=[0, 1])
+    m2.v = Var(m2.time, initialize=2)
+    m2.v2 = Var(m2.time, ["a", "b"], initialize=2)
+    m2.u = Var(initialize=2)
+
+    @m2.Block(m2.time)
+    def b(b, t):
+        b.v = Var(["a", "b"], initialize=2)
+
+        @b.Block(["x"])
+        def b2(b2, i):
+            b2.v = Var(initialize=2)
+
+    copier = TimeSliceCopier(m1, m2)
+    copier.copy(3, 0)
+    assert m1.v[3].value == m1.v2[3, "b"].value == 2
+    assert m1.b[3].v["a"].value == m1.b[3].b2["x"].v.value == 2
+    assert m1.v[2].value == m1.b[2].v["a"].value == 1
+    assert m1.u.value == 1
+    copier.copy_non_time_indexed()
+    assert m1.u.value == 2
+
+    # values are copied again, without finding the variables
+    m2.v[0].set_value(3)
+    m2.b[0].b2["x"].v.set_value(3)
+    m1.b[3].v["b"].fix(1)
+    copier.copy(3, 0, copy_fixed=False)
+    assert m1.v[3].value == m1.b[3].b2["x"].v.value == 3
+    assert m1.b[3].v["b"].value == 1
+    assert list(copier._slices) == [(3, 0)]
+    copier.copy(2, 1)
+    assert m1.v2[2, "a"].value == m1.b[2].v["b"].value == 2
+    assert len(copier._slices) == 2
+    # one-off copies do not keep their pairs
+    copier.copy(1, 0, cache=False)
+    assert m1.v[1].value == 3
+    assert len(copier._slices) == 2
+
+    # a missing source is an error only if the target value is copied
+    m1.b[1].v3 = Var(initialize=1)
+    m1.b[1].v3.fix()
+    copier = TimeSliceCopier(m1, m2)
+    copier.copy(1, 1, copy_fixed=False)
+    with pytest.raises(AttributeError):
+        copier.copy(1, 1)
+
+    v = m2.b[0].v["a"]
+    assert copier.find_comp_at_time(v, 2) is m1.b[2].v["a"]
+    assert copier.find_comp_at_time(v, 3) is m1.b[3].v["a"]
+    assert copier.find_comp_at_time(v, 2) is m1.b[2].v["a"]
+    assert copier.find_comp_at_time(m2.v2[1, "b"], 3) is m1.v2[3, "b"]
+    copier = TimeSliceCopier(m2, m1)
+    assert copier.find_comp_at_time(m1.b[1].v3, 0, allow_miss=True) is None
+    with pytest.raises(AttributeError):
+        copier.find_comp_at_time(m1.b[1].v3, 0)
+
+
 @pytest.mark.unit
 def test_find_comp_in_block():
     m1 = ConcreteModel()
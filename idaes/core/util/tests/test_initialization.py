@@ -14,6 +14,9 @@
 Tests for math util methods.
 """
 
+import multiprocessing
+import os
+
 import pytest
 from pyomo.environ import (
     Block,
@@ -30,7 +33,10 @@ from pyomo.environ import (
     TransformationFactory,
     check_optimal_termination,
 )
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
 from pyomo.network import Arc, Port
+from pyomo.dae import ContinuousSet, DerivativeVar
+from pyomo.common.collections import ComponentSet
 
 from idaes.core import (
     FlowsheetBlock,
@@ -58,7 +64,9 @@ from idaes.core.util.initialization import (
     propagate_state,
     solve_indexed_blocks,
     initialize_by_time_element,
+    TimeElementSubproblems,
 )
+from idaes.core.util.dyn_utils import get_activity_dict, deactivate_model_at
 from idaes.core.solvers import get_solver
 
 __author__ = "Andrew Lee"
@@ -986,9 +994,7 @@ def test_solve_indexed_block_error():
         solve_indexed_blocks(solver=None, blocks=[1, 2, 3])
 
 
-@pytest.mark.integration
-@pytest.mark.skipif(solver is None, reason="Solver not available")
-def test_initialize_by_time_element():
+def _enzyme_cstr_model():
     horizon = 6
     time_set = [0, horizon]
     ntfe = 60  # For a finite element every six seconds
@@ -1062,6 +1068,14 @@ def test_initialize_by_time_element():
     m.fs.cstr.outlet.flow_vol.fix(2.2)
     m.fs.cstr.outlet.temperature[m.fs.time.first()].fix(300)
 
+    return m
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(solver is None, reason="Solver not available")
+def test_initialize_by_time_element():
+    m = _enzyme_cstr_model()
+
     assert degrees_of_freedom(m) == 0
 
     initialize_by_time_element(m.fs, m.fs.time, solver=solver)
@@ -1096,3 +1110,223 @@ def test_initialize_by_time_element():
 
     results = solver.solve(m.fs)
     assert check_optimal_termination(results)
+
+
+@pytest.mark.unit
+def test_time_element_subproblems():
+    m = ConcreteModel()
+    m.time = ContinuousSet(bounds=(0, 4))
+    m.x = Var(m.time, initialize=1.0)
+    m.y = Var(m.time, initialize=1.0)
+    m.u = Var(m.time, initialize=0.5)
+    m.dxdt = DerivativeVar(m.x, wrt=m.time)
+
+    @m.Constraint(m.time)
+    def diff_eqn(m, t):
+        return m.dxdt[t] == -m.x[t] + m.u[t] * m.y[t]
+
+    @m.Block(m.time)
+    def b(b, t):
+        b.alg_eqn = Constraint(expr=m.y[t] == 2 * m.x[t])
+
+    TransformationFactory("dae.finite_difference").apply_to(
+        m, wrt=m.time, nfe=4, scheme="BACKWARD"
+    )
+    m.u.fix()
+    m.x[0].fix()
+
+    time = m.time
+    was_originally_active = get_activity_dict(m)
+    deactivated = deactivate_model_at(m, time, [t for t in time])
+    elements = [(time.at(i), [time.at(i + 1)]) for i in range(1, 5)]
+
+    def initial_guess(t_prev, fe):
+        for t in fe:
+            m.x[t].set_value(m.x[t_prev].value)
+
+    subproblems = TimeElementSubproblems(
+        time,
+        elements,
+        deactivated,
+        was_originally_active,
+        initial_guess=initial_guess,
+    )
+    assert len(subproblems) == 4
+
+    # Element constraints are active, other time points are not
+    assert m.b[1].active and m.b[4].active and m.diff_eqn[4].active
+    assert not m.b[0].active and not m.diff_eqn[0].active
+
+    # The first element is linked to t=0 by the fixed x[0], which is not a
+    # boundary variable, later elements by x at their initial point.
+    assert subproblems.boundaries[0] == []
+    for k in range(1, 4):
+        boundary = subproblems.boundaries[k]
+        assert len(boundary) == 1 and boundary[0] is m.x[k]
+    unknowns = ComponentSet(subproblems.blocks[2].vars.values())
+    assert unknowns == ComponentSet([m.dxdt[3], m.x[3], m.y[3]])
+
+    # Boundary variables are only fixed while an element is solved
+    class RecordingSolver(object):
+        def solve(self, blk, tee=False):
+            self.dof = degrees_of_freedom(blk)
+            self.fixed = m.x[2].fixed
+            return None
+
+    rec = RecordingSolver()
+    subproblems.solve(2, rec)
+    assert rec.dof == 0 and rec.fixed and not m.x[2].fixed
+
+    m.x[2].set_value(1.5)
+    assert subproblems.boundary_values(2) == [1.5]
+    assert subproblems.boundary_mismatch(2, [1.5]) == 0
+    assert subproblems.boundary_mismatch(2, [3.0]) == pytest.approx(0.5)
+    assert subproblems.boundary_mismatch(2, [0.5]) == pytest.approx(1.0)
+    assert subproblems.boundary_mismatch(2, [None]) == float("inf")
+
+    subproblems._initialize(2)
+    assert m.x[3].value == 1.5
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(solver is None, reason="Solver not available")
+@pytest.mark.parametrize(
+    "kwargs", [{"pipelined": True}, {"speculative": True, "n_workers": 2}]
+)
+def test_initialize_by_time_element_pipelined(kwargs):
+    ref = _enzyme_cstr_model()
+    initialize_by_time_element(ref.fs, ref.fs.time, solver=solver)
+
+    m = _enzyme_cstr_model()
+    initialize_by_time_element(m.fs, m.fs.time, solver=solver, **kwargs)
+
+    assert degrees_of_freedom(m) == 0
+    for t in m.fs.time:
+        assert not m.fs.cstr.outlet.conc_mol[t, "S"].fixed
+        assert m.fs.cstr.control_volume.properties_out[t].active
+    for var in m.fs.component_data_objects(Var):
+        ref_var = ref.find_component(var)
+        assert var.value == pytest.approx(ref_var.value, rel=1e-5, abs=1e-8)
+
+
+def _decay_model(nfe=4):
+    # dx/dt = -x/2 by backward Euler, so x[t] = (2/3)**t
+    m = ConcreteModel()
+    m.time = ContinuousSet(bounds=(0, nfe))
+    m.x = Var(m.time, initialize=1.0)
+    m.dxdt = DerivativeVar(m.x, wrt=m.time)
+    m.k = Var(initialize=0.5)
+
+    @m.Constraint(m.time)
+    def diff_eqn(m, t):
+        return m.dxdt[t] == -m.k * m.x[t]
+
+    TransformationFactory("dae.finite_difference").apply_to(
+        m, wrt=m.time, nfe=nfe, scheme="BACKWARD"
+    )
+    m.x[0].fix()
+    m.diff_eqn[0].deactivate()
+
+    was_originally_active = get_activity_dict(m)
+    deactivated = deactivate_model_at(m, m.time, [t for t in m.time])
+    elements = [(m.time.at(i), [m.time.at(i + 1)]) for i in range(1, nfe + 1)]
+
+    def initial_guess(t_prev, fe):
+        for t in fe:
+            m.x[t].set_value(m.x[t_prev].value)
+
+    subproblems = TimeElementSubproblems(
+        m.time,
+        elements,
+        deactivated,
+        was_originally_active,
+        initial_guess=initial_guess,
+    )
+    return m, subproblems
+
+
+@pytest.mark.unit
+def test_time_element_subproblems_unindexed_var():
+    m, subproblems = _decay_model()
+    # k is not indexed by time, so no element can determine it
+    for k in range(4):
+        assert m.k in ComponentSet(subproblems.boundaries[k])
+        assert m.k not in ComponentSet(subproblems.blocks[k].vars.values())
+
+    class RecordingSolver(object):
+        def solve(self, blk, tee=False):
+            self.dof = degrees_of_freedom(blk)
+            self.fixed = m.k.fixed
+            return None
+
+    rec = RecordingSolver()
+    subproblems.solve(0, rec)
+    assert rec.dof == 0 and rec.fixed and not m.k.fixed
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(solver is None, reason="Solver not available")
+def test_time_element_subproblems_solve_speculatively():
+    m, subproblems = _decay_model()
+    subproblems.solve_sequentially(solver)
+    expected = [m.x[t].value for t in m.time]
+    assert expected == pytest.approx([(2 / 3) ** t for t in m.time])
+
+    # Predict the solution exactly, except at t=2
+    m.x[2].set_value(2.0)
+    resolved = subproblems.solve_speculatively(solver, n_workers=2)
+    # Element 2 was solved from the wrong x[2] and is the only one solved
+    # again, element 3 was solved from the correct x[3].
+    assert resolved == [2]
+    assert [m.x[t].value for t in m.time] == pytest.approx(expected)
+
+
+class _DecaySolver(object):
+    """
+    Solves the elements of _decay_model exactly. Solves of the element ending
+    at fail_at in processes other than the one creating the solver fail,
+    leaving garbage in all the variables that are not fixed.
+    """
+
+    def __init__(self, m, fail_at=None):
+        self.m = m
+        self.fail_at = fail_at
+        self.pid = os.getpid()
+
+    def solve(self, blk, tee=False):
+        m = self.m
+        (t,) = [v.index() for v in blk.vars.values() if v.parent_component() is m.x]
+        results = SolverResults()
+        if t == self.fail_at and os.getpid() != self.pid:
+            for var in m.component_data_objects(Var):
+                if not var.fixed:
+                    var.set_value(3.0)
+            results.solver.status = SolverStatus.warning
+            results.solver.termination_condition = TerminationCondition.infeasible
+            return results
+        t_prev = m.time.prev(t)
+        m.x[t].set_value(m.x[t_prev].value / (1 + m.k.value * (t - t_prev)))
+        m.dxdt[t].set_value(-m.k.value * m.x[t].value)
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        return results
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="Speculative solves need forked processes",
+)
+def test_time_element_subproblems_solve_speculatively_failure():
+    m, subproblems = _decay_model(nfe=16)
+    fake_solver = _DecaySolver(m, fail_at=5)
+    subproblems.solve_sequentially(fake_solver)
+    expected = [m.x[t].value for t in m.time]
+    assert expected == pytest.approx([(2 / 3) ** t for t in m.time])
+
+    # The prediction is exact, but the speculative solve of element 4 fails.
+    # Elements solved after it by the same worker must not start from the
+    # values it left behind.
+    resolved = subproblems.solve_speculatively(fake_solver, n_workers=2)
+    assert resolved == [4]
+    assert [m.x[t].value for t in m.time] == pytest.approx(expected)
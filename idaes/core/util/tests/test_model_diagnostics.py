@@ -27,6 +27,15 @@ from pyomo.dae import ContinuousSet, DerivativeVar
 
 # Need to update
 from idaes.core.util.model_diagnostics import *
+from idaes.core.util.model_diagnostics import (
+    _dulmage_mendelsohn,
+    _smallest_singular_values,
+)
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags, eye
+from scipy.sparse import random as sparse_random
+from pyomo.contrib.pynumero.asl import AmplInterface
 
 # Author: Alex Dowling
 
@@ -247,4 +256,80 @@ def test_problem2_with_degenerate_constraint():
 
     assert n_rank_deficient == 1
 
+    # The redundant constraint is found in a single part of the Jacobian
+    assert len(dh2.decompose()) == 1
+    dh2.s = None
+    assert dh2.check_rank_equality_constraints(decompose=True) == 1
+
     # TODO: Add MILP solver to idaes get-extensions and add more tests
+
+
+@pytest.mark.skipif(
+    not AmplInterface.available(), reason="PyNumero ASL interface not available"
+)
+@pytest.mark.skipif(not pyo.SolverFactory("cbc").available(False), reason="no cbc")
+@pytest.mark.unit
+def test_find_irreducible_degenerate_sets_decompose_sequential():
+    m2 = example2(with_degenerate_constraint=True)
+    dh2 = DegeneracyHunter(m2, solver=pyo.SolverFactory("cbc"))
+
+    # Both copies of the redundant constraint are candidates of the same
+    # block, and each one's MILP finds the pair
+    ids = dh2.find_irreducible_degenerate_sets(decompose=True, n_workers=1)
+    assert len(ids) == 2
+    for ids_, c in zip(ids, ["con2", "con5"]):
+        nu = {con.name: v for con, v in ids_.items()}
+        assert sorted(nu) == ["con2", "con5"]
+        assert nu[c] == pytest.approx(1)
+        assert nu["con2"] == pytest.approx(-nu["con5"])
+
+
+@pytest.mark.unit
+def test_dulmage_mendelsohn():
+    J = csr_matrix(
+        np.array(
+            [
+                [1.0, 0, 0, 0, 0, 0],
+                [1, 1, 0, 0, 0, 0],
+                [0, 1, 1, 2, 0, 0],
+                [0, 0, 2, 4, 0, 0],
+                [0, 0, 0, 0, 3, 0],
+                [0, 0, 0, 0, 1, 0],
+                [0, 0, 0, 0, 2, 0],
+                [0, 0, 0, 0, 0, 0],
+            ]
+        )
+    )
+    over, under, blocks = _dulmage_mendelsohn(J)
+    assert list(over[0]) == [4, 5, 6, 7]
+    assert list(over[1]) == [4]
+    assert list(under[0]) == []
+    assert list(under[1]) == [5]
+    blocks = sorted((list(rows), list(cols)) for rows, cols in blocks)
+    assert [rows for rows, cols in blocks] == [[0], [1], [2, 3]]
+    assert [sorted(cols) for rows, cols in blocks] == [[0], [1], [2, 3]]
+
+
+@pytest.mark.unit
+def test_smallest_singular_values():
+    A = (sparse_random(300, 300, density=0.02, random_state=1) + eye(300)).tocsr()
+    s = np.sort(np.linalg.svd(A.toarray(), compute_uv=False))
+    assert _smallest_singular_values(A, 3) == pytest.approx(s[:3])
+    assert _smallest_singular_values(A[:20, :20], 2) == pytest.approx(
+        np.sort(np.linalg.svd(A[:20, :20].toarray(), compute_uv=False))[:2]
+    )
+
+    W = sparse_random(200, 300, density=0.03, random_state=2) + eye(200, 300)
+    s = np.sort(np.linalg.svd(W.toarray(), compute_uv=False))
+    assert _smallest_singular_values(W.tocsr(), 2) == pytest.approx(s[:2])
+    assert _smallest_singular_values(W.T.tocsr(), 2) == pytest.approx(s[:2])
+
+    # Badly scaled wide matrix, s_min^2 is lost next to s_max^2 in W W^T
+    W = W @ diags(np.logspace(0, -10, 300))
+    s = np.sort(np.linalg.svd(W.toarray(), compute_uv=False))
+    assert _smallest_singular_values(W.tocsr(), 2) == pytest.approx(s[:2], rel=1e-6)
+
+    # Structurally singular
+    A = A.tolil()
+    A[5, :] = 0
+    assert _smallest_singular_values(A.tocsr(), 1) == pytest.approx([0])
@@ -15,10 +15,14 @@ Test for functions to save/load Pyomo model state to a dict or json
 """
 
 import unittest
+import json
 import os
 
 from pyomo.environ import *
-from idaes.core.util import to_json, from_json, StoreSpec
+from idaes.core.util import (
+    to_json, from_json, to_npz, from_npz, StoreSpec, StateLoader,
+    NpzStateLoader
+)
 from idaes.core.util.model_serializer import _only_fixed
 from idaes.util.system import mkdtemp
 import shutil
@@ -559,6 +563,158 @@ class TestModelSerialize(unittest.TestCase):
         assert value(model.b[1].x[3, 3]) == 1
         assert value(model.b[2].x[3, 3]) == 3
 
+    @pytest.mark.unit
+    def test13_npz(self):
+        """Save and load the binary columnar format"""
+        fname = os.path.join(self.dirname, "state.npz")
+        model = self.setup_model02()
+        model.blk = Block([1, 2])
+        model.blk[1].y = Var(initialize=3)
+        model.dual[model.g] = 1
+        model.ipopt_zL_out[model.x[1]] = 2
+        model.flag = Suffix(direction=Suffix.EXPORT)
+        model.flag[model.x[1]] = True
+        model.flag[model.x[2]] = False
+        model.priority = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        model.priority[model.x[1]] = 3
+        to_npz(model, fname=fname, metadata={"note": "test"})
+
+        model.a = 10
+        model.x[1] = 7
+        model.x[2].fix(8)
+        model.x[1].setlb(None)
+        model.blk[1].y = None
+        model.g.deactivate()
+        model.blk[2].deactivate()
+        model.dual[model.g] = 5
+        model.ipopt_zL_out[model.x[1]] = 6
+        model.flag[model.x[2]] = True
+        model.priority[model.x[1]] = 4
+
+        pdict = from_npz(model, fname=fname)
+        assert "etime_read_arrays" in pdict
+        assert value(model.a) == 1
+        assert value(model.x[1]) == 1.5
+        assert model.x[1].lb == -10
+        assert not model.x[2].fixed
+        assert value(model.x[2]) == 2.5
+        assert model.blk[1].y.value == 3
+        assert model.g.active
+        assert model.blk[2].active
+        assert model.dual[model.g] == 1
+        assert model.ipopt_zL_out[model.x[1]] == 2
+        # Suffix values keep their type
+        assert model.flag[model.x[1]] is True
+        assert model.flag[model.x[2]] is False
+        assert model.priority[model.x[1]] == 3
+        assert type(model.priority[model.x[1]]) is int
+
+    @pytest.mark.unit
+    def test14_npz_structure_change(self):
+        """Load the binary format into a model with a different structure"""
+        model = self.setup_model01()
+        model.b[1].b.value = None
+        sd = to_npz(model)
+        assert sd["var_names"].tolist() == ["b[1].a", "b[1].b"]
+
+        model2 = self.setup_model01()
+        model2.b[2].z = Var(initialize=4)
+        model2.b[1].a.unfix()
+        model2.b[1].a.value = 5
+        from_npz(model2, sd=sd)
+        assert model2.b[1].a.fixed
+        assert value(model2.b[1].a) == 2
+        assert model2.b[1].b.value is None
+        assert value(model2.b[2].z) == 4
+
+    @pytest.mark.unit
+    def test15_state_loader(self):
+        """Reuse a StateLoader for several loads"""
+        model = self.setup_model02()
+        model.dual[model.g] = 1
+        model.ipopt_zL_out[model.x[1]] = 2
+        sd1 = to_json(model, return_dict=True)
+        model.x[1] = 3
+        model.a = 4
+        model.dual[model.g] = 5
+        sd2 = to_json(model, return_dict=True)
+
+        loader = StateLoader(model)
+        loader.load(sd=sd1)
+        records = loader._records
+        assert value(model.x[1]) == 1.5
+        assert value(model.a) == 1
+        assert model.dual[model.g] == 1
+        assert model.ipopt_zL_out[model.x[1]] == 2
+        pdict = loader.load(s=json.dumps(sd2))
+        assert "etime_build" in pdict
+        assert loader._records is records
+        assert value(model.x[1]) == 3
+        assert value(model.a) == 4
+        assert model.dual[model.g] == 5
+        loader.load(sd=sd1)
+        assert loader._records is records
+        assert value(model.x[1]) == 1.5
+
+        # Structural change in the model
+        model.y = Var(initialize=7)
+        loader.load(sd=sd2)
+        assert loader._records is not records
+        assert value(model.x[1]) == 3
+        assert value(model.y) == 7
+
+    @pytest.mark.unit
+    def test16_state_loader_filter(self):
+        """StateLoader with a filtering StoreSpec and a different state"""
+        model = self.setup_model01()
+        loader = StateLoader(model, wts=StoreSpec.value_isfixed(only_fixed=True))
+        sd = to_json(model, return_dict=True)
+        model.b[1].a.value = 3
+        model.b[1].b.value = 4
+        loader.load(sd=sd)
+        assert value(model.b[1].a) == 2
+        assert value(model.b[1].b) == 4
+
+        # State from a model with a different structure
+        model2 = self.setup_model01()
+        model2.b[1].del_component(model2.b[1].c)
+        model2.b[1].a = 5
+        loader.load(sd=to_json(model2, return_dict=True))
+        assert value(model.b[1].a) == 5
+
+    @pytest.mark.unit
+    def test17_npz_state_loader(self):
+        """Reuse an NpzStateLoader for several loads"""
+        model = self.setup_model02()
+        model.dual[model.g] = 1
+        sd1 = to_npz(model)
+        model.x[1] = 3
+        model.dual[model.g] = 5
+        sd2 = to_npz(model)
+
+        loader = NpzStateLoader(model)
+        loader.load(sd=sd1)
+        select = loader._select
+        assert value(model.x[1]) == 1.5
+        assert model.dual[model.g] == 1
+        pdict = loader.load(sd=sd2)
+        assert "etime_build" in pdict
+        assert loader._select is select
+        assert value(model.x[1]) == 3
+        assert model.dual[model.g] == 5
+
+        # Structural change in the model
+        model.y = Var(initialize=7)
+        loader.load(sd=sd1)
+        assert loader._select is not select
+        assert value(model.x[1]) == 1.5
+        assert value(model.y) == 7
+
+        # State with different names
+        select = loader._select
+        loader.load(sd=to_npz(model))
+        assert loader._select is not select
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -22,12 +22,14 @@ from pyomo.environ import (
     Constraint,
     Expression,
     Objective,
+    Param,
     Set,
     Var,
     TransformationFactory,
 )
 from pyomo.dae import ContinuousSet, DerivativeVar
 from pyomo.common.collections import ComponentSet
+from pyomo.contrib.pynumero.asl import AmplInterface
 
 from idaes.core.util.model_statistics import *
 
@@ -524,6 +526,93 @@ def test_number_large_residuals(m):
     assert number_large_residuals(m) == 2
 
 
+@pytest.fixture()
+def residual_model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], initialize=1)
+    m.c1 = Constraint(expr=m.x[1] + m.x[2] == 5)
+    m.c2 = Constraint(expr=m.x[2] * m.x[3] <= 0.5)
+    m.c3 = Constraint(expr=(3, m.x[3] ** 2, 4))
+    m.c4 = Constraint(expr=m.x[1] == 1)
+    m.c5 = Constraint(expr=m.x[1] + m.x[3] == 7)
+    m.c5.deactivate()
+    return m
+
+
+@pytest.mark.unit
+def test_residual_evaluator_python(residual_model):
+    m = residual_model
+    evaluator = ResidualEvaluator(m, use_nlp=False)
+    assert evaluator.nlp is None
+    assert evaluator.constraints == [m.c1, m.c2, m.c3, m.c4]
+    assert list(evaluator.evaluate()) == pytest.approx([3, 0.5, 2, 0])
+
+    large = evaluator.large_residuals(tol=1)
+    assert len(large) == 2
+    assert large[m.c1] == pytest.approx(3)
+    assert large[m.c3] == pytest.approx(2)
+
+    top = evaluator.top_residuals(k=2)
+    assert [c for c, r in top] == [m.c1, m.c3]
+
+    # Residuals are evaluated at the current Var values
+    m.x[2].value = 4
+    m.x[3].value = 0.2
+    top = evaluator.top_residuals(k=10)
+    assert [c for c, r in top] == [m.c3, m.c2]
+    assert top[0][1] == pytest.approx(2.96)
+    assert top[1][1] == pytest.approx(0.3)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "use_nlp",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not AmplInterface.available(),
+                reason="PyNumero ASL interface not available",
+            ),
+        ),
+    ],
+)
+def test_residual_evaluator_refresh(use_nlp):
+    m = ConcreteModel()
+    m.x = Var(initialize=1)
+    m.p = Param(initialize=2, mutable=True)
+    m.c1 = Constraint(expr=m.x >= m.p)
+    m.c2 = Constraint(expr=m.p * m.x == 3)
+    evaluator = ResidualEvaluator(m, use_nlp=use_nlp)
+    assert list(evaluator.evaluate()) == pytest.approx([1, 1])
+
+    # Param values are read when the evaluator is built or refreshed
+    m.p = 0.5
+    evaluator.refresh()
+    assert list(evaluator.evaluate()) == pytest.approx([0, 2.5])
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    not AmplInterface.available(), reason="PyNumero ASL interface not available"
+)
+def test_residual_evaluator_nlp(residual_model):
+    m = residual_model
+    evaluator = ResidualEvaluator(m, use_nlp=True)
+    assert evaluator.nlp is not None
+    # Dummy objective is removed after compilation
+    assert number_total_objectives(m) == 0
+    assert list(evaluator.evaluate()) == pytest.approx([3, 0.5, 2, 0])
+
+    m.x[2].value = 4
+    m.x[3].value = 0.2
+    python_evaluator = ResidualEvaluator(m, use_nlp=False)
+    assert list(evaluator.evaluate()) == pytest.approx(
+        list(python_evaluator.evaluate())
+    )
+
+
 @pytest.mark.unit
 def test_active_variables_in_deactivated_blocks_set(m):
     assert len(active_variables_in_deactivated_blocks_set(m)) == 0
@@ -547,3 +636,140 @@ def test_number_active_variables_in_deactivated_blocks(m):
 @pytest.mark.unit
 def test_report_statistics(m):
     report_statistics(m)
+
+
+# -------------------------------------------------------------------------
+# Snapshot methods
+SNAPSHOT_QUERIES = [
+    "total_blocks_set",
+    "number_total_blocks",
+    "activated_blocks_set",
+    "number_activated_blocks",
+    "deactivated_blocks_set",
+    "number_deactivated_blocks",
+    "total_constraints_set",
+    "number_total_constraints",
+    "activated_constraints_set",
+    "number_activated_constraints",
+    "deactivated_constraints_set",
+    "number_deactivated_constraints",
+    "total_equalities_set",
+    "number_total_equalities",
+    "activated_equalities_set",
+    "number_activated_equalities",
+    "deactivated_equalities_set",
+    "number_deactivated_equalities",
+    "total_inequalities_set",
+    "number_total_inequalities",
+    "activated_inequalities_set",
+    "number_activated_inequalities",
+    "deactivated_inequalities_set",
+    "number_deactivated_inequalities",
+    "variables_set",
+    "number_variables",
+    "fixed_variables_set",
+    "number_fixed_variables",
+    "unfixed_variables_set",
+    "number_unfixed_variables",
+    "variables_near_bounds_set",
+    "number_variables_near_bounds",
+    "variables_in_activated_constraints_set",
+    "number_variables_in_activated_constraints",
+    "variables_in_activated_equalities_set",
+    "number_variables_in_activated_equalities",
+    "variables_in_activated_inequalities_set",
+    "number_variables_in_activated_inequalities",
+    "variables_only_in_inequalities",
+    "number_variables_only_in_inequalities",
+    "fixed_variables_in_activated_equalities_set",
+    "number_fixed_variables_in_activated_equalities",
+    "unfixed_variables_in_activated_equalities_set",
+    "number_unfixed_variables_in_activated_equalities",
+    "fixed_variables_only_in_inequalities",
+    "number_fixed_variables_only_in_inequalities",
+    "unused_variables_set",
+    "number_unused_variables",
+    "fixed_unused_variables_set",
+    "number_fixed_unused_variables",
+    "derivative_variables_set",
+    "number_derivative_variables",
+    "total_objectives_set",
+    "number_total_objectives",
+    "activated_objectives_set",
+    "number_activated_objectives",
+    "deactivated_objectives_set",
+    "number_deactivated_objectives",
+    "expressions_set",
+    "number_expressions",
+    "degrees_of_freedom",
+    "active_variables_in_deactivated_blocks_set",
+    "number_active_variables_in_deactivated_blocks",
+]
+
+
+def _assert_snapshot_matches(snapshot, block):
+    g = globals()
+    for q in SNAPSHOT_QUERIES:
+        expected = g[q](block)
+        result = getattr(snapshot, q)()
+        if isinstance(expected, ComponentSet):
+            assert isinstance(result, ComponentSet), q
+            assert len(result) == len(expected), q
+            for c in expected:
+                assert c in result, q
+        else:
+            assert result == expected, q
+
+
+@pytest.mark.unit
+def test_snapshot_matches_functions(m):
+    _assert_snapshot_matches(ModelStatisticsSnapshot(m), m)
+
+
+@pytest.mark.unit
+def test_snapshot_deactivated_top_block(m):
+    _assert_snapshot_matches(ModelStatisticsSnapshot(m.b1), m.b1)
+
+
+@pytest.mark.unit
+def test_snapshot_variables_near_bounds(m):
+    m.b2["b"].v2["a"].value = 0.99995
+    snapshot = ModelStatisticsSnapshot(m)
+    for kwargs in [
+        {},
+        {"relative": False, "tol": 1e-2},
+        {"skip_lb": True},
+        {"skip_ub": True},
+    ]:
+        assert snapshot.variables_near_bounds_set(**kwargs) == (
+            variables_near_bounds_set(m, **kwargs)
+        )
+
+
+@pytest.mark.unit
+def test_snapshot_refresh(m):
+    snapshot = ModelStatisticsSnapshot(m)
+    assert snapshot.degrees_of_freedom() == 10
+
+    m.v.fix(1)
+    m.b2["a"].c1.activate()
+    m.b2["b"].deactivate()
+    m.b1.activate()
+    m.b1.sb.o2.activate()
+
+    # State arrays are only updated on refresh
+    assert snapshot.degrees_of_freedom() == 10
+    snapshot.refresh()
+    _assert_snapshot_matches(snapshot, m)
+
+
+@pytest.mark.unit
+def test_snapshot_build(m):
+    snapshot = ModelStatisticsSnapshot(m)
+    assert snapshot.number_active_variables_in_deactivated_blocks() == 0
+
+    m.c = Constraint(expr=m.b1.v1 >= 2)
+    snapshot.build()
+
+    assert snapshot.number_active_variables_in_deactivated_blocks() == 1
+    _assert_snapshot_matches(snapshot, m)
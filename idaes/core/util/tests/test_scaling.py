@@ -15,6 +15,8 @@ This module contains tests for scaling.
 """
 
 import pytest
+import numpy as np
+import scipy.sparse as sparse
 import pyomo.environ as pyo
 import pyomo.dae as dae
 from pyomo.common.collections import ComponentSet
@@ -708,6 +710,23 @@ class TestScaleConstraintsPynumero:
         )
         assert m.scaling_factor[m.c] == pytest.approx(1)
 
+    @pytest.mark.unit
+    def test_extreme_jacobian_entries(self):
+        """Check large and small Jacobian entries are found"""
+        m = self.model()
+        el = sc.extreme_jacobian_entries(m, scaled=False)
+        entries = {(c.name, v.name): e for e, c, v in el}
+        assert len(entries) == 2
+        assert entries[("c1", "x")] == pytest.approx(1e6)
+        assert entries[("c3", "z")] == pytest.approx(3e8)
+
+        el = sc.extreme_jacobian_entries(m, scaled=False, large=1e3, small=2)
+        entries = {(c.name, v.name): e for e, c, v in el}
+        assert len(entries) == 5
+        assert entries[("c1", "y")] == pytest.approx(1e3)
+        assert entries[("c1", "z")] == pytest.approx(1)
+        assert entries[("c2", "z")] == pytest.approx(2)
+
     @pytest.mark.unit
     def test_condition_number(self):
         """Calculate the condition number of the Jacobian"""
@@ -725,6 +744,33 @@ class TestScaleConstraintsPynumero:
         n = sc.jacobian_cond(m, scaled=False)
         assert n == pytest.approx(7.5e7, abs=5e6)
 
+    @pytest.mark.unit
+    def test_condition_number_estimate(self):
+        """Estimate the condition number of the Jacobian"""
+        m = self.model()
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.x] = 1e-3
+        m.scaling_factor[m.y] = 1e-6
+        m.scaling_factor[m.z] = 1e-4
+        m.scaling_factor[m.c1] = 1e-6
+        m.scaling_factor[m.c2] = 1e-6
+        m.scaling_factor[m.c3] = 1e-12
+
+        jac, nlp = sc.get_jacobian(m, scaled=True)
+        n = sc.jacobian_cond(jac=jac, estimate=True)
+        assert n == pytest.approx(np.linalg.cond(jac.toarray(), 1))
+
+        sv, rows, cols = sc.worst_conditioned_jacobian_components(
+            jac=jac, nlp=nlp, n=2
+        )
+        assert sv == pytest.approx(np.linalg.svd(jac.toarray())[1][-1])
+        assert len(rows) == 2
+        assert len(cols) == 2
+        assert rows[0][0] >= rows[1][0]
+        assert cols[0][0] >= cols[1][0]
+        assert rows[0][1] in ComponentSet([m.c1, m.c2, m.c3])
+        assert cols[0][1] in ComponentSet([m.x, m.y, m.z])
+
     @pytest.mark.unit
     def test_scale_with_ignore_var_scale_constraint_scale(self):
         """Make sure the Jacobian from Pynumero matches expectation.  This is
@@ -967,3 +1013,54 @@ class TestFlattenedScalingAssignment:
         assert scaling_factor[s] == scaling_factor[m.z[tf, xf]]
 
         assert scaling_factor[y] == pytest.approx(1 / (4 + 10**3))
+
+
+@pytest.mark.unit
+def test_jacobian_cond_estimate_square():
+    rng = np.random.default_rng(42)
+    jac = sparse.random(50, 50, density=0.1, random_state=rng, format="csr")
+    jac = jac + sparse.eye(50)
+    n = sc.jacobian_cond(jac=jac, estimate=True)
+    assert n == pytest.approx(np.linalg.cond(jac.toarray(), 1))
+
+    jac = sparse.csr_matrix(np.array([[1.0, 2.0, 0], [2.0, 4.0, 0], [0, 0, 1.0]]))
+    assert sc.jacobian_cond(jac=jac, estimate=True) == float("inf")
+
+
+@pytest.mark.unit
+def test_jacobian_cond_estimate_nonsquare():
+    rng = np.random.default_rng(42)
+    for shape in [(40, 50), (50, 40)]:
+        jac = sparse.random(*shape, density=0.1, random_state=rng, format="csr")
+        jac = jac + sparse.eye(*shape)
+        n = sc.jacobian_cond(jac=jac, estimate=True)
+        assert n == pytest.approx(np.linalg.cond(jac.toarray()))
+
+
+@pytest.mark.unit
+def test_smallest_singular_triplet():
+    rng = np.random.default_rng(42)
+    for shape in [(30, 30), (20, 30), (30, 20), (2, 3)]:
+        jac = sparse.random(*shape, density=0.2, random_state=rng, format="csr")
+        jac = jac + sparse.eye(*shape)
+        sv, u, v = sc._smallest_singular_triplet(jac)
+        assert sv == pytest.approx(np.linalg.svd(jac.toarray())[1][-1])
+        assert np.linalg.norm(jac @ v - sv * u) == pytest.approx(0, abs=1e-8)
+        assert np.linalg.norm(jac.T @ u - sv * v) == pytest.approx(0, abs=1e-8)
+    # Badly scaled tall matrix, s_min^2 is lost next to s_max^2 in J^T J
+    jac = sparse.diags([1e6, 1, 1, 1e-5], shape=(6, 4), format="csr")
+    jac[5, 0] = 1
+    sv, u, v = sc._smallest_singular_triplet(jac)
+    assert sv == pytest.approx(np.linalg.svd(jac.toarray())[1][-1], rel=1e-8)
+    # Exactly singular matrices give a zero singular value and null vectors
+    for shape in [(6, 6), (6, 4), (4, 6)]:
+        jac = sparse.eye(*shape, format="lil")
+        jac[1, 1] = 0
+        jac[2, 1] = 2
+        jac[2, 2] = 0
+        sv, u, v = sc._smallest_singular_triplet(jac.tocsr())
+        assert sv == 0
+        assert np.linalg.norm(u) == pytest.approx(1)
+        assert np.linalg.norm(v) == pytest.approx(1)
+        assert np.linalg.norm(jac @ v) == pytest.approx(0, abs=1e-8)
+        assert np.linalg.norm(jac.T @ u) == pytest.approx(0, abs=1e-8)
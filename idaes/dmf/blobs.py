@@ -0,0 +1,272 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Content-addressed storage for DMF datafiles.
+
+Each distinct file content is stored once, as a "blob" named by the SHA-1 hash
+of its contents (the same hash recorded in the "sha1" field of a resource's
+datafiles). Resources get their datafiles as copy-on-write clones ("reflinks")
+of the blob where the filesystem supports them, so identical datafiles take the
+space of one file, and otherwise as plain copies. Both are independent,
+writable files.
+
+Optionally, datafiles that cannot be cloned are hard links to the blob instead,
+which also saves the space of the copies on filesystems without clones (e.g.
+ext4). Blobs are read-only, so that a datafile shared through a hard link
+cannot be modified in place (which would change the other datafiles, and the
+blob, too); such datafiles must be copied to be edited.
+
+The reference count of a blob is its number of hard links, minus the link in
+the blob store itself. :meth:`BlobStore.release` removes blobs that are no
+longer referenced.
+"""
+# stdlib
+import hashlib
+import logging
+import os
+from pathlib import Path
+import shutil
+import stat
+import tempfile
+from typing import Union
+
+# local
+from . import errors
+
+__author__ = "Dan Gunter"
+
+_log = logging.getLogger(__name__)
+
+#: Ioctl request to clone a file on Linux (btrfs, xfs, ...)
+FICLONE = 0x40049409
+
+#: Mode of blobs, and so of datafiles hard-linked to them
+BLOB_MODE = 0o444
+
+
+class BlobStore:
+    """Content-addressed store of files, in a directory.
+
+    Blobs are stored in subdirectories named by the first two characters of
+    their hash, e.g. "<path>/3f/3fa2...".
+
+    Attributes:
+        hard_links (bool): If True, :meth:`link` makes hard links to the blobs
+            where it cannot make clones, instead of copies
+    """
+
+    #: Size of chunks read while copying and hashing files
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, path: Union[Path, str], hard_links: bool = False):
+        """Create (if needed) the store at the given directory.
+
+        Args:
+            path: Directory for the blobs
+            hard_links: See :attr:`hard_links`
+
+        Raises:
+            DMFError: if the directory cannot be created
+        """
+        self._path = Path(path)
+        self.hard_links = hard_links
+        try:
+            self._path.mkdir(mode=0o750, parents=True, exist_ok=True)
+        except OSError as err:
+            raise errors.DMFError(f"Cannot make blob store dir '{self._path}': {err}")
+
+    @property
+    def path(self) -> Path:
+        """Directory for the blobs."""
+        return self._path
+
+    def blob_path(self, sha1: str) -> Path:
+        """Path of the blob for a given hash (which may not exist)."""
+        return self._path / sha1[:2] / sha1
+
+    def __contains__(self, sha1: str) -> bool:
+        return self.blob_path(sha1).exists()
+
+    def add(self, src: Union[Path, str], sha1: str = None) -> str:
+        """Add the contents of a file to the store.
+
+        The file is hashed while it is copied, so it is only read once. If a
+        hash is provided, e.g. the "sha1" recorded when a datafile was added
+        to a resource, and a blob of the same size with this hash exists, the
+        file is only hashed to check that it was not modified since, and not
+        copied.
+
+        Args:
+            src: Path of the file to add
+            sha1: Known SHA-1 hash of the file contents
+
+        Returns:
+            SHA-1 hash of the file contents, which identifies its blob
+
+        Raises:
+            OSError: if the file cannot be read or the blob cannot be written
+        """
+        if sha1 is not None:
+            blob = self.blob_path(sha1)
+            if (
+                blob.exists()
+                and blob.stat().st_size == os.stat(src).st_size
+                and self._hash(src) == sha1
+            ):
+                _log.debug(f"Blob {sha1} for '{src}' exists")
+                return sha1
+        h = hashlib.sha1()
+        fd, tmp_name = tempfile.mkstemp(dir=self._path, prefix=".tmp-")
+        try:
+            with open(src, "rb") as infile, os.fdopen(fd, "wb") as outfile:
+                chunk = infile.read(self.CHUNK_SIZE)
+                while chunk:
+                    h.update(chunk)
+                    outfile.write(chunk)
+                    chunk = infile.read(self.CHUNK_SIZE)
+            sha1 = h.hexdigest()
+            blob = self.blob_path(sha1)
+            if blob.exists():
+                _log.debug(f"Blob {sha1} for '{src}' exists")
+                os.unlink(tmp_name)
+            else:
+                shutil.copystat(src, tmp_name)
+                os.chmod(tmp_name, BLOB_MODE)
+                blob.parent.mkdir(exist_ok=True)
+                os.replace(tmp_name, blob)
+                _log.debug(f"Added blob {sha1} for '{src}'")
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return sha1
+
+    @classmethod
+    def _hash(cls, path) -> str:
+        h = hashlib.sha1()
+        with open(path, "rb") as infile:
+            chunk = infile.read(cls.CHUNK_SIZE)
+            while chunk:
+                h.update(chunk)
+                chunk = infile.read(cls.CHUNK_SIZE)
+        return h.hexdigest()
+
+    def link(self, sha1: str, dest: Union[Path, str]):
+        """Make a file with the contents of a blob.
+
+        Tries, in order: a copy-on-write clone, a hard link (only if
+        :attr:`hard_links` is True) and a copy. Clones and copies are
+        independent, writable files. A hard link is read-only, like the blob,
+        since modifying it in place would modify the blob and all other links
+        to it.
+
+        Args:
+            sha1: Hash identifying the blob
+            dest: Path of the new file, which must not exist
+
+        Raises:
+            KeyError: if there is no blob for the hash
+            OSError: if the file cannot be created
+        """
+        blob = self.blob_path(sha1)
+        if not blob.exists():
+            raise KeyError(f"No blob for hash {sha1}")
+        if os.path.exists(dest):
+            raise FileExistsError(f"File exists: '{dest}'")
+        if self._reflink(blob, dest):
+            return
+        if self.hard_links:
+            # Blobs added before they were made read-only
+            if stat.S_IMODE(blob.stat().st_mode) != BLOB_MODE:
+                os.chmod(blob, BLOB_MODE)
+            try:
+                os.link(blob, dest)
+                return
+            except FileExistsError:
+                raise
+            except OSError as err:
+                _log.debug(f"Cannot hard link blob {sha1} to '{dest}': {err}")
+        shutil.copyfile(blob, dest)
+        self._copystat_writable(blob, dest)
+
+    @staticmethod
+    def _reflink(src, dest) -> bool:
+        """Clone a file with copy-on-write, if the OS and filesystem support it.
+
+        Returns:
+            True if the clone was made
+        """
+        try:
+            import fcntl
+        except ImportError:  # e.g., on Windows
+            return False
+        try:
+            with open(src, "rb") as infile, open(dest, "xb") as outfile:
+                try:
+                    fcntl.ioctl(outfile.fileno(), FICLONE, infile.fileno())
+                except OSError:
+                    failed = True
+                else:
+                    failed = False
+            if failed:
+                os.unlink(dest)
+                return False
+        except OSError:
+            return False
+        BlobStore._copystat_writable(src, dest)
+        return True
+
+    @staticmethod
+    def _copystat_writable(src, dest):
+        """Copy file metadata, except that the new file is writable."""
+        shutil.copystat(src, dest)
+        os.chmod(dest, stat.S_IMODE(os.stat(dest).st_mode) | stat.S_IWUSR)
+
+    def refcount(self, sha1: str) -> int:
+        """Number of (hard-linked) files using a blob.
+
+        Clones and copies made when hard links are not used are not
+        counted.
+
+        Returns:
+            Count, or zero if there is no blob for the hash
+        """
+        try:
+            return self.blob_path(sha1).stat().st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def release(self, sha1: str) -> bool:
+        """Remove a blob if no files are using it.
+
+        Call this after removing files that were made with :meth:`link`.
+
+        Returns:
+            True if the blob was removed
+        """
+        blob = self.blob_path(sha1)
+        try:
+            if blob.stat().st_nlink > 1:
+                # In case a link was made writable to remove it (Windows)
+                os.chmod(blob, BLOB_MODE)
+                return False
+            os.chmod(blob, stat.S_IWUSR | stat.S_IRUSR)  # for Windows
+            blob.unlink()
+        except FileNotFoundError:
+            return False
+        _log.debug(f"Removed unreferenced blob {sha1}")
+        try:
+            blob.parent.rmdir()
+        except OSError:
+            pass  # not empty
+        return True
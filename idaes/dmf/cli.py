@@ -37,6 +37,7 @@ import click
 from idaes.dmf import DMF, DMFConfig, resource, workspace, create_configuration
 from idaes.dmf.resource import Predicates
 from idaes.dmf import errors
+from idaes.dmf import resourcedb
 from idaes.dmf.workspace import Fields
 from idaes.dmf import util
 from idaes.dmf.util import (
@@ -352,11 +353,15 @@ def _show_optional_workspace_items(d, items, indent_spc, item_fn, t=None):
         if thing == "files" or thing == "all":
             print(item_fn("files", before=indent))
             fpath = pathlib.Path(d.datafiles_path)
-            fdirs = [dr for dr in fpath.glob("*") if dr.is_dir()]
+            fdirs = [
+                dr for dr in fpath.glob("*") if dr.is_dir() and dr.name != d.BLOB_DIR
+            ]
             indent = indent_spc * 2
             print(item_fn("count", len(fdirs), before=indent))
+            # count the size of files with the same (linked) contents once
+            file_stats = (fp.stat() for fd in fdirs for fp in fd.glob("*"))
             total_size = sum(
-                (sum((fp.stat().st_size for fp in fd.glob("*"))) for fd in fdirs)
+                {(st.st_dev, st.st_ino): st.st_size for st in file_stats}.values()
             )
             print(item_fn("total_size", size_prefix(total_size), before=indent))
         if thing == "htmldocs" or thing == "all":
@@ -1075,6 +1080,42 @@ def rm(identifier, yes, multiple, list_resources):
         click.echo(s)
 
 
+@click.command(help="Copy the resource database to a new file and backend")
+@click.option(
+    "--db-file",
+    "db_file",
+    default="resourcedb.sqlite",
+    help="New resource database file, relative to the workspace. The storage "
+    "backend is chosen from the extension: "
+    f"{', '.join(resourcedb.SQLITE_EXTENSIONS)} for SQLite, anything else "
+    "for TinyDB (default=resourcedb.sqlite)",
+)
+def migrate(db_file):
+    d = DMF()
+    old_db_file = d.db_file
+    if os.path.normpath(db_file) == os.path.normpath(old_db_file):
+        click.echo(f"Workspace already uses resource database '{db_file}'")
+        sys.exit(Code.INPUT_VALUE.value)
+    dest = os.path.join(d.root, db_file)
+    if os.path.exists(dest):
+        click.echo(f"Cannot migrate: file '{dest}' already exists")
+        sys.exit(Code.INPUT_VALUE.value)
+    _log.info(f"begin migrate resource DB from '{old_db_file}' to '{db_file}'")
+    try:
+        n = resourcedb.migrate(os.path.join(d.root, old_db_file), dest)
+    except errors.DMFError as err:
+        click.echo(f"Cannot migrate resource database: {err}")
+        sys.exit(Code.DMF_OPER.value)
+    _log.info(f"end migrate resource DB from '{old_db_file}' to '{db_file}'")
+    # switch the workspace to the new database
+    d.db_file = db_file
+    click.echo(
+        f"Copied {n} resources from '{old_db_file}' to '{db_file}' "
+        f"({resourcedb.backend_for_file(db_file)}). "
+        f"The workspace now uses '{db_file}'; '{old_db_file}' was not modified."
+    )
+
+
 @click.command(help="Load a directory of data and associated reference")
 @click.option(
     "-d",
@@ -1394,6 +1435,7 @@ base_command.add_command(info)
 base_command.add_command(related)
 base_command.add_command(rm)
 base_command.add_command(load_data)
+base_command.add_command(migrate)
 
 # if __name__ == '__main__':
 #     base_command()
@@ -20,7 +20,7 @@ import logging
 import os
 import pathlib
 import re
-import shutil
+import stat
 import sys
 import uuid
 from typing import Generator, Union
@@ -28,11 +28,12 @@ from typing import Generator, Union
 # third-party
 import pkg_resources
 from traitlets import HasTraits, default, observe
-from traitlets import Unicode
+from traitlets import Bool, Unicode
 import yaml
 
 # local
 from . import errors
+from .blobs import BlobStore
 from .resource import Resource
 from . import resourcedb
 from . import workspace
@@ -231,9 +232,15 @@ class DMF(workspace.Workspace, HasTraits):
 
     db_file = Unicode(help="Database file name")
     datafile_dir = Unicode(help="Data file directory, " "relative to DMF root")
+    datafile_links = Bool(
+        help="Hard-link copied data files with the same contents (read-only)"
+    )
 
     CONF_DB_FILE = "db_file"
     CONF_DATA_DIR = "datafile_dir"
+    CONF_DATA_LINKS = "datafile_links"
+    #: Subdirectory of the datafiles directory with the stored file contents
+    BLOB_DIR = ".blobs"
     CONF_HELP_PATH = workspace.Fields.DOC_HTML_PATH
 
     # logging should really provide this
@@ -307,10 +314,14 @@ class DMF(workspace.Workspace, HasTraits):
                 raise errors.WorkspaceError(msg)
         # set up rest of DMF
         path = os.path.join(self.root, self.db_file)
-        self._db = resourcedb.ResourceDB(path)
+        self._db = resourcedb.open_resource_db(path)
         self._datafile_path = os.path.join(self.root, self.datafile_dir)
         if not os.path.exists(self._datafile_path):
             os.mkdir(self._datafile_path, 0o750)
+        self._blobs = BlobStore(
+            os.path.join(self._datafile_path, self.BLOB_DIR),
+            hard_links=self.datafile_links,
+        )
         # add create/modified date, and optional name/description
         _w = workspace.Workspace
         right_now = datetime.isoformat(datetime.now())
@@ -415,10 +426,16 @@ class DMF(workspace.Workspace, HasTraits):
     def _default_res_dir(self):
         return self.meta.get(self.CONF_DATA_DIR, "files")
 
-    @observe(CONF_DB_FILE, CONF_DATA_DIR, CONF_HELP_PATH)
+    @default(CONF_DATA_LINKS)
+    def _default_data_links(self):
+        return bool(self.meta.get(self.CONF_DATA_LINKS, False))
+
+    @observe(CONF_DB_FILE, CONF_DATA_DIR, CONF_DATA_LINKS, CONF_HELP_PATH)
     def _observe_setting(self, change):
         if change["type"] != "change":
             return
+        if change["name"] == self.CONF_DATA_LINKS and hasattr(self, "_blobs"):
+            self._blobs.hard_links = change["new"]
         values = {change["name"]: change["new"]}
         self.set_meta(values)
 
@@ -496,7 +513,9 @@ class DMF(workspace.Workspace, HasTraits):
         For `do_copy`, the original file will be copied into the
         DMF workspace. If `do_copy` is True, then if `is_tmp` is also
         True the original file will be removed (after the copy is made,
-        of course).
+        of course). The contents of copied files are stored once, no matter
+        how many resources have the same file: the copy for each resource
+        is a (hard) link to the stored contents, where the filesystem allows it.
 
         Resources added during the lifetime of this DMF instance are remembered,
         so that `update()` with no arguments applies to all of them.
@@ -590,7 +609,8 @@ class DMF(workspace.Workspace, HasTraits):
                     'Copying datafile "{}" to directory "{}"'.format(filepath, copydir)
                 )
                 try:
-                    shutil.copy2(filepath, copydir)
+                    sha1 = self._blobs.add(filepath, sha1=datafile.get("sha1", None))
+                    self._blobs.link(sha1, copydir)
                 except (IOError, OSError) as err:
                     msg = (
                         'Cannot copy datafile from "{}" to DMF '
@@ -618,6 +638,7 @@ class DMF(workspace.Workspace, HasTraits):
                     if "is_tmp" in datafile:  # remove this directive
                         del datafile["is_tmp"]
                 datafile["path"] = filename
+                datafile["sha1"] = sha1
                 datafile["is_copy"] = True
                 if "do_copy" in datafile:  # remove this directive
                     del datafile["do_copy"]
@@ -685,6 +706,9 @@ class DMF(workspace.Workspace, HasTraits):
                 - "$ge": Greater than or equal (>=)
                 - "$ne": Not equal to (!=)
 
+           The key "$in" with a list value matches resources whose value
+           for the attribute is one of the values in the list.
+
         6. Boolean True means does the field exist, and False means
            does it *not* exist.
         7. Regular expression, string "~<expr>" and `re_flags`
@@ -831,12 +855,20 @@ class DMF(workspace.Workspace, HasTraits):
         Raises:
             NoSuchResourceError: if the starting resource is not found
         """
-        for depth, triple, meta in self.find_related(rsrc, **kwargs):
-            if predicate is not None and triple.predicate != predicate:
-                continue
-            id_ = meta[Resource.ID_FIELD]
-            for r in self.find_by_id(id_):
-                yield self._postproc_resource(r)
+        ids = [
+            meta[Resource.ID_FIELD]
+            for depth, triple, meta in self.find_related(rsrc, **kwargs)
+            if predicate is None or triple.predicate == predicate
+        ]
+        if not ids:
+            return
+        # fetch all the resources with one query, then return them in order
+        found = {
+            r.id: r for r in self._db.find({Resource.ID_FIELD: {"$in": list(set(ids))}})
+        }
+        for id_ in ids:
+            if id_ in found:
+                yield self._postproc_resource(found[id_])
 
     def remove(self, identifier=None, filter_dict=None, update_relations=True):
         """Remove one or more resources, from its identifier or a filter.
@@ -876,8 +908,9 @@ class DMF(workspace.Workspace, HasTraits):
                 )
             )
             return
-        # TODO: Delete all associated data files!!
+        removed = [self._db.get(i) for i in id_list]
         self._db.delete(idlist=id_list, internal_ids=True)
+        self._remove_datafiles(removed)
         # delete any added during this session
         for rsrc_id in id_list:
             if rsrc_id in self._resources:
@@ -899,6 +932,40 @@ class DMF(workspace.Workspace, HasTraits):
                     # save back to DMF
                     self.update(rsrc)
 
+    def _remove_datafiles(self, resources):
+        """Remove the datafiles copied into the DMF for removed resources,
+        and the stored contents that are no longer used by any resource.
+
+        Files in a user-provided (absolute) datafiles directory, or in a
+        directory still used by other resources, are left in place.
+        """
+        for rsrc in resources:
+            ddir = rsrc.v.get("datafiles_dir", "")
+            if not ddir or pathlib.Path(ddir).is_absolute():
+                continue
+            if self._db.find_one({"datafiles_dir": ddir}) is not None:
+                continue
+            dpath = pathlib.Path(self.datafiles_path) / ddir
+            for datafile in rsrc.v.get("datafiles", []):
+                if not datafile.get("is_copy", False):
+                    continue
+                fpath = dpath / datafile["path"]
+                try:
+                    try:
+                        fpath.unlink()
+                    except PermissionError:  # read-only, on Windows
+                        fpath.chmod(stat.S_IWUSR | stat.S_IRUSR)
+                        fpath.unlink()
+                except OSError as err:
+                    _log.warning(f"Cannot remove datafile '{fpath}': {err}")
+                    continue
+                if "sha1" in datafile:
+                    self._blobs.release(datafile["sha1"])
+            try:
+                dpath.rmdir()
+            except OSError:
+                pass  # not empty, or already gone
+
     def update(
         self,
         rsrc: Resource = None,
@@ -12,14 +12,25 @@
 #################################################################################
 """
 Resource database.
+
+There are two storage backends for the resource database:
+:class:`ResourceDB` keeps all the resources in a single TinyDB JSON file, and
+:class:`SQLiteResourceDB` keeps them in an SQLite database with indexed columns for
+the identifier, type, name, aliases, tags and relations. Use :func:`open_resource_db`
+to open a database with the backend matching its file name, and :func:`migrate`
+to copy a TinyDB database into an SQLite one.
 """
 # system
 from datetime import datetime
+import json
 import logging
+import os
 import re
+import sqlite3
 
 # third party
 from tinydb import TinyDB, Query
+from tinydb.table import Table
 
 # local
 from . import errors
@@ -30,11 +41,36 @@ __author__ = 'Dan Gunter <dkgunter@lbl.gov>'
 
 _log = logging.getLogger(__name__)
 
+#: Depth used for `find_related` traversals with no maximum depth
+MAX_DEPTH = 9223372036854775807
+
 
 class ResourceDB(object):
     """A database interface to all the resources within a given DMF workspace.
+
+    Besides the resources, the database keeps a persistent index of the
+    relations between resources, which is updated by :meth:`put`,
+    :meth:`update` and :meth:`delete` and used by :meth:`find_related`.
+    The index is a single document with three maps:
+
+        - "holders": internal id of each resource with relations, to its
+          identifier ("id_") and the list of its [subject, predicate, object]
+          relations ("relations")
+        - "subjects": subject identifier, to the internal ids of the
+          resources holding a relation from that subject (other than the subject)
+        - "objects": object identifier, to the internal ids of the
+          resources holding a relation to that object (other than the object)
+
+    and a fingerprint of the resources it covers: their number ("count") and
+    the largest of their internal ids ("max_doc_id"). Resources with larger
+    internal ids were added after the index was saved and are indexed when it
+    is next used. If the other resources do not match the count, e.g. because
+    some were deleted by an older version, the index is rebuilt.
     """
 
+    #: Name of the table holding the relation index
+    RELATION_INDEX_TABLE = "relation_index"
+
     def __init__(self, dbfile=None, connection=None):
         """Initialize from DMF and given configuration field.
 
@@ -60,6 +96,9 @@ class ResourceDB(object):
                 raise errors.FileError('Cannot open resource DB "{}"'.format(dbfile))
             # turn off caching, otherwise update() does not work properly
             self._db = db.table('resources', cache_size=0)
+        if self._db is not None:
+            # persistent index of the relations, stored in the same file
+            self._index_table = Table(self._db.storage, self.RELATION_INDEX_TABLE, cache_size=0)
 
     def __len__(self):
         return len(self._db)
@@ -222,6 +261,8 @@ class ResourceDB(object):
             cond = query <= value
         elif op == '$ne':
             cond = query != value
+        elif op == '$in':
+            cond = query.one_of(value)
         else:
             raise ValueError('Unexpected operator: {}'.format(op))
         return cond
@@ -250,46 +291,67 @@ class ResourceDB(object):
             KeyError if the resource is not found.
         """
         if maxdepth <= 0:
-            maxdepth = 9223372036854775807
-        # Get an iterator over all the resources, optionally
-        # filtered by an expression, as for find().
+            maxdepth = MAX_DEPTH
+        index = self._relation_index()
+        holders = index["holders"]
+        holders_of = index["subjects"] if outgoing else index["objects"]
+        key_pos = 0 if outgoing else 2  # position of subject or object
+        # Find the relations reachable from `id_` in the index, and the
+        # resources holding them (which carry the metadata), visiting only
+        # the connected part of the graph.
+        edges_of, todo = {}, [id_]
+        while todo:
+            node = todo.pop()
+            edges = []
+            for doc_id in holders_of.get(node, []):
+                for rel in holders[str(doc_id)]["relations"]:
+                    if rel[key_pos] == node:
+                        edges.append((doc_id, tuple(rel)))
+            edges_of[node] = edges
+            for _, (subj, pred, obj) in edges:
+                next_id = obj if outgoing else subj
+                if next_id not in edges_of and next_id not in todo:
+                    todo.append(next_id)
+        holder_ids = {holders[str(doc_id)]["id_"] for e in edges_of.values() for doc_id, _ in e}
+        if not holder_ids:
+            return iter(())
+        # Get metadata from the holding resources, optionally filtered as for find()
+        cond = Query()[Resource.ID_FIELD].one_of(list(holder_ids))
         if filter_dict:
-            filter_expr = self._create_filter_expr(filter_dict)
-            resource_list = self._db.search(filter_expr)
-        else:
-            resource_list = self._db.all()
-        # build adjacency list representing connections between resources
-        relation_map = {}
-        for rsrc in resource_list:
-            # print(f"@@ process resource: {rsrc[Resource.ID_FIELD]}")
-            # print(f"@@ resource relations: {rsrc['relations']}")
-            for rrel in rsrc['relations']:
-                uuid = rsrc[Resource.ID_FIELD]
-                rel = triple_from_resource_relations(uuid, rrel)
-                # skip start of edge, get metadata, etc. at end of edge
-                if (outgoing and rel.subject == uuid) or (
-                    not outgoing and rel.object == uuid
-                ):
-                    # print(f"@@ do nothing for: {uuid}")
-                    continue
-                # add entry in map
-                key = rel.subject if outgoing else rel.object
-                # print(f"@@ add to relation map, key={key}")
-                meta_info = {k: rsrc[k] for k in meta}
-                value = (rel.subject, rel.predicate, rel.object, meta_info)
-                value_list = relation_map.get(key, None)
-                if value_list is None:
-                    relation_map[key] = [value]
-                else:
-                    value_list.append(value)
-        _log.debug(f"built relation map: {relation_map}")
+            cond = cond & self._create_filter_expr(filter_dict)
+        meta_of = {doc.doc_id: {k: doc[k] for k in meta} for doc in self._db.search(cond)}
+
+        def relation_edges(node):
+            return [
+                edge + (meta_of[doc_id],)
+                for doc_id, edge in edges_of.get(node, [])
+                if doc_id in meta_of
+            ]
+
+        return self._traverse_relations(id_, relation_edges, outgoing, maxdepth)
+
+    @staticmethod
+    def _traverse_relations(id_, edges, outgoing, maxdepth):
+        """Breadth-first traversal of the relations starting at `id_`.
+
+        Args:
+            id_ (str): Identifier of the starting resource
+            edges (Callable): Function returning the list of
+                (subject, predicate, object, metadata) edges to follow from
+                a resource identifier, or None if there are no edges.
+            outgoing (bool): Direction of the traversal
+            maxdepth (int): Maximum depth
+        Returns:
+            Generator of (depth, relation, metadata)
+        """
+        start_edges = edges(id_)
         # stop if there are no connections
-        if id_ not in relation_map:
+        if not start_edges:
             return
         # Do a depth-first search through the edges, yield-ing
         # the relations as we go
         q, depth, visited = [], 0, set()
-        q.extend(relation_map[id_])
+        q.extend(start_edges)
         visited.add(id_)
         while len(q) > 0 and depth < maxdepth:
             depth += 1
@@ -305,11 +367,99 @@ class ResourceDB(object):
                     # If there are relations, and we haven't already been to
                     # this node, add them at the end of the queue; we will
                     # visit them at the next depth increment.
-                    if next_id in relation_map and next_id not in visited:
-                        q.extend(relation_map[next_id])
-                        visited.add(next_id)
+                    if next_id not in visited:
+                        next_edges = edges(next_id)
+                        if next_edges:
+                            q.extend(next_edges)
+                            visited.add(next_id)
             q = q[n:]  # pop off all the nodes we just visited
 
+    def _relation_index(self):
+        """Get the relation index, updating or building it if it does not
+        match the resources."""
+        docs = (self._db.storage.read() or {}).get(self._db.name, {})
+        doc_ids = [int(k) for k in docs]
+        index = self._index_table.get(doc_id=1)
+        if index is not None and "count" in index:
+            new_ids = sorted(i for i in doc_ids if i > index["max_doc_id"])
+            if index["count"] + len(new_ids) != len(doc_ids):
+                index = None
+            elif not new_ids:
+                return index
+            else:
+                for doc_id in new_ids:
+                    self._index_add(index, doc_id, docs[str(doc_id)])
+        else:
+            index = None
+        if index is None:
+            _log.info("Building relation index for resource DB")
+            index = {"holders": {}, "subjects": {}, "objects": {}}
+            for doc_id in doc_ids:
+                self._index_add(index, doc_id, docs[str(doc_id)])
+        index["count"] = len(doc_ids)
+        index["max_doc_id"] = max(doc_ids, default=0)
+        self._save_relation_index(index)
+        return index
+
+    def _save_relation_index(self, index):
+        if self._index_table.contains(doc_id=1):
+            self._index_table.update(lambda doc: doc.update(index), doc_ids=[1])
+        else:
+            self._index_table.insert(dict(index))
+
+    @staticmethod
+    def _index_add(index, doc_id, value):
+        """Add the relations of a resource to the relation index."""
+        relations = value.get("relations", None)
+        if not relations:
+            return
+        id_ = value[Resource.ID_FIELD]
+        rels = [list(triple_from_resource_relations(id_, rrel)) for rrel in relations]
+        index["holders"][str(doc_id)] = {"id_": id_, "relations": rels}
+        for key, key_map in ((0, index["subjects"]), (2, index["objects"])):
+            for node in {rel[key] for rel in rels if rel[key] != id_}:
+                doc_ids = key_map.setdefault(node, [])
+                if doc_id not in doc_ids:
+                    doc_ids.append(doc_id)
+                    doc_ids.sort()
+
+    @staticmethod
+    def _index_remove(index, doc_id):
+        """Remove the relations of a resource from the relation index."""
+        holder = index["holders"].pop(str(doc_id), None)
+        if holder is None:
+            return
+        for key, key_map in ((0, index["subjects"]), (2, index["objects"])):
+            for node in {rel[key] for rel in holder["relations"]}:
+                doc_ids = key_map.get(node, [])
+                if doc_id in doc_ids:
+                    doc_ids.remove(doc_id)
+                    if not doc_ids:
+                        del key_map[node]
+
+    def _update_relation_index(self, removed=(), added=()):
+        """Update and save the relation index for resources that were removed,
+        or whose relations changed. Resources added since the index was saved
+        are left for :meth:`_relation_index` to index.
+
+        Args:
+            removed (Iterable[int]): Internal ids of resources to remove
+            added (Iterable[Tuple[int, dict]]): Internal ids and values of resources to add
+        """
+        index = self._index_table.get(doc_id=1)
+        if index is None or "count" not in index:
+            return  # built from the resources when next used
+        removed = [doc_id for doc_id in removed if doc_id <= index["max_doc_id"]]
+        added = [(doc_id, v) for doc_id, v in added if doc_id <= index["max_doc_id"]]
+        if not removed and not added:
+            return
+        for doc_id in removed:
+            self._index_remove(index, doc_id)
+        for doc_id, value in added:
+            self._index_add(index, doc_id, value)
+        index["count"] += len(added) - len(removed)
+        self._save_relation_index(index)
+
     def get(self, identifier):
         """Get a resource by identifier.
 
@@ -350,6 +500,8 @@ class ResourceDB(object):
             raise errors.DuplicateResourceError("put", resource.id)
         # add resource
         self._db.insert(resource.v)
+        if resource.v.get("relations", None):
+            self._relation_index()  # indexes the new resource
 
     def delete(self, id_=None, idlist=None, filter_dict=None, internal_ids=False):
         """Delete one or more resources with given identifiers.
@@ -367,7 +519,7 @@ class ResourceDB(object):
         """
         if internal_ids:
             doc_ids = idlist if idlist else [id_]
-            self._db.remove(doc_ids=doc_ids)
+            removed = self._db.remove(doc_ids=doc_ids)
         else:
             ID = Resource.ID_FIELD
             if filter_dict:
@@ -378,7 +530,8 @@ class ResourceDB(object):
                 cond = self._create_filter_expr({ID: [idlist]})
             else:
                 return
-            self._db.remove(cond=cond)
+            removed = self._db.remove(cond=cond)
+        self._update_relation_index(removed=removed)
 
     def update(self, id_, new_dict):
         """Update the identified resource with new values.
@@ -411,4 +564,447 @@ class ResourceDB(object):
             elif old.v[k] != v:
                 changed[k] = v
         _log.debug(f"update resource {id_} with new values: {changed}")
-        self._db.update(changed, self._create_filter_expr(id_cond))
+        doc_ids = self._db.update(changed, self._create_filter_expr(id_cond))
+        if "relations" in changed:
+            value = dict(old.v, **changed)
+            self._update_relation_index(
+                removed=doc_ids, added=[(doc_id, value) for doc_id in doc_ids]
+            )
+
+
+class SQLiteResourceDB(ResourceDB):
+    """Resource database stored in SQLite.
+
+    Each resource is stored as a JSON document, alongside indexed columns for
+    its identifier, type and name (first alias), and indexed tables for its
+    aliases, tags and relations. Searches use the indexes to select candidate
+    resources, when the filter allows it, and then apply the same filter
+    semantics as :class:`ResourceDB` to the candidates.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS resources ("
+        "doc_id INTEGER PRIMARY KEY AUTOINCREMENT, id_ TEXT UNIQUE NOT NULL, "
+        "type TEXT, name TEXT, doc TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS resources_type ON resources (type)",
+        "CREATE INDEX IF NOT EXISTS resources_name ON resources (name)",
+        "CREATE TABLE IF NOT EXISTS aliases (doc_id INTEGER NOT NULL, alias TEXT)",
+        "CREATE INDEX IF NOT EXISTS aliases_alias ON aliases (alias)",
+        "CREATE INDEX IF NOT EXISTS aliases_doc ON aliases (doc_id)",
+        "CREATE TABLE IF NOT EXISTS tags (doc_id INTEGER NOT NULL, tag TEXT)",
+        "CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag)",
+        "CREATE INDEX IF NOT EXISTS tags_doc ON tags (doc_id)",
+        "CREATE TABLE IF NOT EXISTS relations (doc_id INTEGER NOT NULL, "
+        "pos INTEGER NOT NULL, id_ TEXT NOT NULL, subject TEXT NOT NULL, "
+        "predicate TEXT NOT NULL, object TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS relations_subject ON relations (subject)",
+        "CREATE INDEX IF NOT EXISTS relations_object ON relations (object)",
+        "CREATE INDEX IF NOT EXISTS relations_doc ON relations (doc_id)",
+    )
+    # Side tables holding the indexed lists of each resource
+    _LIST_TABLES = {"aliases": "alias", "tags": "tag"}
+    # Resource fields stored in indexed columns of the 'resources' table
+    _COLUMN_FIELDS = {Resource.ID_FIELD: "id_", Resource.TYPE_FIELD: "type"}
+    # Regular expressions on the identifier that are a prefix match,
+    # such as the ones created by DMF.find_by_id()
+    _ID_PREFIX_EXPR = re.compile(r"([0-9a-zA-Z]+)(\[a-z\]\*)?")
+
+    def __init__(self, dbfile=None, connection=None):
+        """Initialize from DMF and given configuration field.
+
+        Args:
+            dbfile (str): DB location
+            connection (sqlite3.Connection): If non-empty, this is an
+                existing connection that should be re-used, instead of
+                trying to connect to the location in `dbfile`.
+
+        Raises:
+            errors.FileError: If the database cannot be opened
+        """
+        self._gr = None
+        if connection is not None:
+            self._db = connection
+        else:
+            try:
+                self._db = sqlite3.connect(dbfile)
+            except sqlite3.Error:
+                raise errors.FileError('Cannot open resource DB "{}"'.format(dbfile))
+        try:
+            with self._db:
+                for stmt in self._SCHEMA:
+                    self._db.execute(stmt)
+        except sqlite3.DatabaseError as err:
+            raise errors.FileError('Cannot open resource DB "{}": {}'.format(dbfile, err))
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+
+    @staticmethod
+    def _as_resource(doc_id, doc):
+        rsrc = Resource(value=json.loads(doc))
+        rsrc.v["doc_id"] = doc_id
+        return rsrc
+
+    def find(self, filter_dict, id_only=False, flags=0):
+        """Find and return records based on the provided filter.
+
+        Args:
+            filter_dict (dict): Search filter. For syntax, see docs in
+                                :meth:`.dmf.DMF.find`.
+            id_only (bool): If true, return only the identifier of each
+                resource; otherwise a Resource object is returned.
+            flags (int): Flag values for, e.g., regex searches
+
+        Returns:
+            generator of int|Resource, depending on the value of `id_only`
+        """
+        for doc_id, doc in self._search(filter_dict, flags):
+            if id_only:
+                yield doc_id
+            else:
+                yield self._as_resource(doc_id, doc)
+
+    def _search(self, filter_dict, flags=0):
+        """Generate (doc_id, JSON document) for resources matching the filter."""
+        if not filter_dict:
+            yield from self._db.execute("SELECT doc_id, doc FROM resources ORDER BY doc_id")
+            return
+        filter_expr = self._create_filter_expr(filter_dict, flags)
+        where, params = self._index_conditions(filter_dict, flags)
+        sql = "SELECT doc_id, doc FROM resources"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        _log.debug(f"Find resources matching: {filter_expr}, candidates: {sql} {params}")
+        for doc_id, doc in self._db.execute(sql + " ORDER BY doc_id", params):
+            if filter_expr is None or filter_expr(json.loads(doc)):
+                yield doc_id, doc
+
+    def _index_conditions(self, filter_dict, flags=0):
+        """Translate the parts of a filter that can use the indexes into SQL.
+
+        The resulting conditions select a superset of the matching resources;
+        the full filter is always applied to the selected resources.
+
+        Returns:
+            (list[str], list) SQL conditions and their parameters
+        """
+        where, params = [], []
+        for k, v in filter_dict.items():
+            qry_all = False
+            if isinstance(v, list) and k.endswith("!"):
+                k, qry_all = k[:-1], True
+            if k in self._COLUMN_FIELDS and isinstance(v, str):
+                column = self._COLUMN_FIELDS[k]
+                tv = self._value_transform(v)
+                if isinstance(tv, str):
+                    where.append(f"{column} = ?")
+                    params.append(tv)
+                elif k == Resource.ID_FIELD and hasattr(tv, "match"):
+                    # SQLite's LIKE is case-insensitive, so this selects
+                    # a superset of the matches with or without re.IGNORECASE
+                    m = self._ID_PREFIX_EXPR.fullmatch(tv.pattern)
+                    if m:
+                        where.append(f"{column} LIKE ?")
+                        params.append(m.group(1) + "%")
+            elif (
+                k in self._COLUMN_FIELDS
+                and isinstance(v, dict)
+                and set(v.keys()) == {"$in"}
+                and all(isinstance(item, str) for item in v["$in"])
+            ):
+                values = list(set(v["$in"]))
+                marks = ", ".join(["?"] * len(values))
+                where.append(f"{self._COLUMN_FIELDS[k]} IN ({marks})")
+                params.extend(values)
+            elif (
+                k in self._LIST_TABLES
+                and isinstance(v, list)
+                and len(v) > 0
+                and all(isinstance(item, str) for item in v)
+            ):
+                table, column = k, self._LIST_TABLES[k]
+                values = list(set(v))
+                marks = ", ".join(["?"] * len(values))
+                if qry_all:
+                    where.append(
+                        f"doc_id IN (SELECT doc_id FROM {table} WHERE {column} IN "
+                        f"({marks}) GROUP BY doc_id HAVING COUNT(DISTINCT {column}) = ?)"
+                    )
+                    params.extend(values + [len(values)])
+                else:
+                    where.append(
+                        f"doc_id IN (SELECT doc_id FROM {table} WHERE {column} IN ({marks}))"
+                    )
+                    params.extend(values)
+        return where, params
+
+    def find_related(self, id_, filter_dict=None, outgoing=True, maxdepth=0, meta=None):
+        """Find all resources connected to the identified one.
+
+        The relations are read from the indexed relations table, so only the
+        resources reached by the traversal are loaded.
+
+        Args:
+            id_ (str): Unique ID of target resource.
+            filter_dict (dict): Filter to these resources
+            outgoing:
+            maxdepth:
+            meta (List[str]): Metadata fields to extract
+        Returns:
+            Generator of (depth, relation, metadata)
+        Raises:
+            KeyError if the resource is not found.
+        """
+        if maxdepth <= 0:
+            maxdepth = MAX_DEPTH
+        filter_expr = self._create_filter_expr(filter_dict) if filter_dict else None
+        # The relations are stored in both the subject and the object resource;
+        # the metadata comes from the resource at the end of the edge.
+        if outgoing:
+            sql = (
+                "SELECT r.subject, r.predicate, r.object, d.doc FROM relations r "
+                "JOIN resources d ON d.doc_id = r.doc_id "
+                "WHERE r.subject = ? AND r.subject != r.id_ ORDER BY r.doc_id, r.pos"
+            )
+        else:
+            sql = (
+                "SELECT r.subject, r.predicate, r.object, d.doc FROM relations r "
+                "JOIN resources d ON d.doc_id = r.doc_id "
+                "WHERE r.object = ? AND r.object != r.id_ ORDER BY r.doc_id, r.pos"
+            )
+
+        def edges(node_id):
+            result = []
+            for subj, pred, obj, doc in self._db.execute(sql, (node_id,)):
+                rsrc = json.loads(doc)
+                if filter_expr is not None and not filter_expr(rsrc):
+                    continue
+                meta_info = {k: rsrc[k] for k in meta}
+                result.append((subj, pred, obj, meta_info))
+            return result
+
+        return self._traverse_relations(id_, edges, outgoing, maxdepth)
+
+    def get(self, identifier):
+        """Get a resource by identifier.
+
+        Args:
+          identifier: Internal identifier
+
+        Returns:
+            (Resource) A resource or None
+        """
+        row = self._db.execute(
+            "SELECT doc_id, doc FROM resources WHERE doc_id = ?", (identifier,)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._as_resource(*row)
+
+    def put(self, resource):
+        """Put this resource into the database.
+
+        Args:
+            resource (Resource): The resource to add
+
+        Returns:
+            None
+
+        Raises:
+            errors.DuplicateResourceError: If there is already a resource
+                in the database with the same "id".
+        """
+        _log.debug(f"put resource id={resource.id}")
+        with self._db:
+            self._insert(resource.v)
+
+    def _insert(self, value, doc_id=None):
+        """Insert a resource document and its index entries."""
+        id_ = value[Resource.ID_FIELD]
+        try:
+            cursor = self._db.execute(
+                "INSERT INTO resources (doc_id, id_, type, name, doc) VALUES (?, ?, ?, ?, ?)",
+                (doc_id, id_, None, None, json.dumps(value)),
+            )
+        except sqlite3.IntegrityError:
+            raise errors.DuplicateResourceError("put", id_)
+        self._index(cursor.lastrowid, value)
+
+    def _index(self, doc_id, value):
+        """Update the indexed columns and tables for a resource document."""
+        id_ = value[Resource.ID_FIELD]
+        aliases = value.get("aliases", None)
+        name = aliases[0] if isinstance(aliases, list) and aliases else None
+        self._db.execute(
+            "UPDATE resources SET type = ?, name = ? WHERE doc_id = ?",
+            (value.get(Resource.TYPE_FIELD, None), name, doc_id),
+        )
+        for table, column in self._LIST_TABLES.items():
+            self._db.execute(f"DELETE FROM {table} WHERE doc_id = ?", (doc_id,))
+            items = value.get(table, None)
+            if isinstance(items, list):
+                self._db.executemany(
+                    f"INSERT INTO {table} (doc_id, {column}) VALUES (?, ?)",
+                    [(doc_id, item) for item in items if isinstance(item, str)],
+                )
+        self._db.execute("DELETE FROM relations WHERE doc_id = ?", (doc_id,))
+        rows = []
+        for pos, rrel in enumerate(value.get("relations", [])):
+            rel = triple_from_resource_relations(id_, rrel)
+            rows.append((doc_id, pos, id_, rel.subject, rel.predicate, rel.object))
+        self._db.executemany(
+            "INSERT INTO relations (doc_id, pos, id_, subject, predicate, object) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def delete(self, id_=None, idlist=None, filter_dict=None, internal_ids=False):
+        """Delete one or more resources with given identifiers.
+
+        Args:
+            id_ (Union[str,int]): If given, delete this id.
+            idlist (list): If given, delete ids in this list
+            filter_dict (dict): If given, perform a search and
+                           delete ids it finds.
+            internal_ids (bool): If True, treat identifiers as numeric
+                (internal) identifiers. Otherwise treat them as
+                resource (string) indentifiers.
+        Returns:
+            (list[str]) Identifiers
+        """
+        if internal_ids:
+            doc_ids = idlist if idlist else [id_]
+        else:
+            ID = Resource.ID_FIELD
+            if filter_dict:
+                pass
+            elif id_:
+                filter_dict = {ID: id_}
+            elif idlist:
+                filter_dict = {ID: [idlist]}
+            else:
+                return
+            doc_ids = [doc_id for doc_id, _ in self._search(filter_dict)]
+        with self._db:
+            for table in ("resources", "aliases", "tags", "relations"):
+                self._db.executemany(
+                    f"DELETE FROM {table} WHERE doc_id = ?", [(i,) for i in doc_ids]
+                )
+
+    def update(self, id_, new_dict):
+        """Update the identified resource with new values.
+
+        Args:
+            id_ (int): Identifier of resource to update
+            new_dict (dict): New dictionary of resource values
+        Returns:
+            None
+        Raises:
+            ValueError: If new resource is of wrong type
+            KeyError: If old resource is not found
+        """
+        _log.debug("update.start")
+        row = self._db.execute(
+            "SELECT doc_id, doc FROM resources WHERE id_ = ?", (id_,)
+        ).fetchone()
+        if row is None:
+            raise errors.NoSuchResourceError(id_=id_)
+        doc_id, old = row[0], json.loads(row[1])
+        T = Resource.TYPE_FIELD
+        if old[T] != new_dict[T]:
+            raise ValueError(
+                'New resource type="{}" does not '
+                'match current resource type "{}"'.format(new_dict[T], old[T])
+            )
+        # round-trip through JSON to compare values as they are stored
+        new_dict = json.loads(json.dumps(new_dict))
+        changed = {k: v for k, v in new_dict.items() if k not in old or old[k] != v}
+        _log.debug(f"update resource {id_} with new values: {changed}")
+        if not changed:
+            return
+        old.update(changed)
+        with self._db:
+            self._db.execute(
+                "UPDATE resources SET id_ = ?, doc = ? WHERE doc_id = ?",
+                (old[Resource.ID_FIELD], json.dumps(old), doc_id),
+            )
+            self._index(doc_id, old)
+
+
+#: Resource database classes, by backend name
+BACKENDS = {"tinydb": ResourceDB, "sqlite": SQLiteResourceDB}
+
+#: File extensions of the SQLite backend. Other files use TinyDB.
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
+
+def backend_for_file(dbfile):
+    """Get the name of the backend used for a resource database file.
+
+    Args:
+        dbfile (str): DB location
+    Returns:
+        (str) Key in :data:`BACKENDS`
+    """
+    if os.path.splitext(str(dbfile))[1].lower() in SQLITE_EXTENSIONS:
+        return "sqlite"
+    return "tinydb"
+
+
+def open_resource_db(dbfile, backend=None):
+    """Open a resource database.
+
+    Args:
+        dbfile (str): DB location
+        backend (str): Key in :data:`BACKENDS`. If not given, it is
+            chosen from the extension of `dbfile` by :func:`backend_for_file`.
+    Returns:
+        (ResourceDB) The resource database
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend is None:
+        backend = backend_for_file(dbfile)
+    try:
+        db_class = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown resource DB backend '{backend}'. "
+            f"Must be one of: {', '.join(BACKENDS)}"
+        )
+    return db_class(dbfile)
+
+
+def migrate(src, dest):
+    """Copy all the resources from one resource database into another.
+
+    Internal (numeric) identifiers are preserved when the destination is
+    an SQLite database.
+
+    Args:
+        src (Union[str, ResourceDB]): Source DB, or its location
+        dest (Union[str, ResourceDB]): Destination DB, or its location. It must be empty.
+    Returns:
+        (int) Number of resources copied
+    Raises:
+        errors.DMFError: If the destination DB is not empty
+    """
+    if not isinstance(src, ResourceDB):
+        src = open_resource_db(src)
+    if not isinstance(dest, ResourceDB):
+        dest = open_resource_db(dest)
+    if len(dest) > 0:
+        raise errors.DMFError("Destination resource DB is not empty")
+    n = 0
+    if isinstance(dest, SQLiteResourceDB):
+        with dest._db:
+            for rsrc in src.find({}):
+                doc_id = rsrc.v.pop("doc_id")
+                dest._insert(rsrc.v, doc_id=doc_id)
+                n += 1
+    else:
+        for rsrc in src.find({}):
+            del rsrc.v["doc_id"]
+            dest.put(rsrc)
+            n += 1
+    return n
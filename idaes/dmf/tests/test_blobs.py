@@ -0,0 +1,146 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Tests for idaes.dmf.blobs module
+"""
+import os
+import shutil
+import stat
+
+# third-party
+import pytest
+
+# package
+from idaes.dmf.blobs import BlobStore
+from idaes.dmf.resource import hash_file
+
+__author__ = "Dan Gunter"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # hard links, whether or not the filesystem supports clones
+    monkeypatch.setattr(BlobStore, "_reflink", staticmethod(lambda src, dest: False))
+    return BlobStore(tmp_path / "blobs", hard_links=True)
+
+
+@pytest.mark.unit
+def test_add(store, tmp_path):
+    src = tmp_path / "data.txt"
+    src.write_bytes(os.urandom(BlobStore.CHUNK_SIZE * 2 + 10))
+    sha1 = store.add(src)
+    assert sha1 == hash_file(src)
+    assert sha1 in store
+    assert store.blob_path(sha1).read_bytes() == src.read_bytes()
+    assert store.refcount(sha1) == 0
+    # adding again (with or without the hash) uses the same blob
+    assert store.add(src) == sha1
+    assert store.add(src, sha1=sha1) == sha1
+    assert len(list(store.path.glob("*/*"))) == 1
+    assert len(list(store.path.glob(".tmp-*"))) == 0
+
+
+@pytest.mark.unit
+def test_add_modified_same_size(store, tmp_path):
+    src = tmp_path / "data.txt"
+    src.write_text("some data")
+    sha1 = store.add(src)
+    # modified after its hash was recorded, with the same size
+    src.write_text("same size")
+    new_sha1 = store.add(src, sha1=sha1)
+    assert new_sha1 == hash_file(src) != sha1
+    assert store.blob_path(new_sha1).read_text() == "same size"
+
+
+@pytest.mark.unit
+def test_add_wrong_hash(store, tmp_path):
+    src = tmp_path / "data.txt"
+    src.write_text("some data")
+    sha1 = store.add(src, sha1="0123456789abcdef")
+    assert sha1 == hash_file(src)
+    assert "0123456789abcdef" not in store
+
+
+@pytest.mark.unit
+def test_link_release(store, tmp_path):
+    src = tmp_path / "data.txt"
+    src.write_text("some data")
+    sha1 = store.add(src)
+    dests = [tmp_path / f"copy{i}.txt" for i in range(3)]
+    for dest in dests:
+        store.link(sha1, dest)
+        assert dest.read_text() == "some data"
+        # shared with the blob, so it must not be modified in place
+        assert stat.S_IMODE(dest.stat().st_mode) == 0o444
+    assert store.refcount(sha1) == 3
+    with pytest.raises(FileExistsError):
+        store.link(sha1, dests[0])
+    with pytest.raises(KeyError):
+        store.link("0123456789abcdef", tmp_path / "nothing.txt")
+    for i, dest in enumerate(dests):
+        assert not store.release(sha1)
+        dest.unlink()
+        assert store.refcount(sha1) == 2 - i
+    assert store.release(sha1)
+    assert sha1 not in store
+    assert not store.release(sha1)
+
+
+@pytest.mark.unit
+def test_link_no_hard_links(store, tmp_path, monkeypatch):
+    src = tmp_path / "data.txt"
+    src.write_text("some data")
+    sha1 = store.add(src)
+
+    def no_link(*args):
+        raise OSError("not supported")
+
+    monkeypatch.setattr(os, "link", no_link)
+    dest = tmp_path / "copy.txt"
+    store.link(sha1, dest)
+    assert dest.read_text() == "some data"
+    assert store.refcount(sha1) == 0
+    # an independent copy
+    dest.write_text("other data")
+    assert store.blob_path(sha1).read_text() == "some data"
+
+
+@pytest.mark.unit
+def test_link_copy_by_default(store, tmp_path):
+    src = tmp_path / "data.txt"
+    src.write_text("some data")
+    copies = BlobStore(tmp_path / "copies")
+    sha1 = copies.add(src)
+    dest = tmp_path / "copy.txt"
+    copies.link(sha1, dest)
+    assert copies.refcount(sha1) == 0
+    dest.write_text("other data")
+    assert copies.blob_path(sha1).read_text() == "some data"
+
+
+@pytest.mark.unit
+def test_link_reflink_first(store, tmp_path, monkeypatch):
+    src = tmp_path / "data.txt"
+    src.write_text("some data")
+    sha1 = store.add(src)
+
+    def reflink(src, dest):
+        shutil.copyfile(src, dest)
+        return True
+
+    monkeypatch.setattr(BlobStore, "_reflink", staticmethod(reflink))
+    dest = tmp_path / "clone.txt"
+    store.link(sha1, dest)
+    assert store.refcount(sha1) == 0
+    dest.write_text("other data")
+    assert store.blob_path(sha1).read_text() == "some data"
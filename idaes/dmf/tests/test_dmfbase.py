@@ -16,6 +16,7 @@ Tests for idaes.dmf.dmfbase module
 Skip tests that do chmod() except on Linux, as Windows at least leaves
 the resulting directories in an un-removable state.
 """
+import copy
 import json
 import logging
 import os
@@ -32,6 +33,7 @@ import pytest
 from idaes.dmf import resource
 from idaes.dmf import errors
 from idaes.dmf.dmfbase import DMFConfig, DMF
+from idaes.dmf.blobs import BlobStore
 from idaes.util.system import NamedTemporaryFile
 from .util import init_logging
 
@@ -285,6 +287,89 @@ def test_dmf_add():
     dmf.add(r)
 
 
+@pytest.mark.unit
+def test_dmf_add_datafiles_stored_once(monkeypatch):
+    # hard links, whether or not the filesystem supports clones
+    monkeypatch.setattr(BlobStore, "_reflink", staticmethod(lambda src, dest: False))
+    tmp_dir = Path(scratch_dir) / "dmf_add_stored_once"
+    dmf = DMF(path=tmp_dir, create=True)
+    assert not dmf.datafile_links
+    dmf.datafile_links = True
+    assert DMF(path=tmp_dir).datafile_links
+    data_file = tmp_dir / "data.csv"
+    data_file.write_text("a,b\n1,2\n")
+    rsrcs = []
+    for i in range(3):
+        r = resource.Resource(value={"desc": f"resource {i}"})
+        r.add_data_file(data_file)
+        dmf.add(r)
+        rsrcs.append(r)
+    # another file, with different name and same contents
+    other_file = tmp_dir / "other.csv"
+    other_file.write_text("a,b\n1,2\n")
+    r = resource.Resource(value={"desc": "other resource"})
+    r.v["datafiles"].append({"path": str(other_file), "do_copy": True})
+    dmf.add(r)
+    rsrcs.append(r)
+    sha1 = rsrcs[0].v["datafiles"][0]["sha1"]
+    assert r.v["datafiles"][0]["sha1"] == sha1
+    blob_dir = Path(dmf.datafiles_path) / DMF.BLOB_DIR
+    assert len([p for p in blob_dir.glob("*/*")]) == 1
+    assert dmf._blobs.refcount(sha1) == 4
+    # datafiles have the right contents and names
+    for r in rsrcs:
+        found = dmf.fetch_one(r.id)
+        paths = list(found.get_datafiles())
+        assert len(paths) == 1
+        assert paths[0].read_text() == "a,b\n1,2\n"
+    assert paths[0].name == "other.csv"
+    # stored contents are removed with the last resource using them
+    for i, r in enumerate(rsrcs):
+        path = next(dmf.fetch_one(r.id).get_datafiles())
+        dmf.remove(identifier=r.id)
+        assert not path.parent.exists()
+        assert dmf._blobs.refcount(sha1) == len(rsrcs) - i - 1
+    assert len([p for p in blob_dir.glob("*/*")]) == 0
+
+
+@pytest.mark.unit
+def test_dmf_add_datafiles_writable(monkeypatch):
+    monkeypatch.setattr(BlobStore, "_reflink", staticmethod(lambda src, dest: False))
+    tmp_dir = Path(scratch_dir) / "dmf_add_writable"
+    dmf = DMF(path=tmp_dir, create=True)
+    data_file = tmp_dir / "data.csv"
+    data_file.write_text("a,b\n1,2\n")
+    paths = []
+    for i in range(2):
+        r = resource.Resource(value={"desc": f"resource {i}"})
+        r.add_data_file(data_file)
+        dmf.add(r)
+        paths.append(next(dmf.fetch_one(r.id).get_datafiles()))
+    # each resource has its own copy, which can be edited in place
+    paths[0].write_text("a,b\n3,4\n")
+    assert paths[1].read_text() == "a,b\n1,2\n"
+
+
+@pytest.mark.unit
+def test_dmf_remove_datafiles_shared_dir():
+    tmp_dir = Path(scratch_dir) / "dmf_remove_shared_dir"
+    dmf = DMF(path=tmp_dir, create=True)
+    data_file = tmp_dir / "data.csv"
+    data_file.write_text("1,2,3\n")
+    r = resource.Resource(value={"desc": "original"})
+    r.add_data_file(data_file)
+    dmf.add(r)
+    # a stored copy of the first resource shares its datafiles directory
+    r2 = resource.Resource(value=copy.deepcopy(r.v))
+    r2.v["id_"] = resource.identifier_str()
+    dmf.update(r2, upsert=True)
+    path = next(dmf.fetch_one(r2.id).get_datafiles())
+    dmf.remove(identifier=r.id)
+    assert path.read_text() == "1,2,3\n"
+    dmf.remove(identifier=r2.id)
+    assert not path.exists()
+
+
 @pytest.mark.unit
 def test_dmf_add_duplicate():
     tmp_dir = Path(scratch_dir) / "dmf_add_duplicate"
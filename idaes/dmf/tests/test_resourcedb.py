@@ -0,0 +1,336 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES), and is copyright (c) 2018-2021
+# by the software owners: The Regents of the University of California, through
+# Lawrence Berkeley National Laboratory,  National Technology & Engineering
+# Solutions of Sandia, LLC, Carnegie Mellon University, West Virginia University
+# Research Corporation, et al.  All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and
+# license information.
+#################################################################################
+"""
+Test the resource database backends in `idaes.dmf.resourcedb`.
+"""
+# stdlib
+import logging
+from pathlib import Path
+import re
+from tempfile import TemporaryDirectory
+from typing import Union
+
+# third-party
+import pytest
+
+# package
+from idaes.dmf import errors, resource, resourcedb, DMF
+from idaes.dmf.resource import Predicates
+
+# for testing
+from .util import init_logging
+
+__author__ = "Dan Gunter"
+
+init_logging()
+_log = logging.getLogger(__name__)
+
+scratch_dir: Union[TemporaryDirectory, None] = None
+scratch_path: Union[Path, None] = None
+
+
+def setup_module(module):
+    global scratch_dir, scratch_path
+    scratch_dir = TemporaryDirectory(prefix="idaes_dmf_")
+    scratch_path = Path(scratch_dir.name)
+
+
+def teardown_module(module):
+    global scratch_dir
+    del scratch_dir
+
+
+DB_FILES = {"tinydb": "resourcedb.json", "sqlite": "resourcedb.sqlite"}
+
+
+def populate(db):
+    """Add resources with tags, aliases, data and relations to `db`.
+
+    Relations: r0 -> uses -> r1 -> version -> r2 -> derived -> r3, r4
+    """
+    r = []
+    for i in range(10):
+        rsrc = resource.Resource(
+            value={
+                "tags": ["all", "even" if i % 2 == 0 else "odd"],
+                "data": {"i": i},
+            },
+            type_=resource.ResourceTypes.data if i < 5 else resource.ResourceTypes.code,
+            name=f"r{i}",
+        )
+        r.append(rsrc)
+    cr = resource.create_relation
+    cr(r[0], Predicates.uses, r[1])
+    cr(r[1], Predicates.version, r[2])
+    cr(r[2], Predicates.derived, r[3])
+    cr(r[2], Predicates.derived, r[4])
+    for rsrc in r:
+        db.put(rsrc)
+    return r
+
+
+@pytest.fixture
+def dbs():
+    """Both backends, populated with the same resources."""
+    result = {}
+    for backend, filename in DB_FILES.items():
+        path = scratch_path / f"{backend}_{len(list(scratch_path.iterdir()))}"
+        path.mkdir()
+        db = resourcedb.open_resource_db(str(path / filename))
+        assert isinstance(db, resourcedb.BACKENDS[backend])
+        result[backend] = (db, populate(db))
+    return result
+
+
+def names(resources):
+    return [r.name for r in resources]
+
+
+@pytest.mark.unit
+def test_backend_for_file():
+    assert resourcedb.backend_for_file("a/resourcedb.json") == "tinydb"
+    assert resourcedb.backend_for_file("a/resourcedb.sqlite") == "sqlite"
+    assert resourcedb.backend_for_file("a/resources.DB") == "sqlite"
+    with pytest.raises(ValueError):
+        resourcedb.open_resource_db("foo.json", backend="nosuchbackend")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "filter_dict,flags",
+    [
+        ({}, 0),
+        ({"tags": ["even"]}, 0),
+        ({"tags": ["even", "nosuchtag"]}, 0),
+        ({"tags!": ["all", "odd"]}, 0),
+        ({"tags!": ["odd", "even"]}, 0),
+        ({"aliases": ["r3", "r7"]}, 0),
+        ({"type": resource.ResourceTypes.code}, 0),
+        ({"type": resource.ResourceTypes.code, "tags": ["even"]}, 0),
+        ({"data.i": {"$ge": 3, "$lt": 7}}, 0),
+        ({"data.i": {"$ne": 3}, "tags": ["odd"]}, 0),
+        ({"data.i": 4}, 0),
+        ({"data.i": True}, 0),
+        ({"data.j": False}, 0),
+        ({"desc": "~^$"}, 0),
+        ({"aliases": [{"$ne": "r1"}]}, 0),
+    ],
+)
+def test_find(dbs, filter_dict, flags):
+    results = {}
+    for backend, (db, _) in dbs.items():
+        results[backend] = names(db.find(filter_dict, flags=flags))
+    assert results["tinydb"] == results["sqlite"]
+    if not filter_dict:
+        assert len(results["sqlite"]) == 10
+
+
+@pytest.mark.unit
+def test_find_id(dbs):
+    for backend, (db, r) in dbs.items():
+        found = list(db.find({resource.Resource.ID_FIELD: r[6].id}))
+        assert names(found) == ["r6"]
+        # prefix match, as done by DMF.find_by_id()
+        prefix = r[6].id[:8].upper()
+        found = list(
+            db.find(
+                {resource.Resource.ID_FIELD: f"~{prefix}[a-z]*"}, flags=re.IGNORECASE
+            )
+        )
+        assert "r6" in names(found)
+        # internal identifiers
+        doc_ids = list(db.find({"aliases": ["r6"]}, id_only=True))
+        assert len(doc_ids) == 1
+        assert db.get(doc_ids[0]).name == "r6"
+        assert db.get(123456) is None
+
+
+@pytest.mark.unit
+def test_put_duplicate(dbs):
+    for backend, (db, r) in dbs.items():
+        with pytest.raises(errors.DuplicateResourceError):
+            db.put(r[0])
+        assert len(db) == 10
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "outgoing,maxdepth,expected",
+    [
+        (True, 0, [(1, "uses", "r1"), (2, "version", "r2"), (3, "derived", "r3"), (3, "derived", "r4")]),
+        (True, 1, [(1, "uses", "r1")]),
+        (True, 2, [(1, "uses", "r1"), (2, "version", "r2")]),
+        (False, 0, [(1, "derived", "r2"), (2, "version", "r1"), (3, "uses", "r0")]),
+        (False, 1, [(1, "derived", "r2")]),
+    ],
+)
+def test_find_related(dbs, outgoing, maxdepth, expected):
+    for backend, (db, r) in dbs.items():
+        start = r[0] if outgoing else r[4]
+        result = [
+            (d, rel.predicate, m["aliases"][0])
+            for d, rel, m in db.find_related(
+                start.id, outgoing=outgoing, maxdepth=maxdepth, meta=["aliases"]
+            )
+        ]
+        assert result == expected
+
+
+@pytest.mark.unit
+def test_find_related_filter(dbs):
+    results = {}
+    for backend, (db, r) in dbs.items():
+        results[backend] = [
+            m["aliases"][0]
+            for d, rel, m in db.find_related(
+                r[0].id, filter_dict={"data.i": {"$lt": 4}}, meta=["aliases"]
+            )
+        ]
+    assert results["tinydb"] == results["sqlite"] == ["r1", "r2", "r3"]
+
+
+@pytest.mark.unit
+def test_update_delete(dbs):
+    for backend, (db, r) in dbs.items():
+        r[5].v["tags"] = ["all", "five"]
+        r[5].v["desc"] = "changed"
+        db.update(r[5].id, r[5].v)
+        assert names(db.find({"tags": ["five"]})) == ["r5"]
+        assert names(db.find({"tags": ["odd"]})) == ["r1", "r3", "r7", "r9"]
+        assert db.find_one({"aliases": ["r5"]}).v["desc"] == "changed"
+        with pytest.raises(ValueError):
+            db.update(r[5].id, dict(r[5].v, type=resource.ResourceTypes.data))
+        with pytest.raises(errors.NoSuchResourceError):
+            db.update(resource.identifier_str(), r[5].v)
+        # delete by id, list of internal ids and filter
+        db.delete(id_=r[9].id)
+        doc_ids = list(db.find({"aliases": ["r7", "r8"]}, id_only=True))
+        db.delete(idlist=doc_ids, internal_ids=True)
+        db.delete(filter_dict={"tags": ["five"]})
+        assert len(db) == 6
+        assert names(db.find({"tags": ["all"]})) == ["r0", "r1", "r2", "r3", "r4", "r6"]
+        # relations of deleted resources are gone
+        db.delete(id_=r[2].id)
+        related = list(db.find_related(r[0].id, meta=["aliases"]))
+        assert [m["aliases"][0] for d, rel, m in related] == ["r1"]
+
+
+@pytest.mark.unit
+def test_migrate(dbs):
+    src, r = dbs["tinydb"]
+    r[5].v["desc"] = "changed"
+    src.update(r[5].id, r[5].v)
+    dest_file = scratch_path / "migrated.sqlite"
+    n = resourcedb.migrate(src, str(dest_file))
+    assert n == 10
+    dest = resourcedb.open_resource_db(str(dest_file))
+    assert len(dest) == 10
+    src_ids = list(src.find({"tags": ["even"]}, id_only=True))
+    assert list(dest.find({"tags": ["even"]}, id_only=True)) == src_ids
+    assert dest.find_one({"aliases": ["r5"]}).v["desc"] == "changed"
+    assert len(list(dest.find_related(r[0].id, meta=["aliases"]))) == 4
+    # destination must be empty
+    with pytest.raises(errors.DMFError):
+        resourcedb.migrate(src, dest)
+
+
+@pytest.mark.unit
+def test_dmf_sqlite():
+    tmp_dir = scratch_path / "dmf_sqlite"
+    dmf = DMF(path=tmp_dir, create=True)
+    dmf.db_file = "resourcedb.sqlite"
+    dmf = DMF(path=tmp_dir)
+    assert isinstance(dmf._db, resourcedb.SQLiteResourceDB)
+    r = [resource.Resource({"name": f"r{i}"}) for i in range(3)]
+    resource.create_relation(r[0], Predicates.uses, r[1])
+    resource.create_relation(r[1], Predicates.uses, r[2])
+    for rsrc in r:
+        dmf.add(rsrc)
+    assert dmf.count() == 3
+    assert dmf.find_one_by_id(r[1].id[:6]).name == "r1"
+    related = [m["aliases"][0] for d, rel, m in dmf.find_related(r[0], meta=["aliases"])]
+    assert related == ["r1", "r2"]
+    dmf.remove(identifier=r[2].id)
+    assert dmf.count() == 2
+    assert dmf.fetch_one(r[1].id).v["relations"] == [r[1].v["relations"][0]]
+
+
+@pytest.mark.unit
+def test_find_in(dbs):
+    results = {}
+    for backend, (db, r) in dbs.items():
+        ids = [r[i].id for i in (7, 2, 5)] + [resource.identifier_str()]
+        results[backend] = names(db.find({resource.Resource.ID_FIELD: {"$in": ids}}))
+        assert names(db.find({"data.i": {"$in": [1, 3]}})) == ["r1", "r3"]
+    assert results["tinydb"] == results["sqlite"] == ["r2", "r5", "r7"]
+
+
+@pytest.mark.unit
+def test_relation_index():
+    filename = str(scratch_path / "relation_index.json")
+    db = resourcedb.open_resource_db(filename)
+    r = populate(db)
+    # index is kept up to date by update() and delete()
+    resource.create_relation(r[4], Predicates.uses, r[8])
+    db.update(r[4].id, r[4].v)
+    db.update(r[8].id, r[8].v)
+    db.delete(id_=r[1].id)
+    # .. and persists when the DB is re-opened
+    db = resourcedb.open_resource_db(filename)
+    assert db._index_table.get(doc_id=1) is not None
+    related = [m["aliases"][0] for d, rel, m in db.find_related(r[2].id, meta=["aliases"])]
+    assert related == ["r3", "r4", "r8"]
+    assert list(db.find_related(r[0].id)) == []
+    # index is rebuilt, with the same contents, if missing
+    index = db._index_table.get(doc_id=1)
+    db._index_table.truncate()
+    assert db._relation_index() == index
+    related = [m["aliases"][0] for d, rel, m in db.find_related(r[8].id, outgoing=False, meta=["aliases"])]
+    assert related == ["r4", "r2"]
+
+
+@pytest.mark.unit
+def test_relation_index_fingerprint():
+    filename = str(scratch_path / "relation_index_fingerprint.json")
+    db = resourcedb.open_resource_db(filename)
+    r = populate(db)
+    index = db._index_table.get(doc_id=1)
+    assert (index["count"], index["max_doc_id"]) == (5, 5)
+    # resources without relations are indexed when the index is next used
+    # (r5-r9 were added after the last resource with relations)
+    db.put(resource.Resource(value={"data": {}}, name="r10"))
+    assert db._index_table.get(doc_id=1) == index
+    assert db._relation_index()["count"] == 11
+    # resources deleted behind the index's back, e.g. by an older version
+    doc_id = db.find_one({"aliases": ["r3"]}).v["doc_id"]
+    db._db.remove(doc_ids=[doc_id])
+    related = [m["aliases"][0] for d, rel, m in db.find_related(r[2].id, meta=["aliases"])]
+    assert related == ["r4"]
+    # indexes saved without a fingerprint are rebuilt
+    db._index_table.update(lambda doc: doc.pop("count"), doc_ids=[1])
+    assert db._relation_index()["count"] == 10
+
+
+@pytest.mark.unit
+def test_find_related_resources():
+    tmp_dir = scratch_path / "dmf_related"
+    dmf = DMF(path=tmp_dir, create=True)
+    r = [resource.Resource({"name": f"r{i}"}) for i in range(4)]
+    resource.create_relation(r[0], Predicates.uses, r[1])
+    resource.create_relation(r[0], Predicates.derived, r[2])
+    resource.create_relation(r[1], Predicates.uses, r[3])
+    for rsrc in r:
+        dmf.add(rsrc)
+    assert names(dmf.find_related_resources(r[0])) == ["r1", "r2", "r3"]
+    assert names(dmf.find_related_resources(r[0], predicate=Predicates.uses)) == ["r1", "r3"]
+    assert names(dmf.find_related_resources(r[3], outgoing=False)) == ["r1", "r0"]
@@ -93,6 +93,10 @@ class Workspace(object):
          +- resourcedb.json: Resource metadata "database" (uses TinyDB)
          +- files: Data files for all resources
 
+    The name of the resource metadata database is set by ``db_file`` in the
+    configuration file. Files ending in ``.sqlite``, ``.sqlite3`` or ``.db`` are
+    stored with SQLite instead of TinyDB (see ``dmf migrate``).
+
     The configuration file is a `YAML`_ formatted file
 
     .. _YAML: http://www.yaml.org/
@@ -116,6 +120,12 @@ class Workspace(object):
             Full path to the location of the built (not source) Sphinx HTML
             documentation for the `idaes_dmf` package. See
             DMF Help Configuration for more details.
+        datafile_links
+            If true, data files copied into the workspace are hard links to a
+            single stored file per distinct contents, where the filesystem
+            does not support copy-on-write clones. This saves space, but the
+            files are read-only, and must be copied to be edited. If false
+            (the default), each resource gets its own writable copy.
 
     There are many different possible "styles" of formatting a list of values
     in YAML, but we prefer the simple block-indented style, where the key is
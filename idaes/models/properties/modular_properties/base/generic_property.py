@@ -14,8 +14,11 @@
 Framework for generic property packages
 """
 # Import Python libraries
+import itertools
 import types
 
+import numpy as np
+
 # Import Pyomo libraries
 from pyomo.environ import (
     Block,
@@ -32,6 +35,17 @@ from pyomo.environ import (
     Reference,
 )
 from pyomo.common.config import ConfigBlock, ConfigValue, In, Bool
+from pyomo.core.expr.numvalue import native_types
+from pyomo.core.expr.numeric_expr import (
+    Expr_ifExpression,
+    ExternalFunctionExpression,
+    UnaryFunctionExpression,
+)
+from pyomo.core.expr.visitor import (
+    ExpressionValueVisitor,
+    identify_mutable_parameters,
+    identify_variables,
+)
 from pyomo.util.calc_var_value import calculate_variable_from_constraint
 
 # Import IDAES cores
@@ -1342,23 +1356,26 @@ class _GenericStateBlock(StateBlock):
         opt = get_solver(solver, optarg)
 
         # ---------------------------------------------------------------------
-        # If present, initialize bubble and dew point calculations
+        # If present, initialize bubble and dew point calculations. This is
+        # done for all elements together where possible, and element by
+        # element otherwise.
+        scalar_init = blk._init_bubble_dew_vectorized()
         for k in blk.keys():
             T_units = blk[k].params.get_metadata().default_units["temperature"]
             # Bubble temperature initialization
-            if hasattr(blk[k], "_mole_frac_tbub"):
+            if (k, "_init_Tbub") in scalar_init:
                 blk._init_Tbub(blk[k], T_units)
 
             # Dew temperature initialization
-            if hasattr(blk[k], "_mole_frac_tdew"):
+            if (k, "_init_Tdew") in scalar_init:
                 blk._init_Tdew(blk[k], T_units)
 
             # Bubble pressure initialization
-            if hasattr(blk[k], "_mole_frac_pbub"):
+            if (k, "_init_Pbub") in scalar_init:
                 blk._init_Pbub(blk[k], T_units)
 
             # Dew pressure initialization
-            if hasattr(blk[k], "_mole_frac_pdew"):
+            if (k, "_init_Pdew") in scalar_init:
                 blk._init_Pdew(blk[k], T_units)
 
             # Solve bubble and dew point constraints
@@ -1648,6 +1665,173 @@ class _GenericStateBlock(StateBlock):
         init_log = idaeslog.getInitLogger(blk.name, outlvl, tag="properties")
         init_log.info_high("State released.")
 
+    def _init_bubble_dew_vectorized(blk):
+        """
+        Initialize the bubble and dew points of all elements of the state
+        block together. This uses the same damped Newton iterations and closed
+        forms as _init_Tbub, _init_Tdew, _init_Pbub and _init_Pdew, applied to
+        arrays of the mole fractions and pressures of the elements.
+
+        Elements are grouped by parameter block and phase pair, and the
+        saturation pressures and Henry's constants of each group are only
+        built once (see _TemperatureFunctions).
+
+        Returns:
+            set of (index, method name) tuples of the elements which could not
+            be vectorized, and need to be initialized with the named method.
+        """
+        scalar_init = set()
+        functions = {}
+        for method, mole_frac in (
+            ("_init_Tbub", "_mole_frac_tbub"),
+            ("_init_Tdew", "_mole_frac_tdew"),
+            ("_init_Pbub", "_mole_frac_pbub"),
+            ("_init_Pdew", "_mole_frac_pdew"),
+        ):
+            groups = {}
+            for k in blk.keys():
+                b = blk[k]
+                if not hasattr(b, mole_frac):
+                    continue
+                if method == "_init_Tdew" and (k, "_init_Tbub") in scalar_init:
+                    # Tdew starts from Tbub, so wait for it
+                    scalar_init.add((k, method))
+                    continue
+                for pp in b.params._pe_pairs:
+                    raoult_comps, henry_comps = _valid_VL_component_list(b, pp)
+                    if raoult_comps == []:
+                        continue
+                    l_phase = None
+                    if henry_comps != []:
+                        if b.params.get_phase(pp[0]).is_liquid_phase():
+                            l_phase = pp[0]
+                        else:
+                            l_phase = pp[1]
+                    key = (b.params, pp, tuple(raoult_comps), tuple(henry_comps))
+                    groups.setdefault(key + (l_phase,), []).append(b)
+
+            dT = method in ("_init_Tbub", "_init_Tdew")
+            for key, blocks in groups.items():
+                params, pp, raoult_comps, henry_comps, l_phase = key
+                if key + (dT,) not in functions:
+                    functions[key + (dT,)] = _TemperatureFunctions(
+                        blocks[0], raoult_comps, henry_comps, l_phase, dT=dT
+                    )
+                funcs = functions[key + (dT,)]
+                if not funcs.vectorized:
+                    scalar_init.update((b.index(), method) for b in blocks)
+                    continue
+
+                x_raoult = np.array(
+                    [[value(b.mole_frac_comp[j]) for j in raoult_comps] for b in blocks]
+                )
+                x_henry = np.array(
+                    [[value(b.mole_frac_comp[j]) for j in henry_comps] for b in blocks]
+                ).reshape(len(blocks), len(henry_comps))
+                getattr(blk, method + "_arrays")(blocks, pp, funcs, x_raoult, x_henry)
+
+        return scalar_init
+
+    def _init_Tbub_arrays(self, blocks, pp, funcs, x_raoult, x_henry):
+        P = np.array([value(b.pressure) for b in blocks])
+
+        def residual(T, idx):
+            f = (
+                (funcs(funcs.psat, T) * x_raoult[idx]).sum(axis=1)
+                + (funcs(funcs.henry, T) * x_henry[idx]).sum(axis=1)
+                - P[idx]
+            )
+            df = (funcs(funcs.dpsat_dT, T) * x_raoult[idx]).sum(axis=1) + (
+                funcs(funcs.dhenry_dT, T) * x_henry[idx]
+            ).sum(axis=1)
+            return f, df
+
+        # Start from lowest component temperature_crit, as in _init_Tbub
+        T = _damped_newton(
+            residual, np.full(len(blocks), funcs.temperature_crit_min - 1)
+        )
+        with np.errstate(all="ignore"):
+            y_raoult = x_raoult * funcs(funcs.psat, T) / P[:, None]
+            y_henry = x_henry * funcs(funcs.henry, T) / P[:, None]
+        for i, b in enumerate(blocks):
+            b.temperature_bubble[pp].value = float(T[i])
+        self._set_mole_frac_arrays(blocks, pp, "tbub", y_raoult, y_henry)
+
+    def _init_Tdew_arrays(self, blocks, pp, funcs, x_raoult, x_henry):
+        P = np.array([value(b.pressure) for b in blocks])
+
+        def residual(T, idx):
+            psat = funcs(funcs.psat, T)
+            henry = funcs(funcs.henry, T)
+            f = (
+                P[idx]
+                * (
+                    (x_raoult[idx] / psat).sum(axis=1)
+                    + (x_henry[idx] / henry).sum(axis=1)
+                )
+                - 1
+            )
+            df = -P[idx] * (
+                (x_raoult[idx] / psat ** 2 * funcs(funcs.dpsat_dT, T)).sum(axis=1)
+                + (x_henry[idx] / henry ** 2 * funcs(funcs.dhenry_dT, T)).sum(axis=1)
+            )
+            return f, df
+
+        # Start from Tbub if it has been calculated, as in _init_Tdew
+        T0 = np.full(len(blocks), funcs.temperature_crit_min - 1)
+        for i, b in enumerate(blocks):
+            if (
+                hasattr(b, "_mole_frac_tbub")
+                and b.temperature_bubble[pp].value is not None
+            ):
+                T0[i] = b.temperature_bubble[pp].value
+        T = _damped_newton(residual, T0)
+        with np.errstate(all="ignore"):
+            x_l_raoult = x_raoult * P[:, None] / funcs(funcs.psat, T)
+            x_l_henry = x_henry * P[:, None] / funcs(funcs.henry, T)
+        for i, b in enumerate(blocks):
+            b.temperature_dew[pp].value = float(T[i])
+        self._set_mole_frac_arrays(blocks, pp, "tdew", x_l_raoult, x_l_henry)
+
+    def _init_Pbub_arrays(self, blocks, pp, funcs, x_raoult, x_henry):
+        T = np.array([value(b.temperature) for b in blocks])
+        with np.errstate(all="ignore"):
+            p_raoult = x_raoult * funcs(funcs.psat, T)
+            p_henry = x_henry * funcs(funcs.henry, T)
+            P = p_raoult.sum(axis=1) + p_henry.sum(axis=1)
+            y_raoult = p_raoult / P[:, None]
+            y_henry = p_henry / P[:, None]
+        for i, b in enumerate(blocks):
+            b.pressure_bubble[pp].value = float(P[i])
+        self._set_mole_frac_arrays(blocks, pp, "pbub", y_raoult, y_henry)
+
+    def _init_Pdew_arrays(self, blocks, pp, funcs, x_raoult, x_henry):
+        T = np.array([value(b.temperature) for b in blocks])
+        with np.errstate(all="ignore"):
+            r_raoult = x_raoult / funcs(funcs.psat, T)
+            r_henry = x_henry / funcs(funcs.henry, T)
+            P = 1 / (r_raoult.sum(axis=1) + r_henry.sum(axis=1))
+            x_l_raoult = r_raoult * P[:, None]
+            x_l_henry = r_henry * P[:, None]
+        for i, b in enumerate(blocks):
+            b.pressure_dew[pp].value = float(P[i])
+        self._set_mole_frac_arrays(blocks, pp, "pdew", x_l_raoult, x_l_henry)
+
+    @staticmethod
+    def _set_mole_frac_arrays(blocks, pp, abbrv, x_raoult, x_henry):
+        raoult_comps, henry_comps = _valid_VL_component_list(blocks[0], pp)
+        for i, b in enumerate(blocks):
+            mole_frac = getattr(b, "_mole_frac_" + abbrv)
+            if b.is_property_constructed("log_mole_frac_" + abbrv):
+                log_mole_frac = getattr(b, "log_mole_frac_" + abbrv)
+            else:
+                log_mole_frac = None
+            for comps, x in ((raoult_comps, x_raoult), (henry_comps, x_henry)):
+                for c, j in enumerate(comps):
+                    mole_frac[pp, j].value = float(x[i, c])
+                    if log_mole_frac is not None:
+                        log_mole_frac[pp, j].value = value(log(mole_frac[pp, j]))
+
     def _init_Tbub(self, blk, T_units):
         for pp in blk.params._pe_pairs:
             raoult_comps, henry_comps = _valid_VL_component_list(blk, pp)
@@ -4375,6 +4559,177 @@ def _valid_VL_component_list(blk, pp):
     return raoult_comps, henry_comps
 
 
+# NumPy equivalents of the functions in Pyomo expressions
+_NUMPY_FUNCTIONS = {
+    "log": np.log,
+    "log10": np.log10,
+    "exp": np.exp,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "asin": np.arcsin,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "sinh": np.sinh,
+    "cosh": np.cosh,
+    "tanh": np.tanh,
+    "asinh": np.arcsinh,
+    "acosh": np.arccosh,
+    "atanh": np.arctanh,
+    "ceil": np.ceil,
+    "floor": np.floor,
+}
+
+
+class _ArrayEvaluationVisitor(ExpressionValueVisitor):
+    """
+    Evaluate an expression with NumPy, using an array as the value of one of
+    its components. Raises TypeError if the expression contains an operation
+    that cannot be applied to arrays (e.g. an external function).
+    """
+
+    def __init__(self, component, array):
+        self.component = component
+        self.array = array
+
+    def visit(self, node, values):
+        if isinstance(node, ExternalFunctionExpression):
+            raise TypeError(f"Cannot evaluate external function {node} on arrays")
+        if isinstance(node, Expr_ifExpression):
+            return np.where(*values)
+        if isinstance(node, UnaryFunctionExpression):
+            try:
+                return _NUMPY_FUNCTIONS[node.getname()](values[0])
+            except KeyError:
+                raise TypeError(f"Cannot evaluate {node.getname()} on arrays")
+        return node._apply_operation(values)
+
+    def visiting_potential_leaf(self, node):
+        if node is self.component:
+            return True, self.array
+        if node.__class__ in native_types:
+            return True, node
+        if not node.is_expression_type():
+            return True, value(node)
+        return False, None
+
+
+class _TemperatureFunctions(object):
+    """
+    Saturation pressures and Henry's constants of the components in a phase
+    pair (and, if dT is True, their derivatives with respect to temperature),
+    which can be evaluated for arrays of temperatures.
+
+    The expressions are built once, for a representative state block, in
+    terms of a placeholder temperature. They can be shared by other state
+    blocks with the same parameters unless they depend on the representative
+    block itself, in which case (or if they cannot be evaluated with NumPy)
+    vectorized is False.
+    """
+
+    def __init__(self, b, raoult_comps, henry_comps, l_phase, dT=False):
+        self._temperature = Param(mutable=True, initialize=1.0)
+        self._temperature.construct()
+        T = self._temperature * b.params.get_metadata().default_units["temperature"]
+
+        self.temperature_crit_min = min(
+            b.params.get_component(j).temperature_crit.value for j in raoult_comps
+        )
+
+        self.psat = [
+            get_method(b, "pressure_sat_comp", j)(b, b.params.get_component(j), T)
+            for j in raoult_comps
+        ]
+        self.henry = [
+            b.params.get_component(j)
+            .config.henry_component[l_phase]["method"]
+            .return_expression(b, l_phase, j, T)
+            for j in henry_comps
+        ]
+        if dT:
+            self.dpsat_dT = [
+                get_method(b, "pressure_sat_comp", j)(
+                    b, b.params.get_component(j), T, dT=True
+                )
+                for j in raoult_comps
+            ]
+            self.dhenry_dT = [
+                b.params.get_component(j)
+                .config.henry_component[l_phase]["method"]
+                .dT_expression(b, l_phase, j, T)
+                for j in henry_comps
+            ]
+        else:
+            self.dpsat_dT = self.dhenry_dT = []
+
+        exprs = self.psat + self.henry + self.dpsat_dT + self.dhenry_dT
+        self.vectorized = not any(self._depends_on(e, b) for e in exprs)
+        if self.vectorized:
+            try:
+                for e in exprs:
+                    self(e, np.array([self.temperature_crit_min]))
+            except (TypeError, ValueError):
+                self.vectorized = False
+
+    @staticmethod
+    def _depends_on(expr, b):
+        for comp in itertools.chain(
+            identify_variables(expr), identify_mutable_parameters(expr)
+        ):
+            if not hasattr(comp, "parent_block"):
+                continue  # units
+            parent = comp.parent_block()
+            while parent is not None:
+                if parent is b:
+                    return True
+                parent = parent.parent_block()
+        return False
+
+    def __call__(self, exprs, T):
+        """
+        Evaluate an expression, or a list of expressions, for an array of
+        temperatures (in the default units of the parameters). Returns an
+        array with the shape of T, or with one column per expression.
+        """
+        if not isinstance(exprs, list):
+            visitor = _ArrayEvaluationVisitor(self._temperature, T)
+            with np.errstate(all="ignore"):
+                return np.broadcast_to(visitor.dfs_postorder_stack(exprs), T.shape)
+        if not exprs:
+            return np.zeros(T.shape + (0,))
+        return np.stack([self(e, T) for e in exprs], axis=-1)
+
+
+def _damped_newton(fun, T0):
+    """
+    Newton iterations on the temperatures of a set of elements, with steps
+    limited to 50 (temperature units), as in _init_Tbub and _init_Tdew.
+    Each element stops when its step is at most 0.1, or after 30 iterations.
+
+    Args:
+        fun : Function called as fun(T, idx), returning the residuals and
+            derivatives of the elements idx, at temperatures T
+        T0 : Array of initial temperatures
+
+    Returns:
+        Array of temperatures
+    """
+    T = np.array(T0, dtype=float)
+    idx = np.arange(T.size)
+    for _ in range(30):
+        if idx.size == 0:
+            break
+        T_k = T[idx]
+        f, df = fun(T_k, idx)
+        with np.errstate(all="ignore"):
+            T_next = T_k - np.clip(f / df, -50, 50)
+        T[idx] = T_next
+        idx = idx[np.abs(T_next - T_k) > 1e-1]
+    return T
+
+
 def _temperature_pressure_bubble_dew(b, name):
     #  temperature/pressure bubble/dew
     splt = name.split("_")
@@ -775,6 +775,52 @@ class TestHenryComps(object):
             model.props[1]._mole_frac_pdew[("Vap", "Liq", "C")]
         )
 
+    @pytest.mark.unit
+    def test_init_bubble_dew_vectorized(self):
+        m = ConcreteModel()
+        m.params = GenericParameterBlock(default=configuration)
+        m.props = m.params.build_state_block(
+            [1, 2, 3], default={"defined_state": True}
+        )
+        for k in m.props:
+            m.props[k].flow_mol.fix(1)
+            m.props[k].temperature.fix(368)
+            m.props[k].pressure.fix(101325)
+            m.props[k].mole_frac_comp["A"].fix(0.45)
+            m.props[k].mole_frac_comp["B"].fix(0.45)
+            m.props[k].mole_frac_comp["C"].fix(0.1)
+            m.props[k].temperature_bubble
+            m.props[k].temperature_dew
+            m.props[k].pressure_bubble
+            m.props[k].pressure_dew
+
+        assert m.props._init_bubble_dew_vectorized() == set()
+
+        pp = ("Vap", "Liq")
+        for k in m.props:
+            assert pytest.approx(361.50, abs=0.01) == value(
+                m.props[k].temperature_bubble[pp]
+            )
+            assert pytest.approx(0.1974, abs=1e-4) == value(
+                m.props[k]._mole_frac_tbub[pp + ("C",)]
+            )
+            assert pytest.approx(370.23, abs=0.01) == value(
+                m.props[k].temperature_dew[pp]
+            )
+            assert pytest.approx(0.6744, abs=1e-4) == value(
+                m.props[k]._mole_frac_tdew[pp + ("B",)]
+            )
+            assert pytest.approx(118531, abs=1) == value(
+                m.props[k].pressure_bubble[pp]
+            )
+            assert pytest.approx(0.5918, abs=1e-4) == value(
+                m.props[k]._mole_frac_pbub[pp + ("A",)]
+            )
+            assert pytest.approx(95056, abs=1) == value(m.props[k].pressure_dew[pp])
+            assert pytest.approx(0.0476, abs=1e-4) == value(
+                m.props[k]._mole_frac_pdew[pp + ("C",)]
+            )
+
     @pytest.mark.component
     def test_solve_vle(self, model):
         results = solver.solve(model)
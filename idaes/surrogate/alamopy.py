@@ -19,7 +19,7 @@ import numpy as np
 import pandas as pd
 import json
 
-from pyomo.environ import Constraint, value, sin, cos, log, exp, Set, Reals
+from pyomo.environ import Constraint, sin, cos, log, exp, Set, Reals
 from pyomo.common.config import ConfigValue, In, Path, ListOf, Bool
 from pyomo.common.tee import TeeStream
 from pyomo.common.fileutils import Executable
@@ -39,6 +39,8 @@ alamo = Executable('alamo')
 
 # Define mapping of Pyomo function names for expression evaluation
 GLOBAL_FUNCS = {"sin": sin, "cos": cos, "log": log, "exp": exp}
+# NumPy functions with the same names, for vectorized evaluation
+NUMPY_FUNCS = {"sin": np.sin, "cos": np.cos, "log": np.log, "exp": np.exp}
 
 
 # The values associated with these must match those expected in the .alm file
@@ -944,40 +946,68 @@ class AlamoSurrogate(SurrogateBase):
         self._surrogate_expressions = surrogate_expressions
         self._fcn = None
 
-    def evaluate_surrogate(self, inputs):
+    def evaluate_surrogate(self, inputs, chunksize=None):
         """
         Method to method to evaluate the ALAMO surrogate model at a set of user
         provided values.
 
         Args:
-           dataframe: pandas DataFrame
+           dataframe: pandas DataFrame or iterable of DataFrames
               The dataframe of input values to be used in the evaluation. The dataframe
               needs to contain a column corresponding to each of the input labels. Additional
-              columns are fine, but are not used.
+              columns are fine, but are not used. For datasets that do not fit in memory,
+              an iterable of dataframes can be given instead (e.g. from
+              pandas.read_csv with the chunksize option).
+           chunksize: int or None
+              If given, evaluate the rows of each dataframe in chunks of this size to
+              limit the size of intermediate arrays.
 
         Returns:
             output: pandas Dataframe
               Returns a dataframe of the the output values evaluated at the provided inputs.
               The index of the output dataframe should match the index of the provided inputs.
+              If inputs is an iterable of dataframes, returns a generator of output
+              dataframes, one for each input dataframe.
         """
-        # Create a set of lambda functions for evaluating the surrogate.
+        # Create a set of lambda functions for evaluating the surrogate on
+        # arrays of input values.
         if self._fcn is None:
             fcn = dict()
             for o in self._output_labels:
                 fcn[o] = eval(
                     f"lambda {', '.join(self._input_labels)}: "
                     f"{self._surrogate_expressions[o].split('==')[1]}",
-                    GLOBAL_FUNCS)
+                    NUMPY_FUNCS)
             self._fcn = fcn
 
-        # Use numpy to do the calculations as it is faster
-        inputdata = inputs[self._input_labels].to_numpy()
-        outputs = np.zeros(shape=(inputs.shape[0], len(self._output_labels)))
-
-        for i in range(inputdata.shape[0]):
-            for o in range(len(self._output_labels)):
-                o_name = self._output_labels[o]
-                outputs[i, o] = value(self._fcn[o_name](*inputdata[i, :]))
+        if not isinstance(inputs, pd.DataFrame):
+            return (self._evaluate_dataframe(df, chunksize) for df in inputs)
+        return self._evaluate_dataframe(inputs, chunksize)
+
+    def _evaluate_dataframe(self, inputs, chunksize=None):
+        inputdata = inputs[self._input_labels].to_numpy(dtype=float)
+        n = inputdata.shape[0]
+        if chunksize is None:
+            chunksize = max(n, 1)
+        outputs = np.zeros(shape=(n, len(self._output_labels)))
+
+        for start in range(0, n, chunksize):
+            stop = min(start + chunksize, n)
+            columns = inputdata[start:stop].T
+            finite_inputs = np.isfinite(columns).all(axis=0)
+            for o, o_name in enumerate(self._output_labels):
+                # Broadcast in case the expression does not depend on inputs
+                with np.errstate(all="ignore"):
+                    outputs[start:stop, o] = self._fcn[o_name](*columns)
+                # NumPy returns nan or inf where the Pyomo functions raise
+                # (e.g. log of a non-positive number), so raise here too.
+                # Non-finite inputs propagate to the outputs, as before.
+                bad = ~np.isfinite(outputs[start:stop, o]) & finite_inputs
+                if bad.any():
+                    row = inputs.index[start + np.argmax(bad)]
+                    raise ValueError(
+                        f"Evaluation of surrogate output {o_name} is not "
+                        f"finite for input row {row} (math domain error)")
 
         return pd.DataFrame(data=outputs, index=inputs.index, columns=self._output_labels)
 
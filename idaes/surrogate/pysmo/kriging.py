@@ -22,6 +22,8 @@ import numpy as np
 import pandas as pd
 import pickle
 from pyomo.core import Param, exp
+from scipy.linalg import cho_solve
+from scipy.linalg.lapack import dpotri
 from scipy.optimize import basinhopping
 import scipy.optimize as opt
 # Imports from IDAES namespace
@@ -79,9 +81,9 @@ class KrigingModel:
             XY_data (NumPy Array or Pandas Dataframe)   : The dataset for Kriging training. **XY_data** is expected to contain feature and output data, with the output values (y) in the last column.
 
         Keyword Args:
-            numerical_gradients(bool)               : Whether or not numerical gradients should be used in training. This choice determines the algorithm used to solve the problem.
+            numerical_gradients(bool)               : Whether or not gradients should be used in training. This choice determines the algorithm used to solve the problem.
 
-                                                            - numerical_gradients = True: The problem is solved with BFGS using central differencing with a step size of :math:`10^{-6}` to evaluate numerical gradients.
+                                                            - numerical_gradients = True: The problem is solved with BFGS using analytic gradients of the concentrated likelihood (see ``likelihood_gradient``).
                                                             - numerical_gradients = False: The problem is solved with Basinhopping, a stochastic optimization algorithm.
 
             regularization(bool)                    :  This option determines whether or not regularization is considered during Kriging training. Default is True.
@@ -164,6 +166,31 @@ class KrigingModel:
         self.training_rmse = None
 
 
+    @staticmethod
+    def weighted_distance_matrix(x1, x2, theta, p):
+        """
+        The weighted_distance_matrix method calculates the weighted distances between two sets of (scaled) points,
+
+        d(i, j) = sum_k theta_k * abs(x1(i, k) - x2(j, k)) ** p
+
+        The matrix is built one feature at a time to limit the size of intermediate arrays.
+
+        Args:
+            x1                      : first set of points, one point per row
+            x2                      : second set of points, one point per row
+            theta                   : Kriging weights
+            p                       : Kriging exponent
+
+        Returns:
+            distance_matrix         : Matrix of weighted distances, with a row for each point in x1 and a column for each point in x2
+
+        """
+        theta = np.ravel(theta)
+        distance_matrix = np.zeros((x1.shape[0], x2.shape[0]))
+        for k in range(0, x1.shape[1]):
+            distance_matrix += theta[k] * np.abs(x1[:, k, None] - x2[None, :, k]) ** p
+        return distance_matrix
+
     @staticmethod
     def covariance_matrix_generator(x, theta, reg_param, p):
         """
@@ -179,9 +206,7 @@ class KrigingModel:
             cov_matrix              : Regularized co-variance matrix
 
         """
-        distance_matrix = np.zeros((x.shape[0], x.shape[0]))
-        for i in range(0, x.shape[0]):
-            distance_matrix[i, :] = (np.matmul(((np.abs(x[i, :] - x)) ** p), theta)).transpose()
+        distance_matrix = KrigingModel.weighted_distance_matrix(x, x, theta, p)
         cov_matrix = np.exp(-1 * distance_matrix)
         cov_matrix = cov_matrix + reg_param * np.eye(cov_matrix.shape[0])  # Regularization parameter addition, see Forrester book
         return cov_matrix
@@ -189,7 +214,9 @@ class KrigingModel:
     @staticmethod
     def covariance_inverse_generator(x):
         """
-        The covariance_inverse_generator method generates the inverse of the regularized co-variance matrix for a Kriging model
+        The covariance_inverse_generator method generates the inverse of the regularized co-variance matrix for a Kriging model.
+        The inverse is computed from the Cholesky factorization of the matrix, falling back to a general inverse (or the pseudo-inverse)
+        if the matrix is not positive definite.
 
         Args:
             x                       : Regularized co-variance matrix
@@ -199,11 +226,25 @@ class KrigingModel:
 
         """
         try:
-            inverse_x = np.linalg.inv(x)
-        except np.linalg.LinAlgError as LAE:
-            inverse_x = np.linalg.pinv(x)
+            inverse_x = KrigingModel._cholesky_inverse(np.linalg.cholesky(x))
+        except np.linalg.LinAlgError:
+            try:
+                inverse_x = np.linalg.inv(x)
+            except np.linalg.LinAlgError as LAE:
+                inverse_x = np.linalg.pinv(x)
         return inverse_x
 
+    @staticmethod
+    def _cholesky_inverse(L):
+        """
+        Inverse of a matrix from its lower Cholesky factor L
+        """
+        inverse_x, info = dpotri(L, lower=1)
+        if info != 0:
+            raise np.linalg.LinAlgError('Cholesky inverse failed.')
+        inverse_x = np.tril(inverse_x)
+        return inverse_x + np.tril(inverse_x, -1).transpose()
+
     @staticmethod
     def kriging_mean(cov_inv, y):
         """
@@ -262,49 +303,114 @@ class KrigingModel:
     def print_fun(x, f, accepted):
         print("at minimum %.4f accepted %d" % (f, int(accepted)))
 
-    def objective_function(self, var_vector, x, y, p):
+    def concentrated_likelihood(self, var_vector, x, y, p, gradient=False):
         """
-        The objective_function method calculates the concentrated likelihood function
+        The concentrated_likelihood method calculates the concentrated likelihood function and optionally its analytic gradient.
+        The co-variance matrix is factorized once (Cholesky), and the factorization is used for both the log-determinant and the solves.
 
         Args:
             var_vector(NumPy Array)        : Numpy array containing the Kriging paramaters (Kriging weights and regularization parameter)
             x(NumPy Array)                 : Scaled version of input features/variables
             y(NumPy Array)                 : Output variable y (unscaled)
-            p(float)                      : Kriging model exponent (fixed to 2) to ensure model smoothness
+            p(float)                       : Kriging model exponent (fixed to 2) to ensure model smoothness
+            gradient(bool)                 : If True, also calculate the gradient with respect to the variables in var_vector
 
         Returns:
-            conc_log_like(float)          : Concentrated likelihood value. Function incurs a large penalty (10000) when co-variance matrix is non-positive definite
+            conc_log_like(float)           : Concentrated likelihood value
+            grad_vec(NumPy Array)          : Array of the gradients of the variables in var_vector, None if gradient is False
+
+        Raises:
+            LinAlgError: The co-variance matrix is not positive definite
 
         Reference:
             [1] Forrester et al.'s book "Engineering Design via Surrogate Modelling: A Practical Guide",
                 https://onlinelibrary.wiley.com/doi/pdf/10.1002/9780470770801
 
         """
+        var_vector = np.ravel(var_vector)
         theta = var_vector[:-1]
         reg_param = var_vector[-1]
         theta = 10 ** theta  # Assumes log(theta) provided
         ns = y.shape[0]
-        cov_mat = self.covariance_matrix_generator(x, theta, reg_param, p)
-        try:  # Check Cholesky factorization
-            L = np.linalg.cholesky(cov_mat)
-            lndetcov = 2 * np.sum(np.log(np.abs(np.diag(L))))  # Approximation to 2nd term from Forrester book, making use of the Ch. factorization
-            cov_inv = self.covariance_inverse_generator(cov_mat)
-            km = self.kriging_mean(cov_inv, y)
-            y_mu = self.y_mu_calculation(y, km)
-            ssd = self.kriging_sd(cov_inv, y_mu, ns)
-            # log_like = (0.5 * ns * np.log(ssd)) + (0.5 * np.log(np.abs(np.linalg.det(cov_mat))))
-            log_like = (0.5 * ns * np.log(ssd)) + (0.5 * lndetcov)
-            conc_log_like = log_like[0, 0]
-        except:  # When Cholesky fails - non-positive definite covariance matrix
+        corr_mat = np.exp(-1 * self.weighted_distance_matrix(x, x, theta, p))
+        cov_mat = corr_mat + reg_param * np.eye(ns)
+        L = np.linalg.cholesky(cov_mat)
+        lndetcov = 2 * np.sum(np.log(np.abs(np.diag(L))))  # Approximation to 2nd term from Forrester book, making use of the Ch. factorization
+        # Solve for inv(cov) * y and inv(cov) * 1 with the factorization
+        sol = cho_solve((L, True), np.hstack((y, np.ones((ns, 1)))))
+        km = np.sum(sol[:, 0]) / np.sum(sol[:, 1])
+        alpha = sol[:, [0]] - km * sol[:, [1]]  # inv(cov) * (y - mean)
+        y_mu = self.y_mu_calculation(y, km)
+        ssd = np.matmul(y_mu.transpose(), alpha)[0, 0] / ns
+        conc_log_like = (0.5 * ns * np.log(ssd)) + (0.5 * lndetcov)
+        if not gradient:
+            return conc_log_like, None
+        # d(conc_log_like)/d(v) = 0.5 * sum(w * d(cov)/d(v)), with
+        # w = inv(cov) - inv(cov) (y - mean) (y - mean)' inv(cov) / ssd
+        w = self._cholesky_inverse(L) - np.matmul(alpha, alpha.transpose()) / ssd
+        grad_vec = np.zeros(len(var_vector), )
+        wc = w * corr_mat
+        for k in range(0, len(theta)):
+            # d(cov)/d(log10(theta_k)) = -ln(10) * theta_k * abs(x_ik - x_jk) ** p * corr
+            dist_k = np.abs(x[:, k, None] - x[None, :, k]) ** p
+            grad_vec[k, ] = -0.5 * np.log(10) * theta[k] * np.sum(wc * dist_k)
+        if self.regularization is True:
+            grad_vec[-1, ] = 0.5 * np.trace(w)  # d(cov)/d(reg_param) = I
+        return conc_log_like, grad_vec
+
+    def objective_function(self, var_vector, x, y, p):
+        """
+        The objective_function method calculates the concentrated likelihood function
+
+        Args:
+            var_vector(NumPy Array)        : Numpy array containing the Kriging paramaters (Kriging weights and regularization parameter)
+            x(NumPy Array)                 : Scaled version of input features/variables
+            y(NumPy Array)                 : Output variable y (unscaled)
+            p(float)                      : Kriging model exponent (fixed to 2) to ensure model smoothness
+
+        Returns:
+            conc_log_like(float)          : Concentrated likelihood value. Function incurs a large penalty (10000) when co-variance matrix is non-positive definite
+
+        Reference:
+            [1] Forrester et al.'s book "Engineering Design via Surrogate Modelling: A Practical Guide",
+                https://onlinelibrary.wiley.com/doi/pdf/10.1002/9780470770801
+
+        """
+        try:
+            conc_log_like, _ = self.concentrated_likelihood(var_vector, x, y, p)
+        except (np.linalg.LinAlgError, ValueError):  # When Cholesky fails - non-positive definite covariance matrix
             conc_log_like = 1e4
         return conc_log_like
 
+    def likelihood_gradient(self, var_vector, x, y, p):
+        """
+        The likelihood_gradient method calculates the concentrated likelihood function and its analytic gradient with respect to the
+        Kriging hyperparameters (log10 of the Kriging weights and the regularization parameter) in a single pass.
+
+        Args:
+            var_vector(NumPy Array)        : Numpy array containing the Kriging paramaters (Kriging weights and regularization parameter)
+            x(NumPy Array)                 : Scaled version of input features/variables
+            y(NumPy Array)                 : Output variable y (unscaled)
+            p(float)                       : Kriging model exponent (fixed to 2) to ensure model smoothness
+
+        Returns:
+            tuple                          : Concentrated likelihood value and array of the gradients of the variables in var_vector.
+                                             The function value is 10000 with zero gradients when co-variance matrix is non-positive definite.
+
+        """
+        try:
+            return self.concentrated_likelihood(var_vector, x, y, p, gradient=True)
+        except (np.linalg.LinAlgError, ValueError):
+            return 1e4, np.zeros(len(np.ravel(var_vector)), )
+
     def numerical_gradient(self, var_vector, x, y, p):
         """
         The numerical_gradient method calculates numerical gradients for the Kriging hyperparameters via central differencing,
 
         grad(theta) = (f(theta + eps) - f(theta - eps))/(2 * eps)
 
+        Training uses the analytic gradients from ``likelihood_gradient``; this method is kept for checking them.
+
         Args:
             var_vector(NumPy Array)        : Numpy array containing the Kriging paramaters (Kriging weights and regularization parameter)
             x(NumPy Array)                 : Scaled version of input features/variables
@@ -357,18 +463,18 @@ class KrigingModel:
             print('Optimizing kriging parameters using L-BFGS-B algorithm...')
             other_args = (self.x_data_scaled, self.y_data, p)
             #opt_results = opt.minimize(self.objective_function, initial_value, args=other_args, method='L-BFGS-B', jac=self.numerical_gradient, bounds=bounds, options={'gtol': 1e-7}) #, 'disp': True})
-            opt_results1 = opt.minimize(self.objective_function, initial_value, args=other_args, method='tnc', jac=self.numerical_gradient, bounds=bounds, options={'gtol': 1e-7})
-            opt_results2 = opt.minimize(self.objective_function, initial_value, args=other_args, method='L-BFGS-B', jac=self.numerical_gradient, bounds=bounds, options={'gtol': 1e-7})  # , 'disp': True})
+            opt_results1 = opt.minimize(self.likelihood_gradient, initial_value, args=other_args, method='tnc', jac=True, bounds=bounds, options={'gtol': 1e-7})
+            opt_results2 = opt.minimize(self.likelihood_gradient, initial_value, args=other_args, method='L-BFGS-B', jac=True, bounds=bounds, options={'gtol': 1e-7})  # , 'disp': True})
             if opt_results1.fun < opt_results2.fun:
                 opt_results = opt_results1
             else:
                 opt_results = opt_results2
         else:
             print('Optimizing Kriging parameters using Basinhopping algorithm...')
-            other_args = {"args": (self.x_data_scaled, self.y_data, p), 'bounds': bounds}
+            other_args = {"args": (self.x_data_scaled, self.y_data, p), 'bounds': bounds, 'jac': True}
             # other_args = {"args": (self.x_data, self.y_data, p)}
             mybounds = MyBounds()  # Bounds on regularization parameter
-            opt_results = basinhopping(self.objective_function, initial_value_list, minimizer_kwargs=other_args, niter=250, disp=True, accept_test=mybounds) # , interval=5)
+            opt_results = basinhopping(self.likelihood_gradient, initial_value_list, minimizer_kwargs=other_args, niter=250, disp=True, accept_test=mybounds) # , interval=5)
         return opt_results
 
     def optimal_parameter_evaluation(self, var_vector, p):
@@ -429,11 +535,8 @@ class KrigingModel:
             y_prediction    : Predicted values of y
 
         """
-        y_prediction = np.zeros((x.shape[0], 1))
-        for i in range(0, x.shape[0]):
-            cmt = (np.matmul(((np.abs(x[i, :] - x)) ** p), theta)).transpose()
-            cov_matrix_tests = np.exp(-1 * cmt)
-            y_prediction[i, 0] = mean + np.matmul(np.matmul(cov_matrix_tests.transpose(), cov_inv), y_mu)
+        cov_matrix_tests = np.exp(-1 * KrigingModel.weighted_distance_matrix(x, x, theta, p))
+        y_prediction = mean + np.matmul(cov_matrix_tests, np.matmul(cov_inv, y_mu))
         ss_error = (1 / y_data.shape[0]) * (np.sum((y_data - y_prediction) ** 2))
         rmse_error = np.sqrt(ss_error)
         return ss_error, rmse_error, y_prediction
@@ -475,10 +578,13 @@ class KrigingModel:
         if x_pred.ndim == 1:
             x_pred = x_pred.reshape(1, len(x_pred))
         y_pred = np.zeros((x_pred.shape[0], 1))
-        for i in range(0, x_pred.shape[0]):
-            cmt = (np.matmul(((np.abs(x_pred[i, :] - self.x_data_scaled)) ** self.optimal_p), self.optimal_weights)).transpose()
+        phi_inv_times_y_mu = np.matmul(self.covariance_matrix_inverse, self.optimal_y_mu)
+        # Predict in blocks of rows to limit the size of the test co-variance matrix
+        block_size = 1000
+        for i in range(0, x_pred.shape[0], block_size):
+            cmt = self.weighted_distance_matrix(x_pred[i:i + block_size, :], self.x_data_scaled, self.optimal_weights, self.optimal_p)
             cov_matrix_tests = np.exp(-1 * cmt)
-            y_pred[i, 0] = self.optimal_mean + np.matmul(np.matmul(cov_matrix_tests.transpose(), self.covariance_matrix_inverse), self.optimal_y_mu)
+            y_pred[i:i + block_size, :] = self.optimal_mean + np.matmul(cov_matrix_tests, phi_inv_times_y_mu)
         return y_pred
 
     def training(self):
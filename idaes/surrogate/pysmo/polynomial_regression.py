@@ -1626,6 +1626,9 @@ class PolynomialRegression:
 
         The ``predict_output`` method generates output predictions for input data x_data based a previously generated polynomial fitting.
 
+        The regression features of all the designs are generated at once with ``polygeneration`` (with the user-defined terms evaluated on the
+        columns of x_data), and the predictions are the product of the feature matrix and the optimal weights.
+
         Args:
             x_data          : Numpy array of designs for which the output is to be evaluated/predicted.
 
@@ -1633,19 +1636,27 @@ class PolynomialRegression:
              Numpy Array    : Output variable predictions based on the polynomial fit.
 
         """
-        nf = x_data.shape[1]
-        x_list = [i for i in range(0, nf)]
-        import pyomo.environ as aml
-
-        m = aml.ConcreteModel()
-        i = aml.Set(initialize=x_list)
-        m.xx = aml.Var(i)
-        m.o2 = aml.Objective(expr=self.generate_expression([m.xx[i] for i in x_list]))
-        y_eq = np.zeros((x_data.shape[0], 1))
-        for j in range(0, x_data.shape[0]):
-            for i in x_list:
-                m.xx[i] = x_data[j, i]
-            y_eq[j, 0] = aml.value(m.o2([m.xx[i] for i in x_list]))
+        x_data = np.asarray(x_data, dtype=float)
+        additional_data = None
+        if len(self.additional_term_expressions) > 0:
+            cMap = ComponentMap()
+            for i, col in enumerate(self.regression_data_columns):
+                cMap[self.feature_list[col]] = x_data[:, i]
+            npe = NumpyEvaluator(cMap)
+            # Terms that do not depend on the features evaluate to scalars
+            additional_data = np.column_stack(
+                [
+                    np.broadcast_to(npe.walk_expression(term), (x_data.shape[0],))
+                    for term in self.additional_term_expressions
+                ]
+            )
+        x_features = self.polygeneration(
+            self.final_polynomial_order,
+            self.multinomials,
+            x_data,
+            additional_x_training_data=additional_data,
+        )
+        y_eq = np.matmul(x_features, self.optimal_weights_array.reshape(-1, 1))
         return y_eq
 
     def pickle_save(self, solutions):
@@ -16,6 +16,7 @@
 # Imports from the python standard library
 from __future__ import division, print_function
 from builtins import int, str
+from concurrent.futures import ThreadPoolExecutor
 import itertools
 import os.path
 import pprint
@@ -28,6 +29,7 @@ import pandas as pd
 import pickle
 from pyomo.environ import *
 import scipy.optimize as opt
+from scipy.spatial.distance import cdist
 from six import string_types
 # Imports from IDAES namespace
 from idaes.surrogate.pysmo.sampling import FeatureScaling as fs
@@ -497,8 +499,8 @@ class RadialBasisFunctions:
         The function basis_generation converts the input data to the requisite basis specified by the user.
         This is done in two steps:
 
-        1. The Euclidean distance from each of the points to each of the RBF centres is calculated by calling the r2_distance function.
-        2. The distances evaluated in step 1 are transformed to the relevant basis selected by the user.
+        1. The Euclidean distance from each of the points to each of the RBF centres is calculated in one call to scipy.spatial.distance.cdist.
+        2. The distances evaluated in step 1 are transformed to the relevant basis selected by the user by calling the basis_transformation function.
 
         Args:
             self(NumPy Array): contains, among other things, the input data
@@ -509,10 +511,21 @@ class RadialBasisFunctions:
 
         """
 
-        basis_functions = np.zeros((self.x_data.shape[0], self.centres.shape[0]))
-        for i in range(0, self.centres.shape[0]):
-            basis_functions[:, i] = self.r2_distance(self.centres[i, :])
+        basis_functions = cdist(self.x_data, self.centres)
+        return self.basis_transformation(basis_functions, r)
+
+    def basis_transformation(self, basis_functions, r):
+        """
+        The function basis_transformation transforms an array of distances to the RBF centres to the basis selected by the user.
+
+        Args:
+            basis_functions(NumPy Array): Euclidean distances from the points to the RBF centres
+            r(float)                    : The shape parameter required for the Gaussian, Multiquadric and Inverse multiquadric transformations.
 
+        Returns:
+            x_transformed(NumPy Array): Array of transformed data based on user-defined transformation function
+
+        """
         # Initialization of x_transformed
         x_transformed = np.zeros((basis_functions.shape[0], basis_functions.shape[1]))
 
@@ -746,7 +759,7 @@ class RadialBasisFunctions:
         r_square = 1 - (ss_residual / ss_total)
         return r_square
 
-    def loo_error_estimation_with_rippa_method(self, sigma, lambda_reg):
+    def loo_error_estimation_with_rippa_method(self, sigma, lambda_reg, condition_numbers=True):
         """
         The function loo_error_estimation_with_rippa_method implements the leave-one-out cross-validation (LOOCV) error for square systems
 
@@ -762,10 +775,11 @@ class RadialBasisFunctions:
             self                          : contains, among other things, the input data
             sigma(float)                  : shape parameter for the parametric bases (Gaussian, Multiquadric, Inverse multiquadric)
             lambda_reg(float)             : regularization parameter
+            condition_numbers(bool)       : whether or not to calculate the condition numbers. Default is True.
 
         Returns:
-            condition_number_pure           : condition number of transformed matrix generated from the input data before regularization
-            condition_number_regularized    : condition number of transformed matrix generated from the input data after regularization
+            condition_number_pure           : condition number of transformed matrix generated from the input data before regularization (None if not calculated)
+            condition_number_regularized    : condition number of transformed matrix generated from the input data after regularization (None if not calculated)
             loo_error_estimate              : norm of the leave-one-out cross-validation error matrix
 
         For more information, see
@@ -777,10 +791,13 @@ class RadialBasisFunctions:
 
         """
         x_transformed = self.basis_generation(sigma)
-        condition_number_pure = np.linalg.cond(x_transformed)
-
         x_regularized = x_transformed + (lambda_reg * np.eye(x_transformed.shape[0], x_transformed.shape[1]))
-        condition_number_regularized = np.linalg.cond(x_regularized)
+        if condition_numbers:
+            condition_number_pure = np.linalg.cond(x_transformed)
+            condition_number_regularized = np.linalg.cond(x_regularized)
+        else:
+            condition_number_pure = None
+            condition_number_regularized = None
 
         y_train = self.y_data.reshape(self.y_data.shape[0], 1)
 
@@ -799,15 +816,54 @@ class RadialBasisFunctions:
         loo_error_estimate = np.linalg.norm(error_vector)
         return condition_number_pure, condition_number_regularized, loo_error_estimate
 
-    def leave_one_out_crossvalidation(self):
+    @staticmethod
+    def loo_errors_for_regularization_values(x_transformed, y, reg_parameters):
+        """
+        The function loo_errors_for_regularization_values evaluates the Rippa leave-one-out cross-validation (LOOCV) error of
+        the algebraic solution for a set of regularization parameters from a single eigendecomposition of the (symmetric) transformed matrix.
+
+        If x_transformed = Q.diag(e).Q', then inv(x_transformed + lambda * I) = Q.diag(1 / (e + lambda)).Q', so the radial weights, the
+        diagonal of the inverse needed by Rippa's formula and the condition numbers are obtained for every regularization parameter with matrix products.
+
+        Args:
+            x_transformed(NumPy Array)      : transformed (square, symmetric) matrix generated from the input data before regularization
+            y(NumPy Array)                  : output values of the training data
+            reg_parameters(list)            : regularization parameters to evaluate
+
+        Returns:
+            condition_number_pure               : condition number of the transformed matrix before regularization
+            condition_numbers_regularized       : condition numbers of the regularized matrices, one per regularization parameter
+            loo_error_estimates(NumPy Array)    : norm of the leave-one-out cross-validation error, one per regularization parameter
+
+        """
+        eig_vals, eig_vecs = np.linalg.eigh(x_transformed)
+        shifted = eig_vals.reshape(-1, 1) + np.array(reg_parameters, dtype=float).reshape(1, -1)
+        abs_shifted = np.abs(shifted)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            condition_number_pure = np.max(np.abs(eig_vals)) / np.min(np.abs(eig_vals))
+            condition_numbers_regularized = np.max(abs_shifted, axis=0) / np.min(abs_shifted, axis=0)
+            inv_shifted = 1 / shifted
+            projected_y = np.matmul(eig_vecs.transpose(), y.reshape(-1, 1))
+            radial_weights = np.matmul(eig_vecs, projected_y * inv_shifted)
+            inverse_diagonal = np.matmul(eig_vecs ** 2, inv_shifted)
+            loo_error_estimates = np.linalg.norm(radial_weights / inverse_diagonal, axis=0)
+        return condition_number_pure, condition_numbers_regularized, loo_error_estimates
+
+    def leave_one_out_crossvalidation(self, condition_numbers=False, n_workers=None):
         """
         The function leave_one_out_crossvalidation determines the best hyperparameters (shape and regularization parameters) for a given RBF fitting problem.
         The function cycles through a set of predefined sets to determine the shape parameter and regularization parameter combination which yields the lowest LOOCV error.
-        The LOOCV error for each (shape_parameter, regulkarization parameter) pair is evaluated by calling the function loo_error_estimation_with_rippa_method
         The pre-defined shape parameter set considers 24 irregularly spaced values ranging between 0.001 - 1000, while the regularization parameter set considers 21 values ranging between 0.00001 - 1.
 
+        The distances between the training points and the centres are calculated once. For the algebraic solution method, the LOOCV errors of all
+        the regularization parameters for a shape parameter are evaluated from one eigendecomposition by calling the function loo_errors_for_regularization_values,
+        and the shape parameters are evaluated in parallel on a thread pool. For the other solution methods, the LOOCV error for each (shape_parameter, regularization parameter)
+        pair is evaluated by calling the function loo_error_estimation_with_rippa_method.
+
         Args:
             self:                           : contains, among other things, the input data
+            condition_numbers(bool)         : whether or not to calculate and print the condition numbers of the transformed matrices. Default is False.
+            n_workers(int)                  : number of threads used to evaluate the shape parameters (algebraic solution method only). Default is the ThreadPoolExecutor default.
 
         Returns:
             r_best(float)                 : best found shape parameter
@@ -830,22 +886,52 @@ class RadialBasisFunctions:
             reg_parameter = [0]
 
         machine_precision = np.finfo(float).eps
+        y_train = self.y_data.reshape(self.y_data.shape[0], 1)
+
+        if self.solution_method == 'algebraic':
+            distances = cdist(self.x_data, self.centres)
+
+            def _shape_parameter_errors(sigma):
+                cond_no_pure, cond_no_reg, cv_errors = self.loo_errors_for_regularization_values(
+                    self.basis_transformation(distances, sigma), y_train, reg_parameter)
+                # Numerically singular matrices: the result depends on how the system is solved, so use the reference method
+                for j in np.nonzero(~(cond_no_reg * machine_precision < 1))[0]:
+                    _, _, cv_errors[j] = self.loo_error_estimation_with_rippa_method(sigma, reg_parameter[j], False)
+                return cv_errors, cond_no_pure, cond_no_reg
+
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(_shape_parameter_errors, r_set))
+        else:
+            results = []
+            for sigma in r_set:
+                cv_errors = np.zeros(len(reg_parameter))
+                cond_no_reg = np.zeros(len(reg_parameter))
+                for j in range(0, len(reg_parameter)):
+                    cond_no_pure, cond_no_reg[j], cv_errors[j] = self.loo_error_estimation_with_rippa_method(sigma, reg_parameter[j], condition_numbers)
+                results.append((cv_errors, cond_no_pure, cond_no_reg))
 
         error_vector = np.zeros((len(r_set) * len(reg_parameter), 3))
         counter = 0
         print('===========================================================================================================')
         for i in range(0, len(r_set)):
             sigma = r_set[i]
+            cv_errors, cond_no_pure, cond_nos_reg = results[i]
             for j in range(0, len(reg_parameter)):
                 lambda_reg = reg_parameter[j]
-                cond_no_pure, cond_no_reg, cv_error = self.loo_error_estimation_with_rippa_method(sigma, lambda_reg)
+                cv_error = cv_errors[j]
                 error_vector[counter, :] = [sigma, lambda_reg, cv_error]
                 counter += 1
-                print(sigma, '   |    ', lambda_reg, '   |    ', cv_error, '   |    ', cond_no_pure, '   |    ',  cond_no_pure * machine_precision, '   |    ', cond_no_reg, '   |    ', cond_no_reg * machine_precision)
+                if condition_numbers:
+                    cond_no_reg = cond_nos_reg[j]
+                    print(sigma, '   |    ', lambda_reg, '   |    ', cv_error, '   |    ', cond_no_pure, '   |    ',  cond_no_pure * machine_precision, '   |    ', cond_no_reg, '   |    ', cond_no_reg * machine_precision)
+                else:
+                    print(sigma, '   |    ', lambda_reg, '   |    ', cv_error)
         minimum_value_column = np.argmin(error_vector[:, 2], axis=0)
         r_best = error_vector[minimum_value_column, 0]
         lambda_best = error_vector[minimum_value_column, 1]
         error_best = error_vector[minimum_value_column, 2]
+        if self.solution_method == 'algebraic':
+            _, _, error_best = self.loo_error_estimation_with_rippa_method(r_best, lambda_best, False)
         return r_best, lambda_best, error_best
 
     def training(self):
@@ -936,26 +1022,11 @@ class RadialBasisFunctions:
         x_pred_scaled = (x_data - self.x_data_min)/scale
         x_data = x_pred_scaled.reshape(x_data.shape)
 
-        basis_vector = np.zeros((x_data.shape[0], centres_matrix.shape[0]))
         # Calculate distances from centres
-        for i in range(0, centres_matrix.shape[0]):
-            basis_vector[:, i] = np.sqrt(np.sum(((x_data - centres_matrix[i, :]) ** 2), axis=1))
-        # Initialization of x_transformed
-        x_transformed = np.zeros((basis_vector.shape[0], basis_vector.shape[1]))
+        basis_vector = cdist(x_data.reshape(-1, centres_matrix.shape[1]), centres_matrix)
 
         # Transform X
-        if self.basis_function == 'gaussian':
-            x_transformed = RadialBasisFunctions.gaussian_basis_transformation(basis_vector, r)
-        elif self.basis_function == 'linear':
-            x_transformed = RadialBasisFunctions.linear_transformation(basis_vector)
-        elif self.basis_function == 'cubic':
-            x_transformed = RadialBasisFunctions.cubic_transformation(basis_vector)
-        elif self.basis_function == 'mq':
-            x_transformed = RadialBasisFunctions.multiquadric_basis_transformation(basis_vector, r)
-        elif self.basis_function == 'imq':
-            x_transformed = RadialBasisFunctions.inverse_multiquadric_basis_transformation(basis_vector, r)
-        elif self.basis_function == 'spline':
-            x_transformed = RadialBasisFunctions.thin_plate_spline_transformation(basis_vector)
+        x_transformed = self.basis_transformation(basis_vector, r)
 
         # Add regularization shifting?
         x_transformed = x_transformed + (0 * np.eye(x_transformed.shape[0], x_transformed.shape[1]))
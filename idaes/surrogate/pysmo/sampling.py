@@ -16,6 +16,7 @@ from six import string_types
 # from builtins import int, str
 import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 import warnings
 import itertools
 
@@ -122,9 +123,8 @@ class SamplingMethods:
         This is done by determining the input data with the smallest L2 distance from a.
 
         The function:
-        1. Calculates the L2 distance between all the input data points and a,
-        2. Sorts the input data based on the calculated L2-distances, and
-        3. Selects the sample point in the first row (after sorting) as the closest sample point.
+        1. Calculates the L2 distance between all the input data points and a, and
+        2. Selects the sample point with the smallest L2 distance as the closest sample point.
 
         Args:
             self: contains, among other things, the input data.
@@ -137,36 +137,89 @@ class SamplingMethods:
         no_y_vars = self.x_data.shape[1] - full_data.shape[1]
         dist = full_data[:, :no_y_vars] - a
         l2_norm = np.sqrt(np.sum((dist ** 2), axis=1))
-        l2_norm = l2_norm.reshape(l2_norm.shape[0], 1)
-        distances = np.append(full_data, l2_norm, 1)
-        sorted_distances = distances[distances[:, -1].argsort()]
-        closest_point = sorted_distances[0, :-1]
+        closest_point = full_data[np.argmin(l2_norm), :]
         return closest_point
 
-    def points_selection(self, full_data, generated_sample_points):
+    @staticmethod
+    def nearest_neighbour_indices(x_data, generated_sample_points, unique=False):
+        """
+        Function determines the rows of x_data closest to each of the points in generated_sample_points.
+        A k-d tree is built over x_data once and queried for all the points at once.
+
+        When unique selection is required, the points are matched in order: a point whose nearest rows have all been selected by the points before it
+        takes its closest row not yet selected, found by querying the k-d tree for more neighbours.
+
+        Args:
+            x_data(NumPy Array): The input variables of the dataset, one row per data point.
+            generated_sample_points(NumPy Array): The points for which the closest rows in x_data are to be found. Each row represents a sample point.
+            unique(bool): Whether or not every point must be matched to a different row of x_data. Default is False.
+
+        Returns:
+            indices(NumPy Array): Array containing the row index in x_data of the closest point to each of the generated_sample_points
+
+        Raises:
+            ValueError: When unique selection is required for more points than there are rows in x_data.
+        """
+        no_points = generated_sample_points.shape[0]
+        no_data = x_data.shape[0]
+        if unique and no_points > no_data:
+            raise ValueError('Number of unique samples requested is greater than the number of samples in the input data set.')
+        if x_data.shape[1] == 0:
+            # All the data points are equally close
+            return np.arange(no_points) if unique else np.zeros(no_points, dtype=int)
+
+        tree = cKDTree(x_data)
+        if not unique:
+            _, indices = tree.query(generated_sample_points)
+            return indices
+
+        no_neighbours = min(no_data, 8)
+        _, candidates = tree.query(generated_sample_points, k=no_neighbours)
+        candidates = candidates.reshape(no_points, no_neighbours)
+        selected = np.zeros(no_data, dtype=bool)
+        indices = np.zeros(no_points, dtype=int)
+        for i in range(0, no_points):
+            available = candidates[i, ~selected[candidates[i, :]]]
+            k = no_neighbours
+            while available.shape[0] == 0:
+                k = min(2 * k, no_data)
+                _, neighbours = tree.query(generated_sample_points[i, :], k=k)
+                neighbours = np.atleast_1d(neighbours)
+                available = neighbours[~selected[neighbours]]
+            indices[i] = available[0]
+            selected[available[0]] = True
+        return indices
+
+    def points_selection(self, full_data, generated_sample_points, unique=False):
         """
-        Uses L2-distance evaluation (implemented in nearest_neighbour) to find closest available points in original data to those generated by the sampling technique.
-        Calls the nearest_neighbour function for each row in the input data.
+        Finds the closest available points in the original data to those generated by the sampling technique, using L2-distance.
+        The closest points are found for all the rows of generated_sample_points at once by calling the nearest_neighbour_indices function.
 
         Args:
             full_data: refers to the input dataset supplied by the user.
             generated_sample_points(NumPy Array): The vector of points (number_of_sample rows) for which the closest points in the original data are to be found. Each row represents a sample point.
+            unique(bool): Whether or not every generated point must be matched to a different point of the original data. Default is False.
 
         Returns:
             equivalent_points: Array containing the points (in rows) most similar to those in generated_sample_points
+
+        Raises:
+            ValueError: When the number of columns of generated_sample_points does not match the number of input variables.
         """
+        no_x_vars = self.x_data.shape[1]
+        if generated_sample_points.shape[1] != no_x_vars:
+            raise ValueError('Dimensions of the generated sample points do not match the number of input variables in the data.')
+        indices = self.nearest_neighbour_indices(full_data[:, :no_x_vars], generated_sample_points, unique)
 
-        equivalent_points = np.zeros((generated_sample_points.shape[0], len(self.data_headers) ))
-        for i in range(0, generated_sample_points.shape[0]):
-            closest_point = self.nearest_neighbour(full_data, generated_sample_points[i, :])
-            equivalent_points[i, :] = closest_point
+        equivalent_points = np.zeros((generated_sample_points.shape[0], len(self.data_headers)))
+        equivalent_points[:, :] = full_data[indices, :]
         return equivalent_points
 
-    def sample_point_selection(self, full_data, sample_points, sampling_type):
+    def sample_point_selection(self, full_data, sample_points, sampling_type, unique_selection=False):
         if sampling_type == 'selection':
             sd = FeatureScaling()
             scaled_data, data_min, data_max = sd.data_scaling_minmax(full_data)
-            points_closest_scaled = self.points_selection(scaled_data, sample_points)
+            points_closest_scaled = self.points_selection(scaled_data, sample_points, unique_selection)
             points_closest_unscaled = sd.data_unscaling_minmax(points_closest_scaled, data_min, data_max)
 
             unique_sample_points = np.unique(points_closest_unscaled, axis=0)
@@ -436,7 +489,7 @@ class LatinHypercubeSampling(SamplingMethods):
 
     """
 
-    def __init__(self, data_input, number_of_samples=None, sampling_type=None, xlabels=None, ylabels=None):
+    def __init__(self, data_input, number_of_samples=None, sampling_type=None, xlabels=None, ylabels=None, unique_selection=False):
         """
         Initialization of **LatinHypercubeSampling** class. Two inputs are required.
 
@@ -452,6 +505,7 @@ class LatinHypercubeSampling(SamplingMethods):
         Keyword Args:
             xlabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the independent/input  variables.  Only used in "selection" mode. Default is None.
             ylabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the dependent/output variables. Only used in "selection" mode. Default is None.
+            unique_selection (bool): Whether or not every generated sample must be matched to a different row of **data_input**. When True, a generated sample whose closest row has already been selected takes the closest row not yet selected. Only used in "selection" mode. Default is False.
 
         Returns:
             **self** function containing the input information
@@ -478,6 +532,7 @@ class LatinHypercubeSampling(SamplingMethods):
             raise Exception(
                 'Invalid sampling type requirement entered. Enter "creation" for sampling from a range or "selection" for selecting samples from a dataset.')
         print('Sampling type: ', self.sampling_type, '\n')
+        self.unique_selection = unique_selection
 
         if self.sampling_type == 'selection':
             if isinstance(data_input, (pd.DataFrame, np.ndarray)):
@@ -608,7 +663,7 @@ class LatinHypercubeSampling(SamplingMethods):
 
         vector_of_points = self.lhs_points_generation()  # Assumes [X, Y] data is supplied.
         generated_sample_points = self.random_shuffling(vector_of_points)
-        unique_sample_points = self.sample_point_selection(self.data, generated_sample_points, self.sampling_type)
+        unique_sample_points = self.sample_point_selection(self.data, generated_sample_points, self.sampling_type, self.unique_selection)
 
         if len(self.data_headers) > 0 and self.df_flag: 
             unique_sample_points = pd.DataFrame(unique_sample_points, columns=self.data_headers)
@@ -636,7 +691,7 @@ class UniformSampling(SamplingMethods):
 
     """
 
-    def __init__(self, data_input, list_of_samples_per_variable, sampling_type=None, xlabels=None, ylabels=None, edges=None):
+    def __init__(self, data_input, list_of_samples_per_variable, sampling_type=None, xlabels=None, ylabels=None, edges=None, unique_selection=False):
         """
         Initialization of UniformSampling class. Three inputs are required.
 
@@ -652,6 +707,7 @@ class UniformSampling(SamplingMethods):
         Keyword Args:
             xlabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the independent/input  variables.  Only used in "selection" mode. Default is None.
             ylabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the dependent/output variables. Only used in "selection" mode. Default is None.
+            unique_selection (bool): Whether or not every generated sample must be matched to a different row of **data_input**. When True, a generated sample whose closest row has already been selected takes the closest row not yet selected. Only used in "selection" mode. Default is False.
             edges (bool): Boolean variable representing how the points should be selected. A value of True (default) indicates the points should be equally spaced edge to edge, otherwise they will be in the centres of the bins filling the unit cube
 
         Returns:
@@ -680,6 +736,7 @@ class UniformSampling(SamplingMethods):
             raise Exception(
                 'Invalid sampling type requirement entered. Enter "creation" for sampling from a range or "selection" for selecting samples from a dataset.')
         print('Sampling type: ', self.sampling_type, '\n')
+        self.unique_selection = unique_selection
 
         if self.sampling_type == 'selection':
             if isinstance(data_input, (pd.DataFrame, np.ndarray)):
@@ -753,7 +810,7 @@ class UniformSampling(SamplingMethods):
                 points_spread.append(shifted_points)
         samples_list = list(itertools.product(*points_spread))
         samples_array = np.asarray(samples_list)
-        unique_sample_points = self.sample_point_selection(self.data, samples_array, self.sampling_type)
+        unique_sample_points = self.sample_point_selection(self.data, samples_array, self.sampling_type, self.unique_selection)
         if len(self.data_headers) > 0 and self.df_flag: 
             unique_sample_points = pd.DataFrame(unique_sample_points, columns=self.data_headers)
         return unique_sample_points
@@ -782,7 +839,7 @@ class HaltonSampling(SamplingMethods):
 
     """
 
-    def __init__(self, data_input, number_of_samples=None, sampling_type=None, xlabels=None, ylabels=None):
+    def __init__(self, data_input, number_of_samples=None, sampling_type=None, xlabels=None, ylabels=None, unique_selection=False):
         """
 
         Initialization of **HaltonSampling** class. Two inputs are required.
@@ -799,6 +856,7 @@ class HaltonSampling(SamplingMethods):
         Keyword Args:
             xlabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the independent/input  variables.  Only used in "selection" mode. Default is None.
             ylabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the dependent/output variables. Only used in "selection" mode. Default is None.
+            unique_selection (bool): Whether or not every generated sample must be matched to a different row of **data_input**. When True, a generated sample whose closest row has already been selected takes the closest row not yet selected. Only used in "selection" mode. Default is False.
             
         Returns:
             **self** function containing the input information.
@@ -824,6 +882,7 @@ class HaltonSampling(SamplingMethods):
             raise Exception(
                 'Invalid sampling type requirement entered. Enter "creation" for sampling from a range or "selection" for selecting samples from a dataset.')
         print('Sampling type: ', self.sampling_type, '\n')
+        self.unique_selection = unique_selection
 
         if self.sampling_type == 'selection':
             if isinstance(data_input, (pd.DataFrame, np.ndarray)):
@@ -899,7 +958,7 @@ class HaltonSampling(SamplingMethods):
         for i in range(0, no_features):
             sample_points[:, i] = self.data_sequencing(self.number_of_samples, prime_list[i])
         # Scale input data, then find data points closest in sample space. Unscale before returning points
-        unique_sample_points = self.sample_point_selection(self.data, sample_points, self.sampling_type)
+        unique_sample_points = self.sample_point_selection(self.data, sample_points, self.sampling_type, self.unique_selection)
         if len(self.data_headers) > 0 and self.df_flag:
             unique_sample_points = pd.DataFrame(unique_sample_points, columns=self.data_headers)
         return unique_sample_points
@@ -928,7 +987,7 @@ class HammersleySampling(SamplingMethods):
 
     """
 
-    def __init__(self, data_input, number_of_samples=None, sampling_type=None, xlabels=None, ylabels=None):
+    def __init__(self, data_input, number_of_samples=None, sampling_type=None, xlabels=None, ylabels=None, unique_selection=False):
         """
         Initialization of **HammersleySampling** class. Two inputs are required.
 
@@ -944,6 +1003,7 @@ class HammersleySampling(SamplingMethods):
         Keyword Args:
             xlabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the independent/input  variables.  Only used in "selection" mode. Default is None.
             ylabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the dependent/output variables. Only used in "selection" mode. Default is None.
+            unique_selection (bool): Whether or not every generated sample must be matched to a different row of **data_input**. When True, a generated sample whose closest row has already been selected takes the closest row not yet selected. Only used in "selection" mode. Default is False.
 
             Returns:
                 **self** function containing the input information.
@@ -969,6 +1029,7 @@ class HammersleySampling(SamplingMethods):
             raise Exception(
                 'Invalid sampling type requirement entered. Enter "creation" for sampling from a range or "selection" for selecting samples from a dataset.')
         print('Sampling type: ', self.sampling_type, '\n')
+        self.unique_selection = unique_selection
 
         if self.sampling_type == 'selection':
 
@@ -1049,7 +1110,7 @@ class HammersleySampling(SamplingMethods):
         for i in range(0, len(prime_list)):
             sample_points[:, i + 1] = self.data_sequencing(self.number_of_samples, prime_list[i])
 
-        unique_sample_points = self.sample_point_selection(self.data, sample_points, self.sampling_type)
+        unique_sample_points = self.sample_point_selection(self.data, sample_points, self.sampling_type, self.unique_selection)
         if len(self.data_headers) > 0 and self.df_flag:
             unique_sample_points = pd.DataFrame(unique_sample_points, columns=self.data_headers)
         return unique_sample_points
@@ -1073,7 +1134,7 @@ class CVTSampling(SamplingMethods):
 
     """
 
-    def __init__(self, data_input, number_of_samples=None, tolerance=None, sampling_type=None, xlabels=None, ylabels=None):
+    def __init__(self, data_input, number_of_samples=None, tolerance=None, sampling_type=None, xlabels=None, ylabels=None, seed=None, chunk_size=None, unique_selection=False):
         """
         Initialization of CVTSampling class. Two inputs are required, while an optional option to control the solution accuracy may be specified.
 
@@ -1089,10 +1150,14 @@ class CVTSampling(SamplingMethods):
         Keyword Args:
             xlabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the independent/input  variables.  Only used in "selection" mode. Default is None.
             ylabels (list): List of column names (if **data_input** is a dataframe) or column numbers (if **data_input** is an array) for the dependent/output variables. Only used in "selection" mode. Default is None.
+            unique_selection (bool): Whether or not every generated sample must be matched to a different row of **data_input**. When True, a generated sample whose closest row has already been selected takes the closest row not yet selected. Only used in "selection" mode. Default is False.
             tolerance(float): Maximum allowable Euclidean distance between centres from consectutive iterations of the algorithm. Termination condition for algorithm.
 
                 - The smaller the value of tolerance, the better the solution but the longer the algorithm requires to converge. Default value is :math:`10^{-7}`.
 
+            seed(int): Seed for the random number generator used by the algorithm. When supplied, repeated calls to ``sample_points`` return the same samples. Default is None (numpy's global random state is used).
+            chunk_size(int): Maximum number of random points generated and classified at once in each iteration of the algorithm. Controls the memory requirement of the algorithm. Default is 100000.
+
         Returns:
                 **self** function containing the input information.
 
@@ -1108,6 +1173,8 @@ class CVTSampling(SamplingMethods):
 
                 warnings.warn: when the tolerance specified by the user is too tight (tolerance < :math:`10^{-9}`)
 
+                Exception: When the **chunk_size** is invalid (not an integer, zero, negative)
+
         """
         if sampling_type is None:
             sampling_type = 'creation'
@@ -1122,6 +1189,7 @@ class CVTSampling(SamplingMethods):
             raise Exception(
                 'Invalid sampling type requirement entered. Enter "creation" for sampling from a range or "selection" for selecting samples from a dataset.')
         print('Sampling type: ', self.sampling_type, '\n')
+        self.unique_selection = unique_selection
 
         if self.sampling_type == 'selection':
             if isinstance(data_input, (pd.DataFrame, np.ndarray)):
@@ -1188,8 +1256,17 @@ class CVTSampling(SamplingMethods):
             raise Exception('Invalid tolerance input')
         self.eps = tolerance
 
+        if chunk_size is None:
+            chunk_size = 100000
+        elif not isinstance(chunk_size, int):
+            raise Exception('chunk_size must be an integer.')
+        elif chunk_size <= 0:
+            raise Exception('chunk_size must a positive, non-zero integer.')
+        self.chunk_size = chunk_size
+        self.seed = seed
+
     @staticmethod
-    def random_sample_selection(no_samples, no_features):
+    def random_sample_selection(no_samples, no_features, random_state=None):
         """
         Function generates a the required number of samples (no_samples) within an no_features-dimensional space.
         This is achieved by generating an m x n 2-D array using numpy's random.rand function, where
@@ -1200,6 +1277,7 @@ class CVTSampling(SamplingMethods):
         Args:
             no_samples(int): The number of samples to be generated.
             no_features(int): Number of design features/variables in the input data.
+            random_state(NumPy RandomState): Random number generator to draw the samples from. Default is None (numpy's global random state).
 
         Returns:
             random_points(NumPy Array): 2-D array of size no_samples x no_features generated from a uniform distribution.
@@ -1209,7 +1287,9 @@ class CVTSampling(SamplingMethods):
             >> array([[0.03149075, 0.70566624], [0.48319597, 0.03810093], [0.19962214, 0.57641408]])
 
         """
-        random_points = np.random.rand(no_samples, no_features)
+        if random_state is None:
+            random_state = np.random
+        random_points = random_state.rand(no_samples, no_features)
         return random_points
 
     @staticmethod
@@ -1250,15 +1330,51 @@ class CVTSampling(SamplingMethods):
         (3) Create the new centres as the weighted average of the current centres (initial_centres) and the mean data calculated in the second step. The weighting is done based on the number of iterations (counter).
 
         """
-        centres = np.zeros((initial_centres.shape[0], initial_centres.shape[1]))
-        current_centres = current_centres.reshape(current_centres.shape[0], 1)
-        for i in range(0, initial_centres.shape[0]):
-            data_matrix = current_random_points[current_centres[:, 0] == i]
-            m_prime, n_prime = data_matrix.shape
-            if m_prime == 0:
-                centres[i, :] = np.mean(initial_centres, axis=0)
-            else:
-                centres[i, :] = np.mean(data_matrix, axis=0)
+        cluster_sums, cluster_sizes = CVTSampling.cluster_sums(current_random_points, current_centres, initial_centres.shape[0])
+        return CVTSampling.update_centres(initial_centres, cluster_sums, cluster_sizes, counter)
+
+    @staticmethod
+    def cluster_sums(current_random_points, current_centres, number_of_centres):
+        """
+        The function cluster_sums evaluates the sum and the number of the random points in each class.
+
+            Args:
+                current_random_points(NumPy Array): A 2-D array containing several points generated randomly from within the design space.
+                current_centres(NumPy Array): Array containing the index number of the closest mass centroid of each point in current_random_points, representing its class.
+                number_of_centres(int): number of mass centroids (classes)
+
+            Returns:
+                tuple: A 2-D array of size number_of_centres x no_features containing the sum of the points in each class, and a 1-D array containing the number of points in each class.
+
+        """
+        current_centres = np.asarray(current_centres, dtype=int).reshape(-1)
+        current_random_points = np.asarray(current_random_points, dtype=float)
+        cluster_sizes = np.bincount(current_centres, minlength=number_of_centres)
+        cluster_sums = np.zeros((number_of_centres, current_random_points.shape[1]))
+        for j in range(0, current_random_points.shape[1]):
+            cluster_sums[:, j] = np.bincount(current_centres, weights=current_random_points[:, j], minlength=number_of_centres)
+        return cluster_sums, cluster_sizes
+
+    @staticmethod
+    def update_centres(initial_centres, cluster_sums, cluster_sizes, counter):
+        """
+        The function update_centres generates new mass centroids from the class sums and sizes returned by cluster_sums, as described in create_centres.
+        Classes without random points use the mean of the current mass centroids.
+
+            Args:
+                initial_centres(NumPy Array): A 2-D array containing the current mass centroids, size no_samples x no_features.
+                cluster_sums(NumPy Array): A 2-D array containing the sum of the random points in each class, size no_samples x no_features.
+                cluster_sizes(NumPy Array): Array containing the number of random points in each class.
+                counter(int): current iteration number
+
+            Returns:
+                centres(NumPy Array): A 2-D array containing the new mass centroids, size no_samples x no_features.
+
+        """
+        centres = np.empty((initial_centres.shape[0], initial_centres.shape[1]))
+        populated = cluster_sizes > 0
+        centres[populated, :] = cluster_sums[populated, :] / cluster_sizes[populated].reshape(-1, 1)
+        centres[~populated, :] = np.mean(initial_centres, axis=0)
 
         # Weighted average based on previous number of iterations
         centres = ((counter * initial_centres) + centres) / (counter + 1)
@@ -1271,13 +1387,17 @@ class CVTSampling(SamplingMethods):
         Procedure based on McQueen's algorithm: iteratively minimize distance, and re-position centroids.
         Centre re-calculation done as the mean of each data cluster around each centre.
 
+        At each iteration, the random points are generated and classified in batches of at most **chunk_size** points.
+        The closest centre of each point is found with a k-d tree built over the current centres.
+
         Returns:
             NumPy Array or Pandas Dataframe:     A numpy array or Pandas dataframe containing the final **number_of_samples** centroids obtained by the CVT algorithm.
 
         """
         _, n = self.x_data.shape
         size_multiple = 1000
-        initial_centres = self.random_sample_selection(self.number_of_centres, n)
+        random_state = None if self.seed is None else np.random.RandomState(self.seed)
+        initial_centres = self.random_sample_selection(self.number_of_centres, n, random_state)
         # Iterative optimization process
         cost_old = 0
         cost_new = 0
@@ -1285,17 +1405,20 @@ class CVTSampling(SamplingMethods):
         counter = 1
         while (cost_change > self.eps) and (counter <= 1000):
             cost_old = cost_new
-            current_random_points = self.random_sample_selection(self.number_of_centres * size_multiple, n)
-            distance_matrix = np.zeros(
-                (current_random_points.shape[0], initial_centres.shape[0]))  # Vector to store distances from centroids
-            current_centres = np.zeros(
-                (current_random_points.shape[0], 1))  # Vector containing the centroid each point belongs to
-
-            # Calculate distance between random points and centres, sort and estimate new centres
-            for i in range(0, self.number_of_centres):
-                distance_matrix[:, i] = self.eucl_distance(current_random_points, initial_centres[i, :])
-            current_centres = (np.argmin(distance_matrix, axis=1))
-            new_centres = self.create_centres(initial_centres, current_random_points, current_centres, counter)
+            # Classify random points by their closest centre and accumulate the class sums
+            centres_tree = cKDTree(initial_centres)
+            cluster_sums = np.zeros((self.number_of_centres, n))
+            cluster_sizes = np.zeros(self.number_of_centres, dtype=int)
+            points_remaining = self.number_of_centres * size_multiple
+            while points_remaining > 0:
+                chunk = min(points_remaining, self.chunk_size)
+                current_random_points = self.random_sample_selection(chunk, n, random_state)
+                _, current_centres = centres_tree.query(current_random_points)
+                chunk_sums, chunk_sizes = self.cluster_sums(current_random_points, current_centres, self.number_of_centres)
+                cluster_sums += chunk_sums
+                cluster_sizes += chunk_sizes
+                points_remaining -= chunk
+            new_centres = self.update_centres(initial_centres, cluster_sums, cluster_sizes, counter)
 
             # Estimate distance between new and old centres
             distance_btw_centres = self.eucl_distance(new_centres, initial_centres)
@@ -1308,7 +1431,7 @@ class CVTSampling(SamplingMethods):
 
         sample_points = new_centres
 
-        unique_sample_points = self.sample_point_selection(self.data, sample_points, self.sampling_type)
+        unique_sample_points = self.sample_point_selection(self.data, sample_points, self.sampling_type, self.unique_selection)
         if len(self.data_headers) > 0 and self.df_flag:
             unique_sample_points = pd.DataFrame(unique_sample_points, columns=self.data_headers)
         return unique_sample_points
@@ -257,6 +257,47 @@ class TestKrigingModel:
         np.testing.assert_array_equal(np.round(grad_vec, 5), np.round(grad_vec_exp, 5))
 
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_weighted_distance_matrix(self, array_type):
+        input_array = array_type(self.training_data)
+        KrigingClass = KrigingModel(input_array[0:3], regularization=True)
+        x = KrigingClass.x_data_scaled
+        theta = np.array([1, 2])
+        distance_matrix = KrigingClass.weighted_distance_matrix(x, x[0:2, :], theta, 2)
+        distance_matrix_exp = np.array([[np.sum(theta * (x[i, :] - x[j, :]) ** 2) for j in range(0, 2)] for i in range(0, 3)])
+        np.testing.assert_allclose(distance_matrix, distance_matrix_exp)
+
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_likelihood_gradient_01(self, array_type):
+        input_array = array_type(self.training_data)
+        KrigingClass = KrigingModel(input_array, regularization=True)
+        p = 2
+        var_vector = np.array([0.3, -0.5, 1.00000000e-03])
+        conc_log_like, grad_vec = KrigingClass.likelihood_gradient(var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p)
+        assert conc_log_like == pytest.approx(KrigingClass.objective_function(var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p))
+        grad_vec_exp = KrigingClass.numerical_gradient(var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p)
+        np.testing.assert_allclose(grad_vec, grad_vec_exp, rtol=1e-5)
+
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
+    def test_likelihood_gradient_02(self, array_type):
+        input_array = array_type(self.training_data)
+        KrigingClass = KrigingModel(input_array, regularization=False)
+        p = 2
+        var_vector = np.array([0.3, -0.5, 1.00000000e-03])
+        conc_log_like, grad_vec = KrigingClass.likelihood_gradient(var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p)
+        assert grad_vec[-1] == 0
+        # Non-positive definite co-variance matrix
+        var_vector = np.array([0.3, -0.5, -10])
+        conc_log_like, grad_vec = KrigingClass.likelihood_gradient(var_vector, KrigingClass.x_data_scaled, KrigingClass.y_data, p)
+        assert conc_log_like == 1e4
+        np.testing.assert_array_equal(grad_vec, np.zeros(3))
+
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_parameter_optimization_01(self, array_type):
@@ -19,6 +19,7 @@ from idaes.surrogate.pysmo.polynomial_regression import (
 )
 import numpy as np
 import pandas as pd
+import pyomo.environ as pyo
 import pytest
 
 
@@ -1530,6 +1531,32 @@ class TestPolynomialRegression:
             lv.append(p[i])
         poly_expr = data_feed.generate_expression((lv))
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("multinomials", [0, 1])
+    def test_predict_output(self, multinomials):
+        original_data_input = pd.DataFrame(self.full_data)
+        regression_data_input = np.array(self.training_data)
+        data_feed = PolynomialRegression(original_data_input, regression_data_input, maximum_polynomial_order=3,
+                                         multinomials=multinomials, solution_method='mle',
+                                         fname='predict_output_test.pickle', overwrite=True)
+        p = data_feed.get_feature_vector()
+        data_feed.set_additional_terms([pyo.sin(p['x1']), pyo.exp(p['x2'] / 10), pyo.log(p['x1'] + 1) * p['x2']])
+        data_feed.training()
+        os.remove('predict_output_test.pickle')
+
+        x_test = np.array([[0.5, 1.5], [2, 3], [9.5, 0.1], [4, 4]])
+        y_pred = data_feed.predict_output(x_test)
+        assert y_pred.shape == (4, 1)
+
+        # Compare with evaluating the Pyomo expression of the surrogate
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([0, 1])
+        expr = data_feed.generate_expression([m.x[0], m.x[1]])
+        for j in range(0, x_test.shape[0]):
+            m.x[0].value = x_test[j, 0]
+            m.x[1].value = x_test[j, 1]
+            assert y_pred[j, 0] == pytest.approx(pyo.value(expr), rel=1e-10)
+
     @pytest.mark.unit
     @pytest.fixture(scope='module')
     @pytest.mark.parametrize("array_type1", [np.array])
@@ -768,6 +768,32 @@ class TestRadialBasisFunction:
         assert output_1 == np.linalg.cond(expected_x)
         np.testing.assert_array_equal(output_2, expected_errors)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("basis", ['gaussian', 'mq', 'cubic'])
+    def test_loo_errors_for_regularization_values(self, basis):
+        input_array = np.array(self.training_data)
+        data_feed = RadialBasisFunctions(input_array, basis_function=basis, solution_method='algebraic', regularization=True)
+        y_train = data_feed.y_data.reshape(data_feed.y_data.shape[0], 1)
+        reg_parameter = [0.00001, 0.001, 0.1, 1]
+        for shape_factor in [0.5, 2.0]:
+            x_transformed = data_feed.basis_generation(shape_factor)
+            cond_pure, cond_reg, errors = data_feed.loo_errors_for_regularization_values(x_transformed, y_train, reg_parameter)
+            assert cond_pure == pytest.approx(np.linalg.cond(x_transformed), rel=1e-2)
+            for j in range(len(reg_parameter)):
+                expected_cond_pure, expected_cond_reg, expected_error = data_feed.loo_error_estimation_with_rippa_method(shape_factor, reg_parameter[j])
+                assert cond_reg[j] == pytest.approx(expected_cond_reg, rel=1e-6)
+                assert errors[j] == pytest.approx(expected_error, rel=1e-6)
+
+    @pytest.mark.unit
+    def test_leave_one_out_crossvalidation_condition_numbers(self):
+        input_array = np.array(self.training_data)
+        data_feed = RadialBasisFunctions(input_array, basis_function='gaussian', solution_method='algebraic', regularization=True)
+        r_best, lambda_best, error_best = data_feed.leave_one_out_crossvalidation()
+        r_cond, lambda_cond, error_cond = data_feed.leave_one_out_crossvalidation(condition_numbers=True, n_workers=1)
+        assert (r_best, lambda_best, error_best) == (r_cond, lambda_cond, error_cond)
+        _, output_1, _ = data_feed.loo_error_estimation_with_rippa_method(r_best, lambda_best, condition_numbers=False)
+        assert output_1 is None
+
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array, pd.DataFrame])
     def test_leave_one_out_crossvalidation_01(self, array_type):
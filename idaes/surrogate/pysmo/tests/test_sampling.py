@@ -254,6 +254,46 @@ class TestSamplingMethods:
                 input_array, generated_sample_points
             )
     @pytest.mark.unit
+    def test_nearest_neighbour_indices_01(self):
+        rng = np.random.RandomState(3)
+        x_data = rng.rand(500, 3)
+        generated_sample_points = rng.rand(40, 3)
+        indices = SamplingMethods.nearest_neighbour_indices(x_data, generated_sample_points)
+        distances = np.sqrt(((generated_sample_points[:, None, :] - x_data[None, :, :]) ** 2).sum(axis=2))
+        np.testing.assert_array_equal(indices, np.argmin(distances, axis=1))
+
+    @pytest.mark.unit
+    def test_nearest_neighbour_indices_02(self):
+        x_data = np.array([[0.0], [1.0], [2.0], [3.0], [10.0]])
+        generated_sample_points = np.array([[0.1], [0.2], [0.3], [9.0], [0.4]])
+        indices = SamplingMethods.nearest_neighbour_indices(x_data, generated_sample_points)
+        np.testing.assert_array_equal(indices, [0, 0, 0, 4, 0])
+        indices = SamplingMethods.nearest_neighbour_indices(x_data, generated_sample_points, unique=True)
+        np.testing.assert_array_equal(indices, [0, 1, 2, 4, 3])
+
+    @pytest.mark.unit
+    def test_nearest_neighbour_indices_03(self):
+        rng = np.random.RandomState(5)
+        x_data = rng.rand(30, 2)
+        generated_sample_points = np.full((30, 2), 0.5)
+        indices = SamplingMethods.nearest_neighbour_indices(x_data, generated_sample_points, unique=True)
+        np.testing.assert_array_equal(np.sort(indices), np.arange(30))
+        distances = np.sqrt(((x_data - 0.5) ** 2).sum(axis=1))
+        np.testing.assert_array_equal(indices, np.argsort(distances))
+        with pytest.raises(ValueError):
+            SamplingMethods.nearest_neighbour_indices(x_data, np.full((31, 2), 0.5), unique=True)
+
+    @pytest.mark.unit
+    def test_points_selection_unique(self):
+        input_array = np.array(self.test_data_3d)
+        generated_sample_points = np.array([[-0.5, 10], [-0.4, 10], [10, 100]])
+        sampling_methods = self._create_sampling(input_array, generated_sample_points)
+        equivalent_points = sampling_methods.points_selection(
+            input_array, generated_sample_points, unique=True
+        )
+        np.testing.assert_array_equal(equivalent_points, input_array[[0, 1, -1], :])
+
+    @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array])
     def test_sample_point_selection_01(self, array_type):
         input_array = array_type(self.test_data_3d)
@@ -2096,6 +2136,55 @@ class TestCVTSampling:
         )
         np.testing.assert_array_equal(expected_output, output)
 
+    @pytest.mark.unit
+    def test_cluster_sums(self):
+        current_random_points = np.array(
+            [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6], [0.7, 0.8]]
+        )
+        current_centres = np.array([2, 0, 2, 2])
+        sums, sizes = CVTSampling.cluster_sums(current_random_points, current_centres, 4)
+        np.testing.assert_allclose(sums, np.array([[0.3, 0.4], [0, 0], [1.3, 1.6], [0, 0]]))
+        np.testing.assert_array_equal(sizes, np.array([1, 0, 3, 0]))
+
+    @pytest.mark.unit
+    def test_update_centres(self):
+        initial_centres = np.array([[0, 0], [1, 1], [0.5, 0.5]])
+        sums = np.array([[0.3, 0.6], [0, 0], [1.2, 1.2]])
+        sizes = np.array([3, 0, 2])
+        expected_output = np.array([[0.05, 0.1], [0.75, 0.75], [0.55, 0.55]])
+        output = CVTSampling.update_centres(initial_centres, sums, sizes, 1)
+        np.testing.assert_allclose(expected_output, output)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("chunk_size", [0, -5, 1.5])
+    def test__init__chunk_size(self, chunk_size):
+        with pytest.raises(Exception):
+            CVTClass = CVTSampling(
+                self.input_array_list, number_of_samples=5, sampling_type="creation", chunk_size=chunk_size
+            )
+
+    @pytest.mark.unit
+    def test_sample_points_seed(self):
+        samples = []
+        for chunk_size in [None, None, 777]:
+            CVTClass = CVTSampling(
+                self.input_array_list, number_of_samples=6, tolerance=1e-5, sampling_type="creation",
+                seed=42, chunk_size=chunk_size
+            )
+            samples.append(CVTClass.sample_points())
+        np.testing.assert_array_equal(samples[0], samples[1])
+        np.testing.assert_allclose(samples[0], samples[2])
+
+
+    @pytest.mark.unit
+    def test_sample_points_unique_selection(self):
+        input_array = np.array([[i, (i + 1) ** 2] for i in [0, 0.1, 0.2, 0.3, 5, 10]])
+        CVTClass = CVTSampling(
+            input_array, number_of_samples=5, tolerance=1e-5, sampling_type="selection",
+            seed=0, unique_selection=True
+        )
+        unique_sample_points = CVTClass.sample_points()
+        assert unique_sample_points.shape == (5, 2)
 
     @pytest.mark.unit
     @pytest.mark.parametrize("array_type", [np.array])   
@@ -1128,6 +1128,54 @@ class TestAlamoSurrogate():
                 2*sin(inputs["x1"][i]**2) - 3*cos(inputs["x2"][i]**3) -
                 4*log(inputs["x1"][i]**4) + 5*exp(inputs["x2"][i]**5))
 
+    @pytest.mark.unit
+    def test_evaluate_surrogate_chunked(self, alm_surr3):
+        x = [0.2, 0.4, 0.6, 0.8, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0]
+
+        inputs = np.array([np.tile(x, len(x)), np.repeat(x, len(x))])
+        inputs = pd.DataFrame(inputs.transpose(), columns=["x1", "x2"])
+        expected = alm_surr3.evaluate_surrogate(inputs)
+
+        out = alm_surr3.evaluate_surrogate(inputs, chunksize=7)
+        pd.testing.assert_frame_equal(out, expected)
+
+        chunks = [inputs.iloc[i:i+30] for i in range(0, inputs.shape[0], 30)]
+        out = list(alm_surr3.evaluate_surrogate(iter(chunks)))
+        assert len(out) == 4
+        for o, c in zip(out, chunks):
+            assert list(o.index) == list(c.index)
+        pd.testing.assert_frame_equal(pd.concat(out), expected)
+
+    @pytest.mark.unit
+    def test_evaluate_surrogate_constant(self):
+        alm_surr = AlamoSurrogate(
+            {"z1": " z1 == 3.5", "z2": " z2 == 2*x1"}, ["x1"], ["z1", "z2"])
+        inputs = pd.DataFrame({"x1": [1, 2, 3]})
+
+        out = alm_surr.evaluate_surrogate(inputs)
+        assert list(out["z1"]) == [3.5, 3.5, 3.5]
+        assert list(out["z2"]) == [2, 4, 6]
+
+    @pytest.mark.unit
+    def test_evaluate_surrogate_domain_error(self, alm_surr3):
+        inputs = pd.DataFrame({"x1": [1.0, 0.0, 2.0], "x2": [1.0, 1.0, 1.0]},
+                              index=[5, 6, 7])
+
+        with pytest.raises(ValueError, match="input row 6"):
+            alm_surr3.evaluate_surrogate(inputs)
+
+    @pytest.mark.unit
+    def test_evaluate_surrogate_nonfinite_inputs(self, alm_surr3):
+        inputs = pd.DataFrame(
+            {"x1": [1.0, np.nan, 2.0, 1.0], "x2": [1.0, 1.0, 1.0, np.inf]},
+            index=[5, 6, 7, 8])
+
+        out = alm_surr3.evaluate_surrogate(inputs)
+        assert np.isnan(out["z1"][6])
+        assert not np.isfinite(out["z1"][8])
+        expected = alm_surr3.evaluate_surrogate(inputs.loc[[5, 7]])
+        pd.testing.assert_frame_equal(out.loc[[5, 7]], expected)
+
     @pytest.mark.unit
     def test_populate_block_funcs(self, alm_surr3):
         blk = SurrogateBlock(concrete=True)